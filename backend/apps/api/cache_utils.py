@@ -3,17 +3,564 @@
 """
 from django.core.cache import cache
 from django.conf import settings
+from django.db import connections
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 import hashlib
 import json
 import logging
+import math
+import random
+import secrets
+import re
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+
+def get_redis_client():
+    """Сирий Redis-клієнт або None, якщо backend кешу не django_redis"""
+    try:
+        from django_redis import get_redis_connection
+        return get_redis_connection("default")
+    except (ImportError, NotImplementedError):
+        return None
+
+
+def payload_size(value):
+    """Приблизний розмір значення в кеші, байти (лише для метрик)"""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode('utf-8'))
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+class CacheMetrics:
+    """
+    Hits/misses, час заповнення та розмір значень по сімействах кешу.
+
+    Лічильники накопичуються в пам'яті процесу і раз на FLUSH_INTERVAL
+    зливаються в Redis-хеш (агрегат усіх воркерів). Якщо встановлено
+    prometheus_client, ті самі дані одразу потрапляють у /metrics.
+    """
+
+    FIELDS = ('hits', 'misses', 'stale', 'fills', 'fill_ms', 'bytes')
+    KEY_PREFIX = 'cachestats'
+
+    _pending = defaultdict(dict)
+    _totals = defaultdict(dict)
+    _lock = threading.Lock()
+    _last_flush = time.monotonic()
+    _prometheus = None
+
+    @staticmethod
+    def _settings():
+        return getattr(settings, 'CACHE_METRICS_SETTINGS', {})
+
+    @classmethod
+    def record_hit(cls, family, count=1, stale=False):
+        if cls._record(family, hits=count, stale=count if stale else 0):
+            prometheus = cls._get_prometheus()
+            if prometheus:
+                prometheus['requests'].labels(family, 'stale' if stale else 'hit').inc(count)
+
+    @classmethod
+    def record_miss(cls, family, count=1):
+        if cls._record(family, misses=count):
+            prometheus = cls._get_prometheus()
+            if prometheus:
+                prometheus['requests'].labels(family, 'miss').inc(count)
+
+    @classmethod
+    def record_fill(cls, family, seconds, nbytes=0):
+        if cls._record(family, fills=1, fill_ms=seconds * 1000, bytes=nbytes):
+            prometheus = cls._get_prometheus()
+            if prometheus:
+                prometheus['fill_seconds'].labels(family).observe(seconds)
+                if nbytes:
+                    prometheus['payload_bytes'].labels(family).observe(nbytes)
+
+    @classmethod
+    def _record(cls, family, **deltas):
+        metrics_settings = cls._settings()
+        if not metrics_settings.get('ENABLED', True):
+            return False
+        with cls._lock:
+            counters = cls._pending[family]
+            for field, delta in deltas.items():
+                if delta:
+                    counters[field] = counters.get(field, 0) + delta
+            flush_due = time.monotonic() - cls._last_flush >= metrics_settings.get('FLUSH_INTERVAL', 10)
+        if flush_due:
+            cls.flush()
+        return True
+
+    @classmethod
+    def _get_prometheus(cls):
+        if cls._prometheus is None:
+            try:
+                from prometheus_client import Counter, Histogram
+                cls._prometheus = {
+                    'requests': Counter(
+                        'ugc_cache_requests_total', 'Cache lookups by family and result',
+                        ['family', 'result'],
+                    ),
+                    'fill_seconds': Histogram(
+                        'ugc_cache_fill_seconds', 'Time to compute a missing cache value',
+                        ['family'],
+                    ),
+                    'payload_bytes': Histogram(
+                        'ugc_cache_payload_bytes', 'Size of values written to the cache',
+                        ['family'], buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576),
+                    ),
+                }
+            except (ImportError, ValueError):
+                cls._prometheus = {}
+        return cls._prometheus
+
+    @classmethod
+    def flush(cls):
+        """Зливає накопичені лічильники процесу в Redis (або локальний агрегат)"""
+        with cls._lock:
+            pending, cls._pending = cls._pending, defaultdict(dict)
+            cls._last_flush = time.monotonic()
+        if not pending:
+            return
+
+        redis_client = get_redis_client()
+        if redis_client is not None:
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                for family, counters in pending.items():
+                    key = cache.make_key(f"{cls.KEY_PREFIX}:{family}")
+                    for field, value in counters.items():
+                        if isinstance(value, float):
+                            pipe.hincrbyfloat(key, field, value)
+                        else:
+                            pipe.hincrby(key, field, value)
+                pipe.execute()
+                return
+            except Exception as e:
+                logger.warning(f"Could not flush cache metrics: {e}")
+
+        with cls._lock:
+            for family, counters in pending.items():
+                totals = cls._totals[family]
+                for field, value in counters.items():
+                    totals[field] = totals.get(field, 0) + value
+
+    @classmethod
+    def snapshot(cls, families=None):
+        """Агреговані метрики: {family: {hits, misses, hit_rate, avg_fill_ms, ...}}"""
+        cls.flush()
+        redis_client = get_redis_client()
+        raw = {}
+        if redis_client is not None:
+            names = list(families or CacheRegistry.names())
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                for family in names:
+                    pipe.hgetall(cache.make_key(f"{cls.KEY_PREFIX}:{family}"))
+                for family, values in zip(names, pipe.execute()):
+                    if not values:
+                        continue
+                    raw[family] = {
+                        (field.decode() if isinstance(field, bytes) else field): float(value)
+                        for field, value in values.items()
+                    }
+            except Exception as e:
+                logger.warning(f"Could not read cache metrics: {e}")
+        else:
+            with cls._lock:
+                raw = {family: dict(counters) for family, counters in cls._totals.items()}
+
+        snapshot = {}
+        for family, counters in raw.items():
+            if families and family not in families:
+                continue
+            values = {field: counters.get(field, 0) for field in cls.FIELDS}
+            lookups = values['hits'] + values['misses']
+            snapshot[family] = {
+                'hits': int(values['hits']),
+                'misses': int(values['misses']),
+                'stale_hits': int(values['stale']),
+                'hit_rate': round(values['hits'] / lookups * 100, 2) if lookups else None,
+                'fills': int(values['fills']),
+                'avg_fill_ms': round(values['fill_ms'] / values['fills'], 2) if values['fills'] else None,
+                'total_bytes': int(values['bytes']),
+                'avg_bytes': int(values['bytes'] / values['fills']) if values['fills'] else None,
+            }
+        return snapshot
+
+    @classmethod
+    def reset(cls, families=None):
+        """Обнуляє метрики (наприклад, після зміни TTL)"""
+        names = list(families or CacheRegistry.names())
+        with cls._lock:
+            for family in names:
+                cls._pending.pop(family, None)
+                cls._totals.pop(family, None)
+        cache.delete_many([f"{cls.KEY_PREFIX}:{family}" for family in names])
+
+
+class CacheFamily:
+    """Сімейство ключів кешу: шаблон ключа, TTL та власник"""
+
+    def __init__(self, name, key_template, timeout=None, owner='', description=''):
+        self.name = name
+        self.key_template = key_template
+        self.timeout = timeout
+        self.owner = owner
+        self.description = description
+        self.prefix = key_template.split('{', 1)[0]
+
+    @property
+    def pattern(self):
+        """Шаблон для SCAN (None для сімейств без ключів у спільному кеші)"""
+        if not self.key_template:
+            return None
+        return re.sub(r'\{[^}]*\}', '*', self.key_template)
+
+    def key(self, **kwargs):
+        return self.key_template.format(**kwargs)
+
+    def get_or_set(self, loader, timeout=None, **key_kwargs):
+        """Значення з кешу або loader() із записом; рахує метрики сімейства"""
+        key = self.key(**key_kwargs)
+        value = cache.get(key)
+        if value is not None:
+            CacheMetrics.record_hit(self.name)
+            return value
+
+        CacheMetrics.record_miss(self.name)
+        started = time.monotonic()
+        value = loader()
+        CacheMetrics.record_fill(self.name, time.monotonic() - started, payload_size(value))
+        cache.set(key, value, timeout or self.timeout)
+        return value
+
+    def as_dict(self):
+        return {
+            'key_template': self.key_template,
+            'timeout': self.timeout,
+            'owner': self.owner,
+            'description': self.description,
+        }
+
+
+class CacheRegistry:
+    """Декларативний реєстр сімейств кешу проєкту"""
+
+    _families = OrderedDict()
+
+    @classmethod
+    def register(cls, name, key_template, timeout=None, owner='', description=''):
+        family = CacheFamily(name, key_template, timeout, owner, description)
+        cls._families[name] = family
+        return family
+
+    @classmethod
+    def get(cls, name):
+        return cls._families[name]
+
+    @classmethod
+    def all(cls):
+        return list(cls._families.values())
+
+    @classmethod
+    def names(cls):
+        return list(cls._families) + ['other']
+
+    @classmethod
+    def family_for_key(cls, key):
+        """Сімейство з найдовшим префіксом, що збігається з ключем"""
+        best = None
+        for family in cls._families.values():
+            if family.prefix and key.startswith(family.prefix):
+                if best is None or len(family.prefix) > len(best.prefix):
+                    best = family
+        return best.name if best else 'other'
+
+
+class RawCache:
+    """Зберігання сирих байтів в обхід JSON-серіалізатора кешу"""
+
+    @staticmethod
+    def get(key):
+        client = get_redis_client()
+        if client is None:
+            return cache.get(key)
+        try:
+            return client.get(cache.make_key(key))
+        except Exception as e:
+            logger.warning(f"Raw cache get failed for {key}: {e}")
+            return None
+
+    @staticmethod
+    def set(key, value, timeout):
+        client = get_redis_client()
+        if client is None:
+            cache.set(key, value, timeout)
+            return
+        try:
+            client.set(cache.make_key(key), value, ex=timeout)
+        except Exception as e:
+            logger.warning(f"Raw cache set failed for {key}: {e}")
+
+
+class CacheGenerations:
+    """
+    Лічильники поколінь для інвалідації без пошуку ключів.
+
+    Номер покоління вбудовується в ключі кешу, тож інвалідація
+    простору імен - це один INCR: старі ключі просто стають недосяжними
+    і зникають за TTL.
+    """
+
+    PREFIX = 'gen'
+    TIMESTAMP_PREFIX = 'gents'
+
+    @classmethod
+    def _key(cls, namespace):
+        return f"{cls.PREFIX}:{namespace}"
+
+    @classmethod
+    def _timestamp_key(cls, namespace):
+        return f"{cls.TIMESTAMP_PREFIX}:{namespace}"
+
+    @staticmethod
+    def _initial():
+        # Початкове значення залежить від часу, щоб після витіснення
+        # лічильника з Redis не повернулися старі номери поколінь
+        return int(time.time() * 1000)
+
+    @classmethod
+    def get_many_with_timestamps(cls, namespaces):
+        """
+        Покоління та час останньої зміни для кількох просторів імен
+        за один запит до кешу: {namespace: (generation, timestamp)}
+        """
+        keys = {}
+        for namespace in namespaces:
+            keys[cls._key(namespace)] = namespace
+            keys[cls._timestamp_key(namespace)] = namespace
+        found = cache.get_many(list(keys))
+        hits = sum(1 for namespace in namespaces if cls._key(namespace) in found)
+        if hits:
+            CacheMetrics.record_hit('generations', hits)
+        if len(namespaces) > hits:
+            CacheMetrics.record_miss('generations', len(namespaces) - hits)
+
+        state = {}
+        for namespace in namespaces:
+            value = found.get(cls._key(namespace))
+            changed_at = found.get(cls._timestamp_key(namespace))
+            if value is None:
+                value = cls._initial()
+                if cache.add(cls._key(namespace), value, None):
+                    cache.set(cls._timestamp_key(namespace), time.time(), None)
+                else:
+                    value = cache.get(cls._key(namespace), value)
+            if changed_at is None:
+                changed_at = time.time()
+                cache.add(cls._timestamp_key(namespace), changed_at, None)
+            state[namespace] = (value, changed_at)
+        return state
+
+    @classmethod
+    def get_many(cls, namespaces):
+        """Поточні покоління для кількох просторів імен за один запит"""
+        return {
+            namespace: generation
+            for namespace, (generation, _) in cls.get_many_with_timestamps(namespaces).items()
+        }
+
+    @classmethod
+    def get(cls, namespace):
+        return cls.get_many([namespace])[namespace]
+
+    @classmethod
+    def bump(cls, namespace):
+        """Інвалідує простір імен збільшенням покоління"""
+        key = cls._key(namespace)
+        try:
+            value = cache.incr(key)
+        except ValueError:
+            value = cls._initial()
+            cache.set(key, value, None)
+        cache.set(cls._timestamp_key(namespace), time.time(), None)
+        return value
+
+    @staticmethod
+    def model_namespace(model):
+        return f"model:{model._meta.label_lower}"
+
+class LocalCache:
+    """
+    Per-worker LRU кеш (L1) перед Redis для декодованих об'єктів.
+
+    Обмежений кількістю записів. Версії (наприклад, покоління перекладів)
+    запитуються з Redis не частіше одного разу на poll_interval секунд,
+    тому всі воркери gunicorn відкидають застарілі записи майже одночасно,
+    а гарячі звернення взагалі не ходять у Redis.
+    """
+
+    def __init__(self, max_entries=32, poll_interval=1.0, family=None):
+        self.max_entries = max_entries
+        self.poll_interval = poll_interval
+        self.family = family
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key, loader):
+        """Значення з L1 або з loader(); loader викликається поза локом"""
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is not sentinel:
+            if self.family:
+                CacheMetrics.record_hit(self.family)
+            return value
+        
+        started = time.monotonic()
+        value = loader()
+        self.set(key, value)
+        if self.family:
+            CacheMetrics.record_miss(self.family)
+            CacheMetrics.record_fill(self.family, time.monotonic() - started)
+        return value
+
+    def poll(self, version_key, resolver):
+        """Версія з локальною пам'яттю на poll_interval секунд"""
+        now = time.monotonic()
+        with self._lock:
+            cached = self._versions.get(version_key)
+        if cached is not None and now - cached[1] < self.poll_interval:
+            return cached[0]
+        version = resolver()
+        with self._lock:
+            self._versions[version_key] = (version, now)
+        return version
+
+    def forget_version(self, version_key):
+        """Змусити наступний poll звернутися до Redis (локальна зміна)"""
+        with self._lock:
+            self._versions.pop(version_key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+class CacheLock:
+    """
+    Короткий розподілений лок у кеші. Значення - випадковий токен власника,
+    знімає лок лише власник (compare-and-delete): перерахунок, що триває
+    довше за timeout, не видаляє лок, який уже взяв інший воркер
+    """
+
+    # GET == токен -> DEL атомарно
+    RELEASE_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+    _release_script = None
+
+    @staticmethod
+    def acquire(lock_key, timeout):
+        """Токен власника або None, якщо лок зайнятий"""
+        # Ціле число django_redis зберігає як є, без серіалізації - у Lua
+        # його можна порівняти з рядком аргументу
+        token = secrets.randbits(62)
+        return token if cache.add(lock_key, token, timeout) else None
+
+    @classmethod
+    def release(cls, lock_key, token):
+        redis_client = get_redis_client()
+        if redis_client is None:
+            # Не-Redis backend: неатомарно, але чужий лок не знімається
+            if cache.get(lock_key) == token:
+                cache.delete(lock_key)
+            return
+        try:
+            if cls._release_script is None or cls._release_script.registered_client is not redis_client:
+                cls._release_script = redis_client.register_script(cls.RELEASE_LUA)
+            cls._release_script(keys=[cache.make_key(lock_key)], args=[token])
+        except Exception as e:
+            logger.warning(f"Could not release cache lock {lock_key}: {e}")
+
+
 class SmartCache:
-    """Розумна система кешування з тегами"""
+    """
+    Розумна система кешування з тегами.
+
+    Значення зберігаються в конверті з м'яким терміном дії: після нього
+    ключ ще живе STALE_TTL секунд, і поки один воркер (під коротким
+    локом) перераховує значення у фоні, решта отримують застарілу копію.
+    Холодний промах теж перераховує лише один воркер, інші чекають.
+    """
     
     DEFAULT_TIMEOUT = 60 * 60  # 1 година
+    DEFAULT_STALE_TTL = 60 * 5  # скільки віддавати застаріле значення
+    LOCK_TIMEOUT = 30  # максимальний час перерахунку під локом
+    LOCK_WAIT = 5  # скільки чекати на чужий перерахунок при холодному промаху
+    LOCK_POLL_INTERVAL = 0.05
+    ENVELOPE_MARKER = '__swr__'
+    
+    MAX_TAG_FANOUT = 10000  # поріг попередження про розмір тегу
+    
+    # SADD + продовження TTL тегу до найдовшого TTL його ключів
+    ADD_TAG_LUA = """
+redis.call('SADD', KEYS[1], ARGV[1])
+local ttl = redis.call('TTL', KEYS[1])
+if ttl >= 0 and ttl < tonumber(ARGV[2]) or ttl == -1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[2])
+end
+return redis.call('SCARD', KEYS[1])
+"""
+    
+    # SMEMBERS + UNLINK пачками по 1000 (обмеження unpack) для кожного тегу
+    INVALIDATE_TAGS_LUA = """
+local counts = {}
+for i, tag in ipairs(KEYS) do
+    local members = redis.call('SMEMBERS', tag)
+    for j = 1, #members, 1000 do
+        redis.call('UNLINK', unpack(members, j, math.min(j + 999, #members)))
+    end
+    redis.call('UNLINK', tag)
+    counts[i] = #members
+end
+return counts
+"""
+    
+    _executor = None
+    _executor_lock = threading.Lock()
+    _add_tag_script = None
+    _invalidate_tags_script = None
     
     @staticmethod
     def generate_key(prefix, *args, **kwargs):
@@ -26,48 +573,220 @@ class SmartCache:
         return ':'.join(key_parts)
     
     @classmethod
-    def get_or_set_with_tags(cls, key, callable_func, timeout=None, tags=None):
-        """Кешування з тегами для групового очищення"""
+    def get_or_set_with_tags(cls, key, callable_func, timeout=None, tags=None,
+                             stale_ttl=None, early_expiration_beta=0):
+        """
+        Кешування з тегами для групового очищення.
+
+        stale_ttl - скільки секунд після timeout віддавати застаріле значення
+        (0 вимикає stale-while-revalidate). early_expiration_beta > 0 вмикає
+        імовірнісне дострокове оновлення (XFetch): чим дорожчий перерахунок
+        і ближче кінець терміну, тим імовірніше ключ оновиться заздалегідь.
+        """
         timeout = timeout or cls.DEFAULT_TIMEOUT
+        stale_ttl = cls.DEFAULT_STALE_TTL if stale_ttl is None else stale_ttl
         
-        # Спробуємо отримати з кешу
-        data = cache.get(key)
-        if data is not None:
-            logger.debug(f"Cache HIT for key: {key}")
-            return data
+        family = CacheRegistry.family_for_key(key)
+        envelope = cache.get(key)
+        if envelope is not None and not cls._is_envelope(envelope):
+            # Значення, записане без конверта - вважаємо свіжим
+            CacheMetrics.record_hit(family)
+            return envelope
         
-        # Якщо немає в кеші, викликаємо функцію
+        if envelope is not None:
+            if not cls._is_stale(envelope, early_expiration_beta):
+                logger.debug(f"Cache HIT for key: {key}")
+                CacheMetrics.record_hit(family)
+                return envelope['value']
+            
+            # Застаріле значення: оновлює лише власник локу, у фоні
+            CacheMetrics.record_hit(family, stale=True)
+            token = cls._acquire_lock(key)
+            if token is not None:
+                logger.debug(f"Cache STALE for key: {key}, refreshing in background")
+                cls._submit_refresh(key, token, callable_func, timeout, tags, stale_ttl)
+            return envelope['value']
+        
+        # Холодний промах: рахує лише один воркер
         logger.debug(f"Cache MISS for key: {key}")
+        CacheMetrics.record_miss(family)
+        token = cls._acquire_lock(key)
+        if token is not None:
+            try:
+                return cls._compute_and_store(key, callable_func, timeout, tags, stale_ttl)
+            finally:
+                cls._release_lock(key, token)
+        
+        envelope = cls._wait_for_value(key)
+        if envelope is not None:
+            return envelope['value']
+        
+        logger.warning(f"Timed out waiting for cache fill: {key}")
+        return cls._compute_and_store(key, callable_func, timeout, tags, stale_ttl)
+    
+    @classmethod
+    def _compute_and_store(cls, key, callable_func, timeout, tags, stale_ttl):
+        started = time.monotonic()
         data = callable_func()
+        delta = time.monotonic() - started
         
-        # Зберігаємо в кеш
-        cache.set(key, data, timeout)
+        envelope = {
+            cls.ENVELOPE_MARKER: 1,
+            'value': data,
+            'soft_expires': time.time() + timeout,
+            'delta': delta,
+        }
+        cache.set(key, envelope, timeout + stale_ttl)
+        CacheMetrics.record_fill(CacheRegistry.family_for_key(key), delta, payload_size(data))
         
         # Додаємо теги для групового очищення
         if tags:
+            cls._add_tags(key, tags, timeout + stale_ttl)
+        
+        return data
+    
+    @classmethod
+    def _add_tags(cls, key, tags, timeout):
+        """
+        Реєструє ключ у тегах. У Redis теги - нативні множини: SADD та
+        продовження TTL виконуються атомарно (Lua) одним pipeline на всі теги
+        """
+        redis_client = get_redis_client()
+        if redis_client is None:
+            # Не-Redis backend: список замість set, щоб значення серіалізувалось
             for tag in tags:
                 tag_key = f"tag:{tag}"
-                tagged_keys = cache.get(tag_key, set())
-                tagged_keys.add(key)
+                tagged_keys = cache.get(tag_key, [])
+                if key not in tagged_keys:
+                    tagged_keys.append(key)
                 cache.set(tag_key, tagged_keys, timeout)
+            return
         
-        return data
+        try:
+            script = cls._get_script(redis_client, '_add_tag_script', cls.ADD_TAG_LUA)
+            pipe = redis_client.pipeline(transaction=False)
+            for tag in tags:
+                script(keys=[cache.make_key(f"tag:{tag}")], args=[cache.make_key(key), timeout], client=pipe)
+            sizes = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not tag cache key {key}: {e}")
+            return
+        
+        for tag, size in zip(tags, sizes):
+            if size > cls.MAX_TAG_FANOUT:
+                logger.warning(f"Cache tag '{tag}' fan-out {size} exceeds {cls.MAX_TAG_FANOUT} keys")
     
     @classmethod
-    def invalidate_by_tags(cls, tags):
-        """Очищення кешу за тегами"""
+    def get_tag_fanout(cls, tags):
+        """Кількість ключів у кожному тезі: {tag: count}"""
+        redis_client = get_redis_client()
+        if redis_client is None:
+            return {tag: len(cache.get(f"tag:{tag}", [])) for tag in tags}
+        pipe = redis_client.pipeline(transaction=False)
         for tag in tags:
-            tag_key = f"tag:{tag}"
-            tagged_keys = cache.get(tag_key, set())
-            
-            if tagged_keys:
-                # Очищаємо всі ключі з цим тегом
-                cache.delete_many(tagged_keys)
-                # Очищаємо сам тег
-                cache.delete(tag_key)
-                logger.info(f"Cleared {len(tagged_keys)} cache keys for tag: {tag}")
-
-def cache_result(timeout=None, key_prefix=None, tags=None):
+            pipe.scard(cache.make_key(f"tag:{tag}"))
+        return dict(zip(tags, pipe.execute()))
+    
+    @staticmethod
+    def _get_script(redis_client, attr, source):
+        script = getattr(SmartCache, attr, None)
+        if script is None or script.registered_client is not redis_client:
+            script = redis_client.register_script(source)
+            setattr(SmartCache, attr, script)
+        return script
+    
+    @classmethod
+    def _is_envelope(cls, value):
+        return isinstance(value, dict) and cls.ENVELOPE_MARKER in value
+    
+    @staticmethod
+    def _is_stale(envelope, beta):
+        expires = envelope['soft_expires']
+        if beta and envelope.get('delta'):
+            # XFetch: expires - delta * beta * ln(rand) зсуває термін наперед
+            expires += envelope['delta'] * beta * math.log(1.0 - random.random())
+        return time.time() >= expires
+    
+    @classmethod
+    def _acquire_lock(cls, key):
+        """Токен власника локу перерахунку або None"""
+        return CacheLock.acquire(f"lock:{key}", cls.LOCK_TIMEOUT)
+    
+    @classmethod
+    def _release_lock(cls, key, token):
+        CacheLock.release(f"lock:{key}", token)
+    
+    @classmethod
+    def _wait_for_value(cls, key):
+        deadline = time.monotonic() + cls.LOCK_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(cls.LOCK_POLL_INTERVAL)
+            envelope = cache.get(key)
+            if envelope is not None and cls._is_envelope(envelope):
+                return envelope
+            if cache.get(f"lock:{key}") is None:
+                break
+        return None
+    
+    @classmethod
+    def _get_executor(cls):
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='smartcache')
+        return cls._executor
+    
+    @classmethod
+    def _submit_refresh(cls, key, token, callable_func, timeout, tags, stale_ttl):
+        def refresh():
+            try:
+                cls._compute_and_store(key, callable_func, timeout, tags, stale_ttl)
+            except Exception as e:
+                logger.error(f"Background cache refresh failed for {key}: {e}")
+            finally:
+                cls._release_lock(key, token)
+                connections.close_all()
+        
+        try:
+            cls._get_executor().submit(refresh)
+        except RuntimeError:
+            # Executor зупинено (завершення процесу) - оновимо синхронно
+            refresh()
+    
+    @classmethod
+    def invalidate_by_tags(cls, tags):
+        """
+        Очищення кешу за тегами. У Redis - один round trip: Lua-скрипт
+        читає SMEMBERS кожного тегу і робить UNLINK ключів пачками.
+        Повертає {tag: кількість очищених ключів}
+        """
+        tags = list(tags)
+        redis_client = get_redis_client()
+        if redis_client is None:
+            cleared = {}
+            for tag in tags:
+                tag_key = f"tag:{tag}"
+                tagged_keys = cache.get(tag_key, [])
+                if tagged_keys:
+                    cache.delete_many(list(tagged_keys))
+                    cache.delete(tag_key)
+                cleared[tag] = len(tagged_keys)
+            return cleared
+        
+        try:
+            script = cls._get_script(redis_client, '_invalidate_tags_script', cls.INVALIDATE_TAGS_LUA)
+            counts = script(keys=[cache.make_key(f"tag:{tag}") for tag in tags])
+        except Exception as e:
+            logger.error(f"Error invalidating cache tags {tags}: {e}")
+            return {}
+        
+        cleared = dict(zip(tags, counts))
+        for tag, count in cleared.items():
+            if count:
+                logger.info(f"Cleared {count} cache keys for tag: {tag}")
+        return cleared
+
+def cache_result(timeout=None, key_prefix=None, tags=None, stale_ttl=None, early_expiration_beta=0):
     """Декоратор для кешування результатів функцій"""
     def decorator(func):
         @wraps(func)
@@ -81,7 +800,9 @@ def cache_result(timeout=None, key_prefix=None, tags=None):
                 cache_key,
                 lambda: func(*args, **kwargs),
                 timeout,
-                tags
+                tags,
+                stale_ttl=stale_ttl,
+                early_expiration_beta=early_expiration_beta
             )
         return wrapper
     return decorator
@@ -89,17 +810,11 @@ def cache_result(timeout=None, key_prefix=None, tags=None):
 class CacheManager:
     """Менеджер для управління кешем"""
     
+    SCAN_BATCH_SIZE = 500
+    
     @staticmethod
     def get_cache_stats():
         """Статистика кешу"""
-        known_prefixes = [
-            'translations:',
-            'queryset:',
-            'api:',
-            'stats:',
-            'featured:'
-        ]
-        
         stats = {
             'active_keys': 0,
             'memory_usage': 0,
@@ -109,16 +824,21 @@ class CacheManager:
         
         # Спробуємо отримати статистику з Redis
         try:
-            if hasattr(cache, '_cache') and hasattr(cache._cache, '_cache'):
-                redis_client = cache._cache._cache
-                info = redis_client.info('memory')
-                stats['memory_usage'] = info.get('used_memory_human', 'N/A')
+            redis_client = get_redis_client()
+            if redis_client is not None:
+                try:
+                    info = redis_client.info('memory')
+                    stats['memory_usage'] = info.get('used_memory_human', 'N/A')
+                except Exception as e:
+                    logger.warning(f"Could not get Redis memory info: {e}")
                 
-                # Підрахунок ключів за prefixes
-                for prefix in known_prefixes:
-                    keys = redis_client.keys(f"{prefix}*")
-                    stats['prefixes'][prefix] = len(keys)
-                    stats['active_keys'] += len(keys)
+                # Підрахунок ключів сімейств реєстру (інкрементальний SCAN, не KEYS)
+                for family in CacheRegistry.all():
+                    if family.pattern is None:
+                        continue
+                    count = CacheManager.count_by_pattern(family.pattern)
+                    stats['prefixes'][family.name] = count
+                    stats['active_keys'] += count
                     
         except Exception as e:
             logger.warning(f"Could not get cache stats: {e}")
@@ -126,19 +846,120 @@ class CacheManager:
         return stats
     
     @staticmethod
-    def clear_cache_by_pattern(pattern):
-        """Очищення кешу за шаблоном"""
+    def iter_keys(pattern, raw=False):
+        """
+        Інкрементально обходить ключі за шаблоном через SCAN.
+        Шаблон - логічний ключ кешу (з KEY_PREFIX/версією), якщо raw=False
+        """
+        redis_client = get_redis_client()
+        if redis_client is None:
+            return
+        match = pattern if raw else cache.make_key(pattern)
+        yield from redis_client.scan_iter(match=match, count=CacheManager.SCAN_BATCH_SIZE)
+    
+    @staticmethod
+    def count_by_pattern(pattern, raw=False):
+        """Кількість ключів за шаблоном без блокування Redis"""
+        return sum(1 for _ in CacheManager.iter_keys(pattern, raw=raw))
+    
+    @staticmethod
+    def clear_cache_by_pattern(pattern, raw=False):
+        """
+        Очищення кешу за шаблоном: SCAN + UNLINK пакетами в pipeline.
+        Для інвалідації сімейств моделей краще CacheGenerations.bump
+        """
+        redis_client = get_redis_client()
+        if redis_client is None:
+            return 0
+        
+        deleted = 0
+        batch = []
         try:
-            if hasattr(cache, '_cache') and hasattr(cache._cache, '_cache'):
-                redis_client = cache._cache._cache
-                keys = redis_client.keys(pattern)
-                if keys:
-                    redis_client.delete(*keys)
-                    logger.info(f"Cleared {len(keys)} cache keys with pattern: {pattern}")
-                return len(keys)
+            for key in CacheManager.iter_keys(pattern, raw=raw):
+                batch.append(key)
+                if len(batch) >= CacheManager.SCAN_BATCH_SIZE:
+                    deleted += CacheManager._unlink(redis_client, batch)
+                    batch = []
+            if batch:
+                deleted += CacheManager._unlink(redis_client, batch)
+            
+            if deleted:
+                logger.info(f"Cleared {deleted} cache keys with pattern: {pattern}")
+            return deleted
         except Exception as e:
             logger.error(f"Error clearing cache: {e}")
-            return 0
+            return deleted
+    
+    @staticmethod
+    def _unlink(redis_client, keys):
+        """UNLINK (неблокуюче звільнення пам'яті) пакетом через pipeline"""
+        pipe = redis_client.pipeline(transaction=False)
+        for start in range(0, len(keys), 100):
+            pipe.unlink(*keys[start:start + 100])
+        return sum(pipe.execute())
+
+# ============================= РЕЄСТР СІМЕЙСТВ КЕШУ =============================
+
+_translation_cache_settings = getattr(settings, 'TRANSLATION_CACHE_SETTINGS', {})
+
+CacheRegistry.register(
+    'response', 'resp:{basename}:{language}:{digest}',
+    timeout=getattr(settings, 'RESPONSE_CACHE_SETTINGS', {}).get('TIMEOUT', 60 * 15),
+    owner='apps.api.mixins.ResponseCacheMixin',
+    description='Відрендерені відповіді ViewSet-ів',
+)
+CacheRegistry.register(
+    # Власний префікс: під 'resp:*' ключі рахувались би і чистились разом з 'response'
+    'featured', 'featured:{language}:{digest}', timeout=60 * 30,
+    owner='apps.api.viewsets.UnifiedContentViewSet.featured',
+    description='Featured контент /content/featured/',
+)
+CacheRegistry.register(
+    'translations', 'translation_bundle:{language}:{version}', timeout=60 * 60 * 6,
+    owner='apps.api.translation_bundles.TranslationBundles',
+    description='Секції скомпільованих бандлів перекладів /translations/<lang>/',
+)
+CacheRegistry.register(
+    'translation_changelog', 'translation_changelog:{language}',
+    timeout=_translation_cache_settings.get('CHANGELOG_TIMEOUT', 60 * 60 * 24 * 7),
+    owner='apps.api.translation_bundles.TranslationChangeLog',
+    description='Журнал змін ключів перекладів для ?since=',
+)
+CacheRegistry.register(
+    'static_translations', 'static_translations_{language}:{version}',
+    timeout=_translation_cache_settings.get('STATIC_TIMEOUT', 60 * 30),
+    owner='apps.api.utils.translations.TranslationUtils',
+    description='Статичні переклади з JSON файлів (версія перекладів у ключі)',
+)
+CacheRegistry.register(
+    'dynamic_translations', 'dynamic_translations_{language}',
+    timeout=_translation_cache_settings.get('DYNAMIC_TIMEOUT', 60 * 15),
+    owner='apps.api.translations.DynamicTranslationsAPIView',
+    description='Переклади з полів моделей',
+)
+CacheRegistry.register(
+    'dynamic_translation_slices', 'dynamic_translations:{model}:{language}:{generation}',
+    timeout=_translation_cache_settings.get('DYNAMIC_TIMEOUT', 60 * 15),
+    owner='apps.api.dynamic_translations.DynamicTranslationLoader',
+    description='Переклади полів окремої моделі (покоління моделі в ключі)',
+)
+CacheRegistry.register(
+    'translations_l1', '', owner='apps.api.utils.translations.translation_l1',
+    description="Декодовані бандли в пам'яті воркера (без ключів у Redis)",
+)
+CacheRegistry.register(
+    'generations', 'gen:{namespace}', owner='apps.api.cache_utils.CacheGenerations',
+    description='Лічильники поколінь для інвалідації',
+)
+CacheRegistry.register(
+    'locks', 'lock:{key}', timeout=SmartCache.LOCK_TIMEOUT,
+    owner='apps.api.cache_utils.SmartCache',
+    description='Локи перерахунку (single-flight)',
+)
+CacheRegistry.register(
+    'tags', 'tag:{tag}', owner='apps.api.cache_utils.SmartCache',
+    description='Множини ключів для інвалідації за тегами',
+)
 
 # Готові декоратори для використання
 cache_1_hour = cache_result(timeout=60*60, tags=['api'])
@@ -0,0 +1,178 @@
+# backend/apps/api/cache_warmup.py
+"""
+Паралельний прогрів кешу публічних endpoints для всіх мов
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.handlers.base import BaseHandler
+from django.db import connections
+from django.test import RequestFactory
+from django.urls import NoReverseMatch, reverse
+from rest_framework.request import Request
+import logging
+import math
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """
+    Обходить роутер API і рендерить кешовані endpoints через повний стек
+    middleware, тож ключі кешу збігаються з ключами реальних запитів.
+
+    Цілі: сторінки списків, деталі за lookup-значеннями, GET-дії ViewSet-ів
+    та endpoints перекладів - для кожної мови з settings.LANGUAGES.
+    """
+
+    def __init__(self, languages=None, max_workers=None, max_details=None,
+                 max_pages=None, host=None, secure=None):
+        warmup_settings = getattr(settings, 'CACHE_WARMUP_SETTINGS', {})
+        self.languages = languages or [code for code, _ in settings.LANGUAGES]
+        self.max_workers = max_workers or warmup_settings.get('MAX_WORKERS', 4)
+        self.max_details = max_details if max_details is not None else warmup_settings.get('MAX_DETAILS', 100)
+        self.max_pages = max_pages or warmup_settings.get('MAX_PAGES', 1)
+        self.host = host or warmup_settings.get('HOST') or self._default_host()
+        self.secure = secure if secure is not None else warmup_settings.get('SECURE', False)
+        self._factory = RequestFactory()
+        self._handler = None
+
+    @staticmethod
+    def _default_host():
+        for host in settings.ALLOWED_HOSTS:
+            if host and host != '*' and not host.startswith('.'):
+                return host
+        return 'localhost'
+
+    def get_paths(self):
+        """Шляхи для прогріву (без мови)"""
+        from .mixins import BaseResponseCacheMixin
+        from .urls import router
+
+        paths = []
+        for prefix, viewset, basename in router.registry:
+            if not (issubclass(viewset, BaseResponseCacheMixin) and viewset.cache_response):
+                continue
+            try:
+                paths.extend(self._get_viewset_paths(viewset, basename))
+            except Exception as e:
+                logger.warning(f"Failed to enumerate warm-up paths for {prefix}: {str(e)}")
+        return paths
+
+    def get_translation_paths(self, lang):
+        paths = []
+        for name in ('translations', 'translations-all'):
+            try:
+                paths.append(reverse(name, kwargs={'lang': lang}))
+            except NoReverseMatch:
+                continue
+        return paths
+
+    def get_targets(self):
+        """Пари (path, language) для прогріву"""
+        paths = self.get_paths()
+        targets = []
+        for lang in self.languages:
+            targets.extend((path, lang) for path in paths)
+            targets.extend((path, lang) for path in self.get_translation_paths(lang))
+        return targets
+
+    def _get_queryset(self, viewset, action):
+        """
+        queryset, який бачить запит до дії: get_queryset() екземпляра
+        ViewSet-а (фільтри активності, терміну дії), а не атрибут класу
+        """
+        if not hasattr(viewset, 'get_queryset'):
+            return None
+        request = self._factory.get('/', HTTP_HOST=self.host, secure=self.secure)
+        request.user = AnonymousUser()
+        view = viewset(action=action, format_kwarg=None, args=(), kwargs={})
+        view.request = Request(request)
+        return view.get_queryset()
+
+    def _get_viewset_paths(self, viewset, basename):
+        paths = []
+
+        if hasattr(viewset, 'list'):
+            list_path = reverse(f'{basename}-list')
+            paths.append(list_path)
+            for page in range(2, self._count_pages(viewset, self._get_queryset(viewset, 'list')) + 1):
+                paths.append(f'{list_path}?page={page}')
+
+        detail_actions = []
+        for extra_action in viewset.get_extra_actions():
+            if 'get' not in extra_action.mapping:
+                continue
+            if extra_action.detail:
+                detail_actions.append(extra_action.url_name)
+            else:
+                paths.append(reverse(f'{basename}-{extra_action.url_name}'))
+
+        queryset = None
+        if hasattr(viewset, 'retrieve') or detail_actions:
+            queryset = self._get_queryset(viewset, 'retrieve')
+        if queryset is not None:
+            lookup_field = viewset.lookup_field
+            lookup_kwarg = viewset.lookup_url_kwarg or lookup_field
+            lookups = queryset.order_by().values_list(lookup_field, flat=True)[:self.max_details]
+            for value in lookups:
+                kwargs = {lookup_kwarg: value}
+                if hasattr(viewset, 'retrieve'):
+                    paths.append(reverse(f'{basename}-detail', kwargs=kwargs))
+                for url_name in detail_actions:
+                    paths.append(reverse(f'{basename}-{url_name}', kwargs=kwargs))
+        return paths
+
+    def _count_pages(self, viewset, queryset):
+        if queryset is None or self.max_pages <= 1:
+            return 1
+        pagination_class = getattr(viewset, 'pagination_class', None)
+        page_size = getattr(pagination_class, 'page_size', None) if pagination_class else None
+        if not page_size:
+            return 1
+        return min(self.max_pages, max(1, math.ceil(queryset.count() / page_size)))
+
+    def warm(self, targets=None):
+        """
+        Рендерить цілі паралельно. Повертає список словників
+        {path, language, status, duration_ms, cache, error}
+        """
+        if targets is None:
+            targets = self.get_targets()
+        if self._handler is None:
+            self._handler = BaseHandler()
+            self._handler.load_middleware()
+
+        results = []
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='cache-warmup') as executor:
+            futures = [executor.submit(self._warm_one, path, lang) for path, lang in targets]
+            for future in as_completed(futures):
+                results.append(future.result())
+
+        warmed = sum(1 for result in results if result['status'] == 200)
+        logger.info(f"Cache warm-up finished: {warmed}/{len(results)} endpoints")
+        return results
+
+    def _warm_one(self, path, lang):
+        started = time.perf_counter()
+        result = {'path': path, 'language': lang, 'status': None, 'cache': '', 'error': None}
+        try:
+            request = self._factory.get(
+                path,
+                HTTP_HOST=self.host,
+                HTTP_ACCEPT_LANGUAGE=lang,
+                secure=self.secure,
+            )
+            response = self._handler.get_response(request)
+            result['status'] = response.status_code
+            result['cache'] = response.get('X-Cache', '')
+            response.close()
+        except Exception as e:
+            result['error'] = str(e)
+            logger.warning(f"Failed to warm cache for {path} [{lang}]: {str(e)}")
+        finally:
+            # Потоки пулу не проходять request_finished, закриваємо з'єднання самі
+            connections.close_all()
+        result['duration_ms'] = round((time.perf_counter() - started) * 1000, 1)
+        return result
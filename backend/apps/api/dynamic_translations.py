@@ -0,0 +1,130 @@
+# backend/apps/api/dynamic_translations.py
+"""
+Динамічні переклади з полів моделей, зареєстрованих у modeltranslation
+"""
+from django.conf import settings
+from django.core.cache import cache
+import logging
+import time
+
+from .cache_utils import CacheGenerations, CacheMetrics, CacheRegistry, payload_size
+from .plain_text import get_shadow_config, get_shadow_fields, shadow_field_name, strip_html
+
+logger = logging.getLogger(__name__)
+
+# Моделі з приватними даними (звернення користувачів): їхні поля ніколи не
+# віддаються як переклади, незалежно від DYNAMIC_EXCLUDE_MODELS у settings
+PRIVATE_MODELS = frozenset({
+    'contacts.contactinquiry',
+    'jobs.jobapplication',
+    'partners.partnerinquiry',
+})
+
+
+class DynamicTranslationLoader:
+    """
+    Обходить реєстр modeltranslation і для кожної моделі робить один
+    values_list запит лише по pk та колонках потрібної мови.
+
+    Ключі мають вигляд '<model_name>.<pk>.<field>'. Зріз кожної моделі
+    кешується окремо з поколінням моделі в ключі, тож зміна однієї
+    моделі перебудовує лише її зріз.
+    """
+
+    @staticmethod
+    def get_models():
+        """Моделі з перекладними полями, крім PRIVATE_MODELS та DYNAMIC_EXCLUDE_MODELS"""
+        from modeltranslation.translator import translator
+
+        exclude = PRIVATE_MODELS.union(
+            getattr(settings, 'TRANSLATION_CACHE_SETTINGS', {}).get('DYNAMIC_EXCLUDE_MODELS', [])
+        )
+        models = [
+            model for model in translator.get_registered_models(abstract=False)
+            if model._meta.label_lower not in exclude
+        ]
+        return sorted(models, key=lambda model: model._meta.label_lower)
+
+    @staticmethod
+    def load_model(model, lang):
+        """Переклади однієї моделі для мови: {key: text}"""
+        from modeltranslation.translator import translator
+        from modeltranslation.utils import build_localized_fieldname
+
+        # Тіньові колонки самі не є ключами; поле з тіньовою колонкою
+        # читається з неї - HTML уже прибрано при збереженні
+        shadow_fields = set(get_shadow_fields(model))
+        plain_fields = set(get_shadow_config(model)['fields']) if shadow_fields else set()
+        fields = sorted(
+            field for field in translator.get_options_for_model(model).get_field_names()
+            if field not in shadow_fields
+        )
+        columns = [
+            build_localized_fieldname(shadow_field_name(field) if field in plain_fields else field, lang)
+            for field in fields
+        ]
+
+        queryset = model._default_manager.order_by()
+        if any(field.name == 'is_active' for field in model._meta.concrete_fields):
+            queryset = queryset.filter(is_active=True)
+
+        prefix = model._meta.model_name
+        translations = {}
+        for pk, *values in queryset.values_list('pk', *columns).iterator():
+            for field, value in zip(fields, values):
+                text = value if field in plain_fields else strip_html(value)
+                if text:
+                    translations[f'{prefix}.{pk}.{field}'] = text
+        return translations
+
+    @classmethod
+    def load(cls, lang):
+        """Всі динамічні переклади мови: зрізи з кешу, відсутні - з БД"""
+        family = CacheRegistry.get('dynamic_translation_slices')
+        models = cls.get_models()
+        generations = CacheGenerations.get_many(
+            [CacheGenerations.model_namespace(model) for model in models]
+        )
+        keys = {
+            model: family.key(
+                model=model._meta.label_lower,
+                language=lang,
+                generation=generations[CacheGenerations.model_namespace(model)],
+            )
+            for model in models
+        }
+
+        try:
+            cached = cache.get_many(list(keys.values()))
+        except Exception as e:
+            logger.warning(f"Dynamic translation slices unavailable: {e}")
+            cached = {}
+
+        if cached:
+            CacheMetrics.record_hit(family.name, count=len(cached))
+
+        translations = {}
+        for model, key in keys.items():
+            if key in cached:
+                translations.update(cached[key])
+                continue
+
+            CacheMetrics.record_miss(family.name)
+            started = time.perf_counter()
+            try:
+                model_translations = cls.load_model(model, lang)
+            except Exception as e:
+                # Помилка однієї моделі не ламає решту і не кешується
+                logger.warning(f"Error loading {model._meta.label_lower} translations: {e}")
+                continue
+
+            try:
+                cache.set(key, model_translations, family.timeout)
+            except Exception as e:
+                logger.warning(f"Failed to cache translation slice {key}: {e}")
+            CacheMetrics.record_fill(
+                family.name, time.perf_counter() - started, payload_size(model_translations)
+            )
+            translations.update(model_translations)
+
+        return translations
@@ -0,0 +1,81 @@
+# backend/apps/api/featured_content.py
+"""
+Спільний контент сторінок (рекомендовані послуги та проекти, команда,
+етапи роботи): один запит на тип контенту на весь запит API, незалежно
+від кількості серіалізованих сторінок
+"""
+from apps.content.models import TeamMember, Certificate, ProductionPhoto
+from apps.partners.models import WorkStage
+from apps.projects.models import Project
+from apps.services.models import Service
+
+FEATURED_PROJECTS_COUNT = 3
+
+
+class FeaturedContentLoader:
+    """
+    Завантажує рекомендований контент один раз і віддає зрізи.
+    prime() заздалегідь задає найбільшу потрібну кількість, тоді всі
+    сторінки обслуговуються одним запитом; без нього більша кількість
+    за попередню просто довантажує список
+    """
+
+    def __init__(self):
+        self._services = None
+        self._services_limit = 0
+        self._projects = None
+        self._company_content = None
+        self._work_stages = None
+
+    def prime(self, homepages):
+        limits = [
+            homepage.featured_services_count or 0
+            for homepage in homepages
+            if homepage.show_featured_services
+        ]
+        if limits:
+            self._load_services(max(limits))
+
+    def _load_services(self, limit):
+        if self._services is not None and (
+            limit <= self._services_limit or len(self._services) < self._services_limit
+        ):
+            # Уже завантажено достатньо (або всі наявні)
+            return
+        self._services = list(
+            Service.objects.filter(is_active=True, is_featured=True).order_by('order', 'name')[:limit]
+        )
+        self._services_limit = limit
+
+    def services(self, limit):
+        self._load_services(limit)
+        return self._services[:limit]
+
+    def projects(self):
+        if self._projects is None:
+            self._projects = list(
+                Project.objects.filter(is_active=True, is_featured=True)
+                .select_related('category')
+                .order_by('-project_date', 'title')[:FEATURED_PROJECTS_COUNT]
+            )
+        return self._projects
+
+    def company_content(self):
+        """
+        Активні члени команди, сертифікати та фото виробництва для сторінки
+        "Про нас" (AboutPage не має власних зв'язків - контент спільний):
+        по одному запиту на тип на весь список сторінок
+        """
+        if self._company_content is None:
+            self._company_content = {
+                'team_members': list(TeamMember.objects.filter(is_active=True).select_related('homepage')),
+                'certificates': list(Certificate.objects.filter(is_active=True).select_related('homepage')),
+                'production_photos': list(ProductionPhoto.objects.filter(is_active=True).select_related('homepage')),
+            }
+        return self._company_content
+
+    def work_stages(self):
+        """Етапи роботи для PartnershipInfo (спільні, без зв'язку з записом)"""
+        if self._work_stages is None:
+            self._work_stages = list(WorkStage.objects.all())
+        return self._work_stages
@@ -0,0 +1,134 @@
+# backend/apps/api/invalidation.py
+"""
+Черга інвалідації кешу: збирає змінені моделі протягом транзакції,
+дедуплікує їх та інвалідує один раз після commit
+"""
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connections, transaction
+import logging
+import threading
+import time
+
+from .cache_utils import CacheGenerations
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidationQueue:
+    """
+    Сигнали лише позначають модель "брудною" (без звернень до кешу).
+    Після commit покоління кожної моделі збільшуються один раз, а
+    відкладена перебудова (прогрів перекладів) віддається фоновому
+    executor-у з дебаунсом: повторні запити в межах REBUILD_DELAY
+    зливаються в одну перебудову.
+
+    Відкат транзакції не скидає позначки - вони будуть застосовані з
+    наступним commit (зайва інвалідація безпечна, пропущена - ні).
+    """
+
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self):
+        self._local = threading.local()
+        self._scheduled_rebuilds = set()
+        self._rebuild_lock = threading.Lock()
+
+    def _get_pending(self):
+        pending = getattr(self._local, 'pending', None)
+        if pending is None:
+            pending = self._local.pending = {'models': {}, 'translations': set()}
+        return pending
+
+    def mark_model(self, model, using=None):
+        """Позначає модель зміненою: її покоління буде збільшено після commit"""
+        pending = self._get_pending()
+        pending['models'][model._meta.label_lower] = model
+        self._schedule(using)
+
+    def mark_translations(self, languages=None, using=None):
+        """Позначає переклади мов (за замовчуванням - всіх) зміненими"""
+        if languages is None:
+            languages = [code for code, _ in settings.LANGUAGES]
+        self._get_pending()['translations'].update(languages)
+        self._schedule(using)
+
+    def _schedule(self, using):
+        # Кожен колбек після commit забирає всю чергу, решта стають no-op
+        transaction.on_commit(self.flush, using=using)
+
+    def flush(self):
+        """Застосовує накопичені інвалідації поточного потоку"""
+        pending = getattr(self._local, 'pending', None)
+        if not pending or not (pending['models'] or pending['translations']):
+            return
+        self._local.pending = None
+
+        for label, model in pending['models'].items():
+            try:
+                CacheGenerations.bump(CacheGenerations.model_namespace(model))
+            except Exception as e:
+                logger.error(f"Failed to bump cache generation for {label}: {e}")
+
+        if pending['translations']:
+            from .signals import invalidate_translations_cache
+
+            for lang in sorted(pending['translations']):
+                invalidate_translations_cache(lang)
+                self._submit_rebuild(('translations', lang), lambda lang=lang: self._rebuild_translations(lang))
+
+        logger.info(
+            f"Flushed cache invalidation: models={sorted(pending['models'])}, "
+            f"translations={sorted(pending['translations'])}"
+        )
+
+    @staticmethod
+    def _rebuild_translations(lang):
+        from .translation_bundles import TranslationBundles
+        from .utils.translations import TranslationUtils
+
+        TranslationUtils.get_bundle(lang)
+        TranslationBundles.get(lang)
+
+    @classmethod
+    def _get_executor(cls):
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cache-invalidation')
+        return cls._executor
+
+    def _submit_rebuild(self, key, func):
+        invalidation_settings = getattr(settings, 'CACHE_INVALIDATION_SETTINGS', {})
+        if not invalidation_settings.get('ASYNC_REBUILD', True):
+            return
+
+        with self._rebuild_lock:
+            if key in self._scheduled_rebuilds:
+                return
+            self._scheduled_rebuilds.add(key)
+
+        due = time.monotonic() + invalidation_settings.get('REBUILD_DELAY', 2.0)
+
+        def rebuild():
+            time.sleep(max(0, due - time.monotonic()))
+            # Зміни під час перебудови запланують наступну
+            with self._rebuild_lock:
+                self._scheduled_rebuilds.discard(key)
+            try:
+                func()
+            except Exception as e:
+                logger.warning(f"Background cache rebuild failed for {key}: {e}")
+            finally:
+                connections.close_all()
+
+        try:
+            self._get_executor().submit(rebuild)
+        except RuntimeError:
+            # Executor зупинено (завершення процесу) - перебудова відбудеться при запиті
+            with self._rebuild_lock:
+                self._scheduled_rebuilds.discard(key)
+
+
+invalidation_queue = InvalidationQueue()
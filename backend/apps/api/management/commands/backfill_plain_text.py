@@ -0,0 +1,75 @@
+# backend/apps/api/management/commands/backfill_plain_text.py
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.api.invalidation import invalidation_queue
+from apps.api.plain_text import PLAIN_TEXT_FIELDS, get_localized_pairs, update_plain_text
+
+
+class Command(BaseCommand):
+    help = 'Заповнює тіньові текстові колонки та анонси RichText полів (пакетами)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model',
+            action='append',
+            dest='models',
+            help='Модель app_label.model (можна вказати кілька разів, за замовчуванням: всі)'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Кількість записів в одному пакеті'
+        )
+
+    def handle(self, *args, **options):
+        labels = options['models'] or list(PLAIN_TEXT_FIELDS)
+        unknown = [label for label in labels if label.lower() not in PLAIN_TEXT_FIELDS]
+        if unknown:
+            raise CommandError(
+                f"Моделі без тіньових колонок: {', '.join(unknown)}. "
+                f"Доступні: {', '.join(PLAIN_TEXT_FIELDS)}"
+            )
+
+        total_updated = 0
+        for label in labels:
+            model = apps.get_model(label)
+            scanned, updated = self.backfill_model(model, options['batch_size'])
+            total_updated += updated
+            self.stdout.write(f'  {model._meta.label_lower}: перевірено {scanned}, оновлено {updated}')
+            if updated:
+                # bulk_update не надсилає сигналів - інвалідуємо кеші моделі самі
+                invalidation_queue.mark_model(model)
+
+        if total_updated:
+            invalidation_queue.mark_translations()
+
+        self.stdout.write(self.style.SUCCESS(f'Оновлено записів: {total_updated}'))
+
+    def backfill_model(self, model, batch_size):
+        pairs = get_localized_pairs(model)
+        sources = sorted({source for source, _, _ in pairs})
+        targets = sorted({target for _, target, _ in pairs})
+        manager = model._base_manager
+
+        scanned = updated = 0
+        last_pk = None
+        while True:
+            # Keyset по pk: кожен пакет - один запит лише по потрібних колонках
+            queryset = manager.order_by('pk').only('pk', *sources, *targets)
+            if last_pk is not None:
+                queryset = queryset.filter(pk__gt=last_pk)
+            batch = list(queryset[:batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            changed = [instance for instance in batch if update_plain_text(instance)]
+            if changed:
+                manager.bulk_update(changed, targets)
+
+            scanned += len(batch)
+            updated += len(changed)
+        return scanned, updated
@@ -0,0 +1,30 @@
+# backend/apps/api/management/commands/build_translation_bundles.py
+
+from django.core.management.base import BaseCommand
+
+from apps.api.translation_bundles import TranslationBundles
+
+
+class Command(BaseCommand):
+    help = 'Збирає бандли перекладів (статичні + динамічні + PO) для всіх мов'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help='Мова для збирання (можна вказати кілька разів, за замовчуванням: всі)'
+        )
+
+    def handle(self, *args, **options):
+        bundles = TranslationBundles.build_all(options['languages'])
+
+        for lang, bundle in bundles.items():
+            info = bundle.as_dict()
+            sizes = ', '.join(f'{encoding}: {size} B' for encoding, size in info['bytes'].items())
+            self.stdout.write(
+                f"  [{lang}] {info['version']} - {info['total_keys']} ключів, "
+                f"динамічних {info['dynamic_count']}, PO {info['po_count']} ({sizes})"
+            )
+
+        self.stdout.write(self.style.SUCCESS(f'Зібрано бандлів: {len(bundles)}'))
@@ -29,6 +29,7 @@ class Command(BaseCommand):
         try:
             # Спроба використання Redis напряму
             from django_redis import get_redis_connection
+            from apps.api.cache_utils import CacheManager
             con = get_redis_connection("default")
             
             # Отримуємо всі ключі з префіксом
@@ -38,11 +39,10 @@ class Command(BaseCommand):
             if options['pattern'] != '*':
                 pattern = f"{prefix}:{options['pattern']}" if prefix else options['pattern']
             
-            keys = con.keys(pattern)
+            # Інкрементальний SCAN + UNLINK пакетами замість блокуючого KEYS
+            deleted = CacheManager.clear_cache_by_pattern(pattern, raw=True)
             
-            if keys:
-                # Видаляємо ключі
-                deleted = con.delete(*keys)
+            if deleted:
                 self.stdout.write(
                     self.style.SUCCESS(f'Видалено {deleted} ключів кешу')
                 )
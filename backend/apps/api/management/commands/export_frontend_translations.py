@@ -3,7 +3,8 @@ import json
 import os
 from django.core.management.base import BaseCommand
 from django.conf import settings
-from apps.api.utils import TranslationUtils
+from apps.api.utils.translations import TranslationUtils
+from apps.api.translation_export import MANIFEST_NAME, TranslationExporter
 
 class Command(BaseCommand):
     help = 'Експорт перекладів для фронтенду'
@@ -27,17 +28,34 @@ class Command(BaseCommand):
             action='store_true',
             help='Мінімізувати JSON (без відступів)'
         )
+        parser.add_argument(
+            '--split-namespaces',
+            action='store_true',
+            help='Додатково зберегти окремий файл для кожного простору імен (<lang>/<namespace>.json)'
+        )
         parser.add_argument(
             '--validate',
             action='store_true',
             help='Перевірити переклади перед експортом'
         )
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help='Експортувати лише вказану мову (можна вказати кілька разів)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Перезаписати файли навіть якщо хеш джерела не змінився'
+        )
 
     def handle(self, *args, **options):
         output_dir = os.path.join(settings.BASE_DIR, options['output'])
         export_format = options['format']
         minify = options['minify']
         validate = options['validate']
+        split = options['split_namespaces']
         
         self.stdout.write('🚀 Початок експорту перекладів для фронтенду...')
         
@@ -63,129 +81,64 @@ class Command(BaseCommand):
             else:
                 self.stdout.write(self.style.SUCCESS('✅ Всі переклади на місці'))
         
-        # Створюємо директорію
-        os.makedirs(output_dir, exist_ok=True)
-        self.stdout.write(f'📁 Створено директорію: {output_dir}')
+        exporter = TranslationExporter(
+            output_dir,
+            languages=options['languages'],
+            export_format=export_format,
+            minify=minify,
+            split=split,
+            force=options['force'],
+        )
+        self.stdout.write(f'📁 Директорія експорту: {output_dir}')
         
-        # Експортуємо для кожної мови
-        exported_files = []
-        total_translations = 0
+        # Мови експортуються паралельно; незмінені пропускаються за хешем джерела
+        results = exporter.export()
         
-        for lang_code, lang_name in settings.LANGUAGES:
-            self.stdout.write(f'📤 Експорт {lang_name} ({lang_code})...')
-            
-            # Завантажуємо переклади
-            translations = TranslationUtils.load_translations(lang_code)
-            
-            if not translations:
+        total_translations = 0
+        for result in results:
+            lang_code = result['language']
+            entry = result.get('entry')
+            if result['status'] == 'error':
+                self.stdout.write(self.style.ERROR(f'❌ {lang_code}: {result["error"]}'))
+            elif result['status'] == 'empty':
                 self.stdout.write(f'⚠️ Немає перекладів для {lang_code}')
-                continue
-            
-            # Конвертуємо формат якщо потрібно
-            if export_format == 'nested':
-                translations = self.convert_to_nested(translations)
-            
-            # Зберігаємо файл
-            output_file = os.path.join(output_dir, f'{lang_code}.json')
-            
-            with open(output_file, 'w', encoding='utf-8') as f:
-                if minify:
-                    json.dump(translations, f, ensure_ascii=False, separators=(',', ':'))
-                else:
-                    json.dump(translations, f, ensure_ascii=False, indent=2)
-            
-            file_size = os.path.getsize(output_file)
-            translation_count = self.count_translations(translations)
-            
-            exported_files.append({
-                'file': output_file,
-                'language': lang_code,
-                'size': file_size,
-                'count': translation_count
-            })
-            
-            total_translations += translation_count
-            
-            self.stdout.write(f'✅ {lang_code}: {translation_count} перекладів, {file_size} байт')
+            elif result['status'] == 'unchanged':
+                self.stdout.write(f'⏭️ {lang_code}: без змін ({entry["file"]})')
+            else:
+                sizes = ', '.join(f'{encoding} {size}' for encoding, size in entry['bytes'].items())
+                self.stdout.write(
+                    f'✅ {lang_code}: {entry["count"]} перекладів → {entry["file"]} '
+                    f'({sizes} байт, {result["duration_ms"]} мс)'
+                )
+                if entry.get('namespaces'):
+                    self.stdout.write(f'🧩 {lang_code}: {len(entry["namespaces"])} просторів імен')
+            if entry:
+                total_translations += entry['count']
         
-        # Створюємо метафайл з інформацією про експорт
-        self.create_export_metadata(output_dir, exported_files, export_format, minify)
+        exported = [result for result in results if result['status'] == 'exported']
         
-        # Створюємо TypeScript типи (якщо є переклади)
-        if exported_files and export_format == 'flat':
-            self.generate_typescript_types(output_dir, exported_files[0])
+        # TypeScript типи - лише якщо каталог змінився
+        generate_typescript = getattr(settings, 'TRANSLATION_EXPORT_SETTINGS', {}).get('GENERATE_TYPESCRIPT', True)
+        if exported and export_format == 'flat' and generate_typescript:
+            self.generate_typescript_types(
+                output_dir, os.path.join(output_dir, f'{exported[0]["language"]}.json')
+            )
         
         # Фінальний звіт
         self.stdout.write(self.style.SUCCESS('🎉 Експорт завершено!'))
-        self.stdout.write(f'📊 Загалом: {len(exported_files)} мов, {total_translations} перекладів')
-        self.stdout.write(f'📂 Файли збережено в: {output_dir}')
+        self.stdout.write(
+            f'📊 Загалом: {len(results)} мов ({len(exported)} оновлено), {total_translations} перекладів'
+        )
+        self.stdout.write(f'📂 Файли збережено в: {output_dir} (маніфест: {MANIFEST_NAME})')
         
         # Показуємо приклад використання
         self.show_usage_examples(output_dir)
     
-    def convert_to_nested(self, flat_translations):
-        """Конвертує плоскі переклади в вкладені об'єкти"""
-        nested = {}
-        
-        for key, value in flat_translations.items():
-            keys = key.split('.')
-            current = nested
-            
-            for k in keys[:-1]:
-                if k not in current:
-                    current[k] = {}
-                current = current[k]
-            
-            current[keys[-1]] = value
-        
-        return nested
-    
-    def count_translations(self, translations):
-        """Рахує кількість перекладів (для вкладених об'єктів рекурсивно)"""
-        if isinstance(translations, dict):
-            count = 0
-            for value in translations.values():
-                if isinstance(value, dict):
-                    count += self.count_translations(value)
-                else:
-                    count += 1
-            return count
-        return 1
-    
-    def create_export_metadata(self, output_dir, exported_files, export_format, minify):
-        """Створює метафайл з інформацією про експорт"""
-        import datetime
-        
-        metadata = {
-            'export_date': datetime.datetime.now().isoformat(),
-            'format': export_format,
-            'minified': minify,
-            'files': [
-                {
-                    'language': f['language'],
-                    'filename': os.path.basename(f['file']),
-                    'size_bytes': f['size'],
-                    'translation_count': f['count']
-                }
-                for f in exported_files
-            ],
-            'total_files': len(exported_files),
-            'total_translations': sum(f['count'] for f in exported_files),
-            'django_version': getattr(settings, 'DJANGO_VERSION', 'unknown'),
-            'languages': dict(settings.LANGUAGES)
-        }
-        
-        metadata_file = os.path.join(output_dir, 'export-metadata.json')
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-        
-        self.stdout.write(f'📋 Метадані збережено: {metadata_file}')
-    
     def generate_typescript_types(self, output_dir, sample_file):
         """Генерує TypeScript типи для перекладів"""
         try:
             # Завантажуємо приклад перекладів для генерації типів
-            with open(sample_file['file'], 'r', encoding='utf-8') as f:
+            with open(sample_file, 'r', encoding='utf-8') as f:
                 translations = json.load(f)
             
             # Генеруємо типи
@@ -253,7 +206,9 @@ class Command(BaseCommand):
         self.stdout.write('📜 JavaScript/TypeScript:')
         self.stdout.write('''
 // Завантаження перекладів
-const response = await fetch('/translations/uk.json');
+// manifest.json -> хешовані файли можна кешувати як immutable
+const manifest = await (await fetch('/translations/manifest.json', { cache: 'no-cache' })).json();
+const response = await fetch(`/translations/${manifest.languages.uk.file}`);
 const translations = await response.json();
 
 // Використання
@@ -0,0 +1,43 @@
+# backend/apps/api/management/commands/reconcile_site_stats.py
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.api.site_stats import SITE_COUNTERS, reconcile
+
+
+class Command(BaseCommand):
+    help = (
+        'Перераховує лічильники статистики сайту та виправляє розходження '
+        '(масові update/bulk_create не надсилають сигналів). Запускати за розкладом, напр. щогодини'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--counter',
+            action='append',
+            dest='counters',
+            help='Лічильник (можна вказати кілька разів, за замовчуванням: всі)'
+        )
+
+    def handle(self, *args, **options):
+        names = options['counters'] or list(SITE_COUNTERS)
+        unknown = [name for name in names if name not in SITE_COUNTERS]
+        if unknown:
+            raise CommandError(
+                f"Невідомі лічильники: {', '.join(unknown)}. "
+                f"Доступні: {', '.join(SITE_COUNTERS)}"
+            )
+
+        stats, drift = reconcile({name: SITE_COUNTERS[name] for name in names})
+
+        for name in names:
+            value = getattr(stats, name)
+            if name in drift:
+                self.stdout.write(self.style.WARNING(f'  {name}: {drift[name][0]} -> {value}'))
+            else:
+                self.stdout.write(f'  {name}: {value}')
+
+        if drift:
+            self.stdout.write(self.style.WARNING(f'Виправлено розходжень: {len(drift)}'))
+        else:
+            self.stdout.write(self.style.SUCCESS('Розходжень немає'))
@@ -1,9 +1,10 @@
 # backend/apps/api/management/commands/setup_translations.py
 import os
-import json
 from django.core.management.base import BaseCommand
 from django.conf import settings
 
+from apps.api.utils.translation_store import TranslationStore
+
 class Command(BaseCommand):
     help = 'Початкове налаштування системи перекладів'
 
@@ -197,7 +198,7 @@ class Command(BaseCommand):
         static_dir = settings.BASE_DIR / 'static_translations'
         
         for lang, trans in translations.items():
-            file_path = static_dir / f'{lang}.json'
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(trans, f, ensure_ascii=False, indent=2)
+            store = TranslationStore(lang, directory=static_dir)
+            store.write(trans)
+            file_path = store.path
             self.stdout.write(f'📄 Створено: {file_path}')
\ No newline at end of file
@@ -1,9 +1,9 @@
 # backend/apps/api/management/commands/validate_translations.py
 from django.core.management.base import BaseCommand
 from django.conf import settings
+from apps.api.translation_validation import TranslationValidator
 from apps.api.utils.translations import TranslationUtils
 import json
-import re
 
 class Command(BaseCommand):
     help = 'Валідація перекладів на повноту та якість'
@@ -24,11 +24,30 @@ class Command(BaseCommand):
             type=str,
             help='Експорт звіту в JSON файл'
         )
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help='Перевірити лише вказану мову (можна вказати кілька разів)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Кількість процесів (за замовчуванням: кількість CPU, не більше кількості мов)'
+        )
+        parser.add_argument(
+            '--no-cache',
+            action='store_true',
+            help='Перевірити всі ключі, ігноруючи кеш результатів попередніх запусків'
+        )
 
     def handle(self, *args, **options):
         self.fix_mode = options['fix']
         self.detailed = options['detailed']
         self.export_file = options['export_report']
+        self.languages = options['languages']
+        self.workers = options['workers']
+        self.use_cache = not options['no_cache']
         
         self.stdout.write('🔍 Початок валідації перекладів...')
         
@@ -40,15 +59,12 @@ class Command(BaseCommand):
             'duplicate_values': {},
             'empty_translations': {},
             'placeholder_issues': {},
+            'timings': {},
             'summary': {}
         }
         
         # Виконуємо всі перевірки
-        self.check_missing_translations()
-        self.check_formatting_consistency()
-        self.check_duplicate_values()
-        self.check_empty_translations()
-        self.check_placeholder_consistency()
+        self.run_checks()
         
         # Генеруємо підсумок
         self.generate_summary()
@@ -64,13 +80,43 @@ class Command(BaseCommand):
         if self.fix_mode:
             self.auto_fix_issues()
 
-    def check_missing_translations(self):
-        """Перевіряє відсутні переклади між мовами"""
-        self.stdout.write('📝 Перевірка відсутніх перекладів...')
+    def run_checks(self):
+        """Всі перевірки одним проходом рушія валідації"""
+        validator = TranslationValidator(
+            languages=self.languages,
+            workers=self.workers,
+            use_cache=self.use_cache,
+        )
+        self.stdout.write(f'⚙️ Мов: {len(validator.languages)}, процесів: {validator.workers}')
         
-        missing = TranslationUtils.validate_translations()
-        self.report['missing_translations'] = missing
+        report = validator.run()
+        self.report.update(report)
         
+        self.report_missing_translations()
+        self.report_count(
+            'formatting_issues', '🎨 Перевірка форматування...',
+            'проблем з форматуванням', 'Форматування консистентне'
+        )
+        self.report_count(
+            'duplicate_values', '🔄 Перевірка дублікатів...',
+            'можливих дублікатів', 'Дублікатів не знайдено'
+        )
+        self.report_count(
+            'empty_translations', '🈳 Перевірка порожніх перекладів...',
+            'порожніх перекладів', 'Порожніх перекладів немає'
+        )
+        
+        self.stdout.write('🔗 Перевірка плейсхолдерів...')
+        if self.report['placeholder_issues']:
+            self.stdout.write(f"⚠️ Знайдено {len(self.report['placeholder_issues'])} проблем з плейсхолдерами")
+        else:
+            self.stdout.write('✅ Плейсхолдери консистентні')
+
+    def report_missing_translations(self):
+        """Виводить відсутні переклади між мовами"""
+        self.stdout.write('📝 Перевірка відсутніх перекладів...')
+        
+        missing = self.report['missing_translations']
         if missing:
             total_missing = sum(len(keys) for keys in missing.values())
             self.stdout.write(f'⚠️ Знайдено {total_missing} відсутніх перекладів')
@@ -85,204 +131,16 @@ class Command(BaseCommand):
         else:
             self.stdout.write('✅ Всі переклади присутні')
 
-    def check_formatting_consistency(self):
-        """Перевіряє консистентність форматування"""
-        self.stdout.write('🎨 Перевірка форматування...')
-        
-        issues = {}
-        
-        for lang_code, _ in settings.LANGUAGES:
-            translations = TranslationUtils.load_translations(lang_code)
-            lang_issues = []
-            
-            for key, value in translations.items():
-                # Перевірка HTML тегів
-                if '<' in value and '>' in value:
-                    if not self.is_valid_html_snippet(value):
-                        lang_issues.append({
-                            'key': key,
-                            'issue': 'invalid_html',
-                            'value': value
-                        })
-                
-                # Перевірка консистентності знаків пунктуації
-                if key.endswith('.title') or key.endswith('.heading'):
-                    if value.endswith('.'):
-                        lang_issues.append({
-                            'key': key,
-                            'issue': 'title_with_period',
-                            'value': value
-                        })
-                
-                # Перевірка пробілів на початку/кінці
-                if value.strip() != value:
-                    lang_issues.append({
-                        'key': key,
-                        'issue': 'whitespace_padding',
-                        'value': value
-                    })
-            
-            if lang_issues:
-                issues[lang_code] = lang_issues
-        
-        self.report['formatting_issues'] = issues
+    def report_count(self, section, title, found_label, ok_label):
+        """Виводить кількість проблем секції звіту {мова: проблеми}"""
+        self.stdout.write(title)
         
+        issues = self.report[section]
         if issues:
-            total_issues = sum(len(lang_issues) for lang_issues in issues.values())
-            self.stdout.write(f'⚠️ Знайдено {total_issues} проблем з форматуванням')
-        else:
-            self.stdout.write('✅ Форматування консистентне')
-
-    def check_duplicate_values(self):
-        """Перевіряє дублікати значень (можливі помилки копіювання)"""
-        self.stdout.write('🔄 Перевірка дублікатів...')
-        
-        duplicates = {}
-        
-        for lang_code, _ in settings.LANGUAGES:
-            translations = TranslationUtils.load_translations(lang_code)
-            value_to_keys = {}
-            
-            # Групуємо ключі за значеннями
-            for key, value in translations.items():
-                if value in value_to_keys:
-                    value_to_keys[value].append(key)
-                else:
-                    value_to_keys[value] = [key]
-            
-            # Знаходимо дублікати (виключаємо очевидні)
-            lang_duplicates = {}
-            for value, keys in value_to_keys.items():
-                if len(keys) > 1 and len(value) > 3:  # Ігноруємо короткі значення як "Так", "Ні"
-                    # Виключаємо схожі ключі (наприклад, button.save та form.save)
-                    if not self.are_related_keys(keys):
-                        lang_duplicates[value] = keys
-            
-            if lang_duplicates:
-                duplicates[lang_code] = lang_duplicates
-        
-        self.report['duplicate_values'] = duplicates
-        
-        if duplicates:
-            total_duplicates = sum(len(dups) for dups in duplicates.values())
-            self.stdout.write(f'⚠️ Знайдено {total_duplicates} можливих дублікатів')
+            total = sum(len(lang_issues) for lang_issues in issues.values())
+            self.stdout.write(f'⚠️ Знайдено {total} {found_label}')
         else:
-            self.stdout.write('✅ Дублікатів не знайдено')
-
-    def check_empty_translations(self):
-        """Перевіряє порожні переклади"""
-        self.stdout.write('🈳 Перевірка порожніх перекладів...')
-        
-        empty = {}
-        
-        for lang_code, _ in settings.LANGUAGES:
-            translations = TranslationUtils.load_translations(lang_code)
-            empty_keys = []
-            
-            for key, value in translations.items():
-                if not value or value.strip() == '':
-                    empty_keys.append(key)
-            
-            if empty_keys:
-                empty[lang_code] = empty_keys
-        
-        self.report['empty_translations'] = empty
-        
-        if empty:
-            total_empty = sum(len(keys) for keys in empty.values())
-            self.stdout.write(f'⚠️ Знайдено {total_empty} порожніх перекладів')
-        else:
-            self.stdout.write('✅ Порожніх перекладів немає')
-
-    def check_placeholder_consistency(self):
-        """Перевіряє консистентність плейсхолдерів між мовами"""
-        self.stdout.write('🔗 Перевірка плейсхолдерів...')
-        
-        placeholder_issues = {}
-        
-        # Отримуємо всі ключі
-        all_keys = set()
-        for lang_code, _ in settings.LANGUAGES:
-            translations = TranslationUtils.load_translations(lang_code)
-            all_keys.update(translations.keys())
-        
-        for key in all_keys:
-            lang_placeholders = {}
-            
-            # Збираємо плейсхолдери для кожної мови
-            for lang_code, _ in settings.LANGUAGES:
-                translations = TranslationUtils.load_translations(lang_code)
-                if key in translations:
-                    placeholders = self.extract_placeholders(translations[key])
-                    if placeholders:
-                        lang_placeholders[lang_code] = placeholders
-            
-            # Перевіряємо консистентність
-            if lang_placeholders:
-                placeholder_sets = list(lang_placeholders.values())
-                if len(set(tuple(sorted(ps)) for ps in placeholder_sets)) > 1:
-                    placeholder_issues[key] = lang_placeholders
-        
-        self.report['placeholder_issues'] = placeholder_issues
-        
-        if placeholder_issues:
-            self.stdout.write(f'⚠️ Знайдено {len(placeholder_issues)} проблем з плейсхолдерами')
-        else:
-            self.stdout.write('✅ Плейсхолдери консистентні')
-
-    def extract_placeholders(self, text):
-        """Витягує плейсхолдери з тексту"""
-        # Шукаємо різні типи плейсхолдерів
-        patterns = [
-            r'\{(\w+)\}',  # {name}
-            r'\{\{(\w+)\}\}',  # {{name}}
-            r'%\((\w+)\)s',  # %(name)s
-            r'%(\w+)%',  # %name%
-        ]
-        
-        placeholders = set()
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
-            placeholders.update(matches)
-        
-        return sorted(list(placeholders))
-
-    def is_valid_html_snippet(self, text):
-        """Перевіряє чи є HTML фрагмент валідним"""
-        try:
-            from html.parser import HTMLParser
-            
-            class ValidationParser(HTMLParser):
-                def __init__(self):
-                    super().__init__()
-                    self.errors = []
-                
-                def error(self, message):
-                    self.errors.append(message)
-            
-            parser = ValidationParser()
-            parser.feed(f"<div>{text}</div>")
-            return len(parser.errors) == 0
-        except:
-            return False
-
-    def are_related_keys(self, keys):
-        """Перевіряє чи є ключі пов'язаними (схожими за змістом)"""
-        # Простий алгоритм: якщо ключі мають спільні частини
-        if len(keys) < 2:
-            return True
-        
-        # Розбиваємо на частини
-        key_parts = [key.split('.') for key in keys]
-        
-        # Перевіряємо чи є спільні частини
-        for i, parts1 in enumerate(key_parts):
-            for j, parts2 in enumerate(key_parts[i+1:], i+1):
-                common_parts = set(parts1) & set(parts2)
-                if len(common_parts) >= 1:
-                    return True
-        
-        return False
+            self.stdout.write(f'✅ {ok_label}')
 
     def generate_summary(self):
         """Генерує підсумок валідації"""
@@ -335,6 +193,21 @@ class Command(BaseCommand):
             
             if summary['placeholder_issues_count']:
                 self.stdout.write(f"🔗 Проблеми плейсхолдерів: {summary['placeholder_issues_count']}")
+        
+        timings = self.report['timings']
+        checked = sum(lang['checked'] for lang in timings['languages'].values())
+        cached = sum(lang['cached'] for lang in timings['languages'].values())
+        self.stdout.write(
+            f"⏱️ Час: {timings['total_ms']} мс (мови {timings['languages_ms']} мс, "
+            f"міжмовні перевірки {timings['cross_language_ms']} мс), "
+            f"перевірено ключів: {checked}, з кешу: {cached}"
+        )
+        if self.detailed:
+            for lang, stats in timings['languages'].items():
+                self.stdout.write(
+                    f"  {lang}: {stats['total']} ключів, перевірено {stats['checked']}, "
+                    f"{stats['duration_ms']} мс (версія {stats['version']})"
+                )
 
     def export_report(self):
         """Експортує звіт у JSON файл"""
@@ -0,0 +1,92 @@
+# backend/apps/api/management/commands/warm_cache.py
+
+import logging
+from django.core.management.base import BaseCommand
+
+from apps.api.cache_warmup import CacheWarmer
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Прогріває кеш публічних API endpoints і перекладів для всіх мов'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--language',
+            action='append',
+            dest='languages',
+            help='Мова для прогріву (можна вказати кілька разів, за замовчуванням: всі)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Кількість паралельних потоків'
+        )
+        parser.add_argument(
+            '--max-details',
+            type=int,
+            help='Максимум детальних сторінок на ViewSet'
+        )
+        parser.add_argument(
+            '--max-pages',
+            type=int,
+            help='Максимум сторінок пагінації на список'
+        )
+        parser.add_argument(
+            '--host',
+            type=str,
+            help='Host, під яким клієнти звертаються до API (входить у ключ кешу)'
+        )
+        parser.add_argument(
+            '--secure',
+            action='store_true',
+            default=None,
+            help='Рендерити як HTTPS запити'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Лише показати endpoints без рендерингу'
+        )
+
+    def handle(self, *args, **options):
+        warmer = CacheWarmer(
+            languages=options['languages'],
+            max_workers=options['workers'],
+            max_details=options['max_details'],
+            max_pages=options['max_pages'],
+            host=options['host'],
+            secure=options['secure'],
+        )
+        targets = warmer.get_targets()
+        self.stdout.write(f'Endpoints для прогріву: {len(targets)} (host: {warmer.host})')
+
+        if options['dry_run']:
+            for path, lang in targets:
+                self.stdout.write(f'  [{lang}] {path}')
+            return
+
+        results = warmer.warm(targets)
+        results.sort(key=lambda result: (result['language'], result['path']))
+
+        for result in results:
+            line = (
+                f"  [{result['language']}] {result['path']} - "
+                f"{result['status'] or 'ERR'} {result['cache']} {result['duration_ms']} ms"
+            )
+            if result['status'] == 200:
+                self.stdout.write(line)
+            else:
+                self.stdout.write(self.style.WARNING(f"{line} {result['error'] or ''}".rstrip()))
+
+        warmed = [result for result in results if result['status'] == 200]
+        total_ms = sum(result['duration_ms'] for result in results)
+        slowest = max(results, key=lambda result: result['duration_ms'], default=None)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Прогріто {len(warmed)}/{len(results)} endpoints, сумарно {total_ms:.0f} ms'
+        ))
+        if slowest:
+            self.stdout.write(
+                f"Найповільніший: [{slowest['language']}] {slowest['path']} - {slowest['duration_ms']} ms"
+            )
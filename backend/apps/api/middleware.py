@@ -188,6 +188,9 @@ class SecurityHeadersMiddleware(MiddlewareMixin):
             # Для переводов добавляем кеширование
             if 'translations' in request.path and response.status_code == 200:
                 response['Cache-Control'] = 'public, max-age=1800'  # 30 минут
+            elif response.has_header('ETag') and response.status_code in (200, 304):
+                # Відповідь з валідатором: клієнт зберігає тіло і ревалідує через If-None-Match
+                response['Cache-Control'] = 'no-cache'
             elif request.path.startswith('/api/'):
                 response['Cache-Control'] = 'no-cache, no-store, must-revalidate'
                 response['Pragma'] = 'no-cache'
@@ -286,47 +289,22 @@ class CacheUtils:
     
     @staticmethod
     def clear_pattern(pattern):
-        """Очищает кеш по паттерну"""
-        try:
-            from django_redis import get_redis_connection
-            con = get_redis_connection("default")
-            keys = con.keys(pattern)
-            if keys:
-                con.delete(*keys)
-                return len(keys)
-            return 0
-        except Exception as e:
-            logger.error(f"Failed to clear cache pattern {pattern}: {str(e)}")
-            return 0
+        """Очищает кеш по паттерну (SCAN + UNLINK, без блокирующего KEYS)"""
+        from apps.api.cache_utils import CacheManager
+        return CacheManager.clear_cache_by_pattern(pattern)
     
     @staticmethod
     def warm_up_popular_caches():
-        """Разогревает популярные кеши"""
-        from django.test import RequestFactory
-        from apps.api.views import HomePageViewSet, ServiceViewSet, OfficeViewSet
-        
-        factory = RequestFactory()
-        warmed_caches = []
+        """Разогревает кешированные endpoint'ы для всех языков"""
+        from apps.api.cache_warmup import CacheWarmer
         
         try:
-            # Разогреваем основные endpoint'ы
-            viewsets = [
-                (HomePageViewSet, '/api/v1/homepage/'),
-                (ServiceViewSet, '/api/v1/services/'),
-                (OfficeViewSet, '/api/v1/offices/'),
+            results = CacheWarmer().warm()
+            warmed_caches = [
+                f"{result['path']} [{result['language']}]"
+                for result in results if result['status'] == 200
             ]
-            
-            for viewset_class, url in viewsets:
-                try:
-                    request = factory.get(url)
-                    viewset = viewset_class()
-                    viewset.setup(request)
-                    viewset.list(request)
-                    warmed_caches.append(url)
-                except Exception as e:
-                    logger.warning(f"Failed to warm cache for {url}: {str(e)}")
-            
-            logger.info(f"Warmed up caches: {warmed_caches}")
+            logger.info(f"Warmed up caches: {len(warmed_caches)}/{len(results)}")
             return warmed_caches
             
         except Exception as e:
@@ -334,28 +312,5 @@ class CacheUtils:
             return []
 
 
-# Сигналы для автоматической очистки кеша
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
-
-@receiver([post_save, post_delete])
-def invalidate_model_cache(sender, **kwargs):
-    """Автоматически очищает кеш при изменении моделей"""
-    try:
-        # Получаем настройки
-        cache_settings = getattr(settings, 'CACHE_INVALIDATION_SETTINGS', {})
-        if not cache_settings.get('ENABLE_AUTO_INVALIDATION'):
-            return
-            
-        # Проверяем, нужно ли очищать кеш для этой модели
-        model_name = f"{sender._meta.app_label}.{sender._meta.model_name}"
-        watched_models = cache_settings.get('MODELS_TO_WATCH', [])
-        
-        if model_name.lower() in [m.lower() for m in watched_models]:
-            # Очищаем соответствующие кеши
-            pattern = f"api_{sender._meta.model_name.lower()}_*"
-            cleared = CacheUtils.clear_pattern(pattern)
-            logger.info(f"Auto-invalidated {cleared} cache keys for {model_name}")
-            
-    except Exception as e:
-        logger.error(f"Auto cache invalidation failed: {str(e)}")
+# Автоматична інвалідація кешу при зміні моделей - apps/api/signals.py
+# (connect_invalidation_signals + черга apps/api/invalidation.py)
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SiteStatistics',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('total_services', models.IntegerField(default=0, verbose_name='Активні послуги')),
+                ('featured_services', models.IntegerField(default=0, verbose_name='Рекомендовані послуги')),
+                ('total_projects', models.IntegerField(default=0, verbose_name='Активні проєкти')),
+                ('featured_projects', models.IntegerField(default=0, verbose_name='Рекомендовані проєкти')),
+                ('active_jobs', models.IntegerField(default=0, verbose_name='Відкриті вакансії')),
+                ('offices', models.IntegerField(default=0, verbose_name='Офіси')),
+                ('team_members', models.IntegerField(default=0, verbose_name='Члени команди')),
+                ('project_categories', models.IntegerField(default=0, verbose_name='Категорії проєктів')),
+                ('certificates', models.IntegerField(default=0, verbose_name='Сертифікати')),
+                ('active_jobs_next_expiry', models.DateTimeField(blank=True, null=True, verbose_name='Найближче закінчення вакансії')),
+                ('reconciled_at', models.DateTimeField(blank=True, null=True, verbose_name='Звірено')),
+                ('updated_at', models.DateTimeField(blank=True, null=True, verbose_name='Оновлено')),
+            ],
+            options={
+                'verbose_name': 'Статистика сайту',
+                'verbose_name_plural': 'Статистика сайту',
+            },
+        ),
+    ]
@@ -0,0 +1,243 @@
+# backend/apps/api/mixins.py
+"""
+Mixin-и для ViewSets: кешування відрендерених відповідей, умовні GET та
+розріджені набори полів (?fields= / ?expand=)
+"""
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils import translation
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, urlencode
+import hashlib
+import json
+import logging
+import time
+
+from .cache_utils import CacheGenerations, CacheMetrics, CacheRegistry, RawCache
+from .sparse_fields import FieldSelection, SparseFieldsSerializerMixin, optimize_queryset
+
+logger = logging.getLogger(__name__)
+
+
+def make_etag(*parts):
+    """Слабкий ETag з довільних частин версії (без серіалізації тіла)"""
+    digest = hashlib.md5('|'.join(str(part) for part in parts).encode('utf-8')).hexdigest()
+    return f'W/"{digest}"'
+
+
+def not_modified_response(request, etag, last_modified=None):
+    """304 Not Modified, якщо If-None-Match/If-Modified-Since збігаються, інакше None"""
+    if request.method not in ('GET', 'HEAD'):
+        return None
+    response = get_conditional_response(
+        request,
+        etag=etag,
+        last_modified=int(last_modified) if last_modified else None,
+    )
+    if response is not None:
+        add_validator_headers(response, etag, last_modified)
+    return response
+
+
+def add_validator_headers(response, etag, last_modified=None):
+    """Додає ETag/Last-Modified та дозволяє клієнту ревалідувати відповідь"""
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, no_cache=True)
+    patch_vary_headers(response, ('Accept-Language',))
+    return response
+
+
+class BaseResponseCacheMixin:
+    """
+    Opt-in кеш готових байтів відповіді для ViewSet-ів.
+
+    Ключ будується з шляху, нормалізованого query string, активної мови
+    та поколінь моделей, від яких залежить відповідь. Зміна будь-якої з
+    цих моделей (post_save/post_delete) збільшує її покоління, тож uk та en
+    версії інвалідуються разом, але ніколи не змішуються.
+
+    Ті самі покоління дають слабкий ETag і Last-Modified, тому повторний
+    запит з If-None-Match/If-Modified-Since отримує 304 без звернення до БД.
+    """
+
+    cache_response = False
+    conditional_response = True
+    response_cache_timeout = None
+    # Сімейство в CacheRegistry, під яким рахуються метрики
+    response_cache_family = 'response'
+    # Моделі, від яких залежить відповідь (за замовчуванням - модель queryset)
+    response_cache_models = ()
+
+    @classmethod
+    def get_response_cache_models(cls):
+        models = list(cls.response_cache_models)
+        queryset = getattr(cls, 'queryset', None)
+        if queryset is not None and queryset.model not in models:
+            models.insert(0, queryset.model)
+        return models
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        """Віддає 304, відповідь з кешу або рендерить і зберігає її"""
+        if request.method != 'GET' or not (self.cache_response or self.conditional_response):
+            return handler(request, *args, **kwargs)
+
+        fingerprint, last_modified = self.get_response_fingerprint(request)
+        etag = make_etag(fingerprint)
+
+        if self.conditional_response:
+            not_modified = not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+
+        use_cache = self._response_cache_enabled()
+        cache_key = self.get_response_cache_key(fingerprint) if use_cache else None
+        cached = RawCache.get(cache_key) if use_cache else None
+        if cached is not None:
+            CacheMetrics.record_hit(self.response_cache_family)
+            meta, _, body = cached.partition(b'\n')
+            meta = json.loads(meta)
+            response = HttpResponse(body, status=meta['status'], content_type=meta['content_type'])
+            response['X-Cache'] = 'HIT'
+        else:
+            if use_cache:
+                CacheMetrics.record_miss(self.response_cache_family)
+                request._response_cache_started = time.monotonic()
+            response = handler(request, *args, **kwargs)
+            if use_cache:
+                if response.status_code == 200:
+                    request._response_cache_key = cache_key
+                response['X-Cache'] = 'MISS'
+
+        if self.conditional_response and response.status_code == 200:
+            add_validator_headers(response, etag, last_modified)
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        cache_key = getattr(request, '_response_cache_key', None)
+        if cache_key and hasattr(response, 'add_post_render_callback'):
+            timeout = self._get_response_cache_timeout()
+            started = getattr(request, '_response_cache_started', None)
+            response.add_post_render_callback(
+                lambda rendered: self._store_response(cache_key, rendered, timeout, started)
+            )
+        return response
+
+    def get_response_fingerprint(self, request):
+        """
+        Версія відповіді: шлях + нормалізовані параметри + формат + мова +
+        покоління моделей. Повертає (fingerprint, last_modified)
+        """
+        query = urlencode(sorted(
+            (key, value)
+            for key in request.query_params
+            for value in request.query_params.getlist(key)
+        ))
+        models = self.get_response_cache_models()
+        state = CacheGenerations.get_many_with_timestamps(
+            [CacheGenerations.model_namespace(model) for model in models]
+        )
+        renderer = getattr(request, 'accepted_renderer', None)
+        language = translation.get_language() or settings.LANGUAGE_CODE
+        fingerprint = '|'.join([
+            request.build_absolute_uri(request.path),
+            query,
+            getattr(renderer, 'format', ''),
+            language,
+            ','.join(str(state[ns][0]) for ns in sorted(state)),
+            self.get_response_version_extra(),
+        ])
+        changed = [changed_at for _, changed_at in state.values()]
+        extra_changed_at = self.get_response_changed_at()
+        if extra_changed_at is not None:
+            changed.append(extra_changed_at)
+        last_modified = max(changed, default=None)
+        return fingerprint, last_modified
+
+    def get_response_version_extra(self):
+        """Додаткова частина версії для відповідей, що залежать не лише від моделей"""
+        return ''
+
+    def get_response_changed_at(self):
+        """
+        Час (epoch) зміни тієї частини версії, що не залежить від моделей:
+        без нього If-Modified-Since давав би 304, хоча ETag уже інший
+        """
+        return None
+
+    def get_response_cache_key(self, fingerprint):
+        language = translation.get_language() or settings.LANGUAGE_CODE
+        digest = hashlib.md5(fingerprint.encode('utf-8')).hexdigest()
+        # Ключ за шаблоном сімейства: SCAN-патерни сімейств не перетинаються
+        return CacheRegistry.get(self.response_cache_family).key(
+            basename=self.basename, language=language, digest=digest,
+        )
+
+    def _response_cache_enabled(self):
+        cache_settings = getattr(settings, 'RESPONSE_CACHE_SETTINGS', {})
+        return self.cache_response and cache_settings.get('ENABLED', True)
+
+    def _get_response_cache_timeout(self):
+        if self.response_cache_timeout is not None:
+            return self.response_cache_timeout
+        return getattr(settings, 'RESPONSE_CACHE_SETTINGS', {}).get('TIMEOUT', 60 * 15)
+
+    def _store_response(self, cache_key, response, timeout, started=None):
+        meta = json.dumps({
+            'status': response.status_code,
+            'content_type': response['Content-Type'],
+        }).encode('utf-8')
+        payload = meta + b'\n' + response.content
+        RawCache.set(cache_key, payload, timeout)
+        if started is not None:
+            CacheMetrics.record_fill(self.response_cache_family, time.monotonic() - started, len(payload))
+        logger.debug(f"Stored response cache: {cache_key}")
+
+
+class ResponseCacheMixin(BaseResponseCacheMixin):
+    """
+    BaseResponseCacheMixin для ReadOnlyModelViewSet: кешує list та retrieve.
+    Для ViewSet без цих дій використовуйте BaseResponseCacheMixin, інакше
+    роутер зареєструє маршрути без обробника
+    """
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+
+class SparseFieldsMixin:
+    """
+    ?fields= / ?expand= для list та retrieve: вибір передається
+    серіалізатору (SparseFieldsSerializerMixin), а queryset звужується до
+    колонок і зв'язків, які він прочитає. Ключ кешу відповіді вже містить
+    query string, тож різні набори полів кешуються окремо
+    """
+
+    sparse_fields_actions = ('list', 'retrieve')
+
+    def get_field_selection(self):
+        if not hasattr(self, '_field_selection'):
+            self._field_selection = None
+            if self.request.method == 'GET' and self.action in self.sparse_fields_actions:
+                self._field_selection = FieldSelection.from_request(self.request)
+        return self._field_selection
+
+    def get_serializer(self, *args, **kwargs):
+        selection = self.get_field_selection()
+        if selection is not None and issubclass(self.get_serializer_class(), SparseFieldsSerializerMixin):
+            kwargs.setdefault('field_selection', selection)
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        selection = self.get_field_selection()
+        if selection is None or selection.fields is None:
+            return queryset
+        if not issubclass(self.get_serializer_class(), SparseFieldsSerializerMixin):
+            return queryset
+        return optimize_queryset(queryset, self.get_serializer())
@@ -0,0 +1,119 @@
+# backend/apps/api/mo_catalog.py
+"""
+Читання скомпільованих gettext каталогів (.mo) без polib: файл
+відображається в пам'ять (mmap) і розбирається один раз на mtime
+"""
+from django.conf import settings
+from pathlib import Path
+import logging
+import mmap
+import os
+import re
+import struct
+import threading
+
+logger = logging.getLogger(__name__)
+
+MO_MAGIC = 0x950412de
+MO_MAGIC_SWAPPED = 0xde120495
+
+_CHARSET_RE = re.compile(rb'charset=([\w.-]+)', re.IGNORECASE)
+
+
+def parse_mo(buffer):
+    """
+    Розбирає .mo (bytes або mmap): {msgid: msgstr}. Заголовок і форми
+    множини пропускаються - фронтенду потрібні прості рядки; повідомлення
+    з контекстом зберігають ключ 'context\\x04msgid', як у gettext
+    """
+    if len(buffer) < 28:
+        raise ValueError('file is too short')
+
+    magic, = struct.unpack_from('<I', buffer, 0)
+    if magic == MO_MAGIC:
+        order = '<'
+    elif magic == MO_MAGIC_SWAPPED:
+        order = '>'
+    else:
+        raise ValueError('bad magic number')
+
+    version, count, originals_offset, translations_offset = struct.unpack_from(f'{order}4I', buffer, 4)
+    if version >> 16 not in (0, 1):
+        raise ValueError(f'unsupported version {version}')
+
+    originals = struct.unpack_from(f'{order}{count * 2}I', buffer, originals_offset)
+    translations = struct.unpack_from(f'{order}{count * 2}I', buffer, translations_offset)
+    size = len(buffer)
+
+    charset = 'utf-8'
+    entries = []
+    for index in range(count):
+        msgid_length, msgid_offset = originals[index * 2:index * 2 + 2]
+        msgstr_length, msgstr_offset = translations[index * 2:index * 2 + 2]
+        if msgid_offset + msgid_length > size or msgstr_offset + msgstr_length > size:
+            raise ValueError('entry points outside of the file')
+
+        msgid = buffer[msgid_offset:msgid_offset + msgid_length]
+        msgstr = buffer[msgstr_offset:msgstr_offset + msgstr_length]
+        if not msgid:
+            match = _CHARSET_RE.search(msgstr)
+            if match:
+                charset = match.group(1).decode('ascii')
+            continue
+        if b'\x00' in msgid or not msgstr:
+            continue
+        entries.append((msgid, msgstr))
+
+    return {msgid.decode(charset): msgstr.decode(charset) for msgid, msgstr in entries}
+
+
+class MoCatalogs:
+    """
+    Розібрані .mo файли в пам'яті процесу. Файл перечитується лише коли
+    змінились mtime або розмір (після compilemessages чи збереження в
+    Rosetta), тож звичайний запит коштує один os.stat на файл
+    """
+
+    _parsed = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_paths(cls, lang):
+        return [
+            Path(locale_path) / lang / 'LC_MESSAGES' / 'django.mo'
+            for locale_path in getattr(settings, 'LOCALE_PATHS', [])
+        ]
+
+    @classmethod
+    def read(cls, path):
+        """Каталог одного файлу ({} - файлу немає або він пошкоджений)"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {}
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with cls._lock:
+            cached = cls._parsed.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        catalog = {}
+        try:
+            if stat.st_size:
+                with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    catalog = parse_mo(buffer)
+        except (OSError, ValueError, struct.error, UnicodeDecodeError) as e:
+            logger.warning(f"Could not read catalog {path}: {e}")
+
+        with cls._lock:
+            cls._parsed[path] = (signature, catalog)
+        return catalog
+
+    @classmethod
+    def load(cls, lang):
+        """Повідомлення всіх каталогів LOCALE_PATHS мови; перший шлях має пріоритет"""
+        catalog = {}
+        for path in reversed(cls.get_paths(lang)):
+            catalog.update(cls.read(path))
+        return catalog
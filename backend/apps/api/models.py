@@ -1,3 +1,34 @@
 from django.db import models
+from django.utils.translation import gettext_lazy as _
 
-# Create your models here.
+
+class SiteStatistics(models.Model):
+    """
+    Матеріалізовані лічильники статистики сайту - один рядок (pk=1).
+    Оновлюються F()-виразами в транзакції збереження/видалення контенту
+    (apps.api.site_stats), розходження виправляє reconcile_site_stats
+    """
+    SINGLETON_PK = 1
+
+    total_services = models.IntegerField(default=0, verbose_name=_("Активні послуги"))
+    featured_services = models.IntegerField(default=0, verbose_name=_("Рекомендовані послуги"))
+    total_projects = models.IntegerField(default=0, verbose_name=_("Активні проєкти"))
+    featured_projects = models.IntegerField(default=0, verbose_name=_("Рекомендовані проєкти"))
+    active_jobs = models.IntegerField(default=0, verbose_name=_("Відкриті вакансії"))
+    offices = models.IntegerField(default=0, verbose_name=_("Офіси"))
+    team_members = models.IntegerField(default=0, verbose_name=_("Члени команди"))
+    project_categories = models.IntegerField(default=0, verbose_name=_("Категорії проєктів"))
+    certificates = models.IntegerField(default=0, verbose_name=_("Сертифікати"))
+
+    # Найближчий expires_at серед врахованих вакансій: після нього
+    # active_jobs перераховується при читанні
+    active_jobs_next_expiry = models.DateTimeField(null=True, blank=True, verbose_name=_("Найближче закінчення вакансії"))
+    reconciled_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Звірено"))
+    updated_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Оновлено"))
+
+    class Meta:
+        verbose_name = _("Статистика сайту")
+        verbose_name_plural = _("Статистика сайту")
+
+    def __str__(self):
+        return "Статистика сайту"
@@ -0,0 +1,204 @@
+# backend/apps/api/pagination.py
+"""
+Keyset (cursor) пагінація: наступна сторінка вибирається умовою WHERE по
+значеннях сортування останнього рядка, без COUNT(*) та OFFSET - глибока
+сторінка коштує як перша. Режим вмикається запитом: ?cursor= (порожній -
+перша сторінка), без нього працює звичайна ?page=
+"""
+import base64
+import binascii
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class CursorEncoder(DjangoJSONEncoder):
+    """Дати з повною точністю: DjangoJSONEncoder обрізає мікросекунди, а
+    значення курсора порівнюється з колонкою на рівність"""
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.date, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class KeysetPagination(PageNumberPagination):
+    """
+    Сторінки за сортуванням queryset-у (ordering ViewSet-а, ?ordering=
+    або Meta.ordering) з pk як стабільним тай-брейкером. Курсор містить
+    значення ключів крайнього рядка, напрямок і підпис сортування -
+    курсор з іншим сортуванням відхиляється. NULL nullable ключів завжди
+    в кінці (індекси для них - з тим самим NULLS LAST)
+    """
+
+    cursor_query_param = 'cursor'
+    cursor_page_size_query_param = 'page_size'
+    max_page_size = 100
+    invalid_cursor_message = 'Невірний курсор'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = False
+        if self.cursor_query_param not in request.query_params:
+            return super().paginate_queryset(queryset, request, view)
+
+        keys = self.get_keys(queryset)
+        if keys is None:
+            # Сортування виразами або випадкове - keyset неможливий
+            return super().paginate_queryset(queryset, request, view)
+
+        self.keyset = True
+        self.request = request
+        self.display_page_controls = False
+        self.base_url = request.build_absolute_uri()
+        self.signature = ','.join(f"{'-' if descending else ''}{name}" for name, descending in keys)
+
+        page_size = self.get_cursor_page_size(request)
+        values, reverse = self.decode_cursor(request, len(keys))
+
+        aliases = [f'_keyset_{index}' for index in range(len(keys))]
+        # Анотації замість полів: сортування, фільтр і значення курсора
+        # беруться з одного виразу (у т.ч. для перекладних полів)
+        queryset = queryset.annotate(**{alias: F(name) for alias, (name, _) in zip(aliases, keys)})
+        directions = [
+            (alias, descending != reverse, self.is_nullable(queryset.model, name))
+            for alias, (name, descending) in zip(aliases, keys)
+        ]
+        # При русі назад порядок дзеркальний - NULL на початку
+        nulls_last = not reverse
+        queryset = queryset.order_by(*[
+            self.order_expression(alias, descending, nullable, nulls_last)
+            for alias, descending, nullable in directions
+        ])
+        if values is not None:
+            queryset = queryset.filter(self.build_after_condition(directions, values, nulls_last))
+
+        rows = list(queryset[:page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if reverse:
+            rows.reverse()
+
+        first = [getattr(rows[0], alias) for alias in aliases] if rows else values
+        last = [getattr(rows[-1], alias) for alias in aliases] if rows else values
+        if reverse:
+            self.next_cursor = self.encode_cursor(last, reverse=False)
+            self.previous_cursor = self.encode_cursor(first, reverse=True) if has_more else None
+        else:
+            self.next_cursor = self.encode_cursor(last, reverse=False) if has_more else None
+            self.previous_cursor = self.encode_cursor(first, reverse=True) if values is not None else None
+        return rows
+
+    def get_keys(self, queryset):
+        """[(поле, за спаданням)] + pk; None - keyset неможливий"""
+        query = queryset.query
+        ordering = list(query.order_by) or (list(queryset.model._meta.ordering) if query.default_ordering else [])
+        pk_name = queryset.model._meta.pk.name
+
+        keys = []
+        for item in ordering:
+            if not isinstance(item, str) or item == '?':
+                return None
+            name = item.lstrip('-')
+            keys.append((pk_name if name == 'pk' else name, item.startswith('-')))
+            if keys[-1][0] == pk_name:
+                # Після унікального pk решта ключів нічого не змінює
+                return keys
+        keys.append((pk_name, False))
+        return keys
+
+    @staticmethod
+    def is_nullable(model, name):
+        """Чи може ключ бути NULL; нерозпізнаний шлях вважається nullable"""
+        field = None
+        for part in name.split('__'):
+            try:
+                field = model._meta.get_field(part)
+            except FieldDoesNotExist:
+                return True
+            if field.null:
+                return True
+            model = field.related_model
+            if model is None:
+                break
+        return field is None or field.null
+
+    @staticmethod
+    def order_expression(alias, descending, nullable, nulls_last):
+        """
+        NULLS LAST/FIRST лише для nullable ключів: для NOT NULL колонок
+        звичайні ASC/DESC збігаються з порядком індексу Index(fields=[...])
+        """
+        expression = F(alias).desc if descending else F(alias).asc
+        if not nullable:
+            return expression()
+        return expression(**({'nulls_last': True} if nulls_last else {'nulls_first': True}))
+
+    @staticmethod
+    def build_after_condition(directions, values, nulls_last):
+        """
+        Рядки строго після позиції values у лексикографічному порядку:
+        (k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...; умови IS NULL - лише
+        для nullable ключів. Для NOT NULL першого ключа додається межа
+        k1 >= v1, яку індекс обслуговує як діапазон
+        """
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (alias, descending, nullable), value in zip(directions, values):
+            if value is None:
+                after = Q(**{f'{alias}__isnull': False}) if not nulls_last else None
+                same = Q(**{f'{alias}__isnull': True})
+            else:
+                after = Q(**{f"{alias}__{'lt' if descending else 'gt'}": value})
+                if nullable and nulls_last:
+                    after |= Q(**{f'{alias}__isnull': True})
+                same = Q(**{alias: value})
+            if after is not None:
+                condition |= equal & after
+            equal &= same
+
+        (alias, descending, nullable), value = directions[0], values[0]
+        if not nullable and value is not None:
+            condition = Q(**{f"{alias}__{'lte' if descending else 'gte'}": value}) & condition
+        return condition
+
+    def get_cursor_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.cursor_page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(page_size, self.max_page_size) if page_size > 0 else self.page_size
+
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({'v': values, 'r': int(reverse), 'o': self.signature}, cls=CursorEncoder)
+        token = base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+        return replace_query_param(remove_query_param(self.base_url, 'page'), self.cursor_query_param, token)
+
+    def decode_cursor(self, request, length):
+        """(значення ключів або None для першої сторінки, назад)"""
+        token = request.query_params.get(self.cursor_query_param, '')
+        if not token:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+            values, reverse, signature = payload['v'], bool(payload['r']), payload['o']
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+        if signature != self.signature or not isinstance(values, list) or len(values) != length:
+            raise NotFound(self.invalid_cursor_message)
+        return values, reverse
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+        return Response({
+            'next': self.next_cursor,
+            'previous': self.previous_cursor,
+            'results': data,
+        })
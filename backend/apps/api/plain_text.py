@@ -0,0 +1,128 @@
+# backend/apps/api/plain_text.py
+"""
+Текстові тіньові колонки для RichText полів: чистий текст і короткий
+анонс кожної мови рахуються при збереженні, а не при кожному читанні
+"""
+from django.conf import settings
+import html
+import re
+
+# Вміст script/style не є текстом, блочні теги розділяють слова
+_HIDDEN_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_BLOCK_TAG_RE = re.compile(
+    r'</?(?:p|div|br|hr|li|ul|ol|h[1-6]|tr|td|th|table|blockquote|section)\b[^>]*>',
+    re.IGNORECASE
+)
+_TAG_RE = re.compile(r'<[^>]*>')
+_SPACE_RE = re.compile(r'\s+')
+
+EXCERPT_LENGTH = 300
+
+# Модель -> RichText поля з тіньовою колонкою '<field>_text' та поле,
+# з якого береться анонс 'excerpt'. Тіньові колонки зареєстровані в
+# translation.py, тож існують для кожної мови
+PLAIN_TEXT_FIELDS = {
+    'services.service': {
+        'fields': ('short_description', 'detailed_description'),
+        'excerpt': 'short_description',
+    },
+    'projects.project': {
+        'fields': ('short_description', 'detailed_description'),
+        'excerpt': 'short_description',
+    },
+    'jobs.jobposition': {
+        'fields': ('description', 'requirements'),
+        'excerpt': 'description',
+    },
+    'contacts.office': {
+        'fields': ('address',),
+        'excerpt': None,
+    },
+}
+
+
+def strip_html(text):
+    """Текст без HTML тегів і сутностей, з нормалізованими пробілами"""
+    if not text:
+        return ''
+    text = str(text)
+    if '<' not in text and '&' not in text:
+        return _SPACE_RE.sub(' ', text).strip()
+
+    text = _HIDDEN_RE.sub(' ', text)
+    text = _BLOCK_TAG_RE.sub(' ', text)
+    text = _TAG_RE.sub('', text)
+    return _SPACE_RE.sub(' ', html.unescape(text)).strip()
+
+
+def make_excerpt(text, length=EXCERPT_LENGTH):
+    """Анонс чистого тексту: не довше length, обрізаний по межі слова"""
+    if len(text) <= length:
+        return text
+    cut = text[:length - 1]
+    if ' ' in cut:
+        cut = cut.rsplit(' ', 1)[0]
+    return cut.rstrip(' ,.;:-') + '…'
+
+
+def shadow_field_name(field):
+    return f'{field}_text'
+
+
+def get_shadow_config(model):
+    return PLAIN_TEXT_FIELDS.get(model._meta.label_lower)
+
+
+def get_shadow_fields(model):
+    """Назви тіньових полів моделі (без мовних суфіксів)"""
+    config = get_shadow_config(model)
+    if not config:
+        return []
+    names = [shadow_field_name(field) for field in config['fields']]
+    if config['excerpt']:
+        names.append('excerpt')
+    return names
+
+
+def get_localized_pairs(model):
+    """
+    Пари (колонка-джерело, тіньова колонка, is_excerpt) для всіх мов
+    """
+    from modeltranslation.utils import build_localized_fieldname
+
+    config = get_shadow_config(model)
+    if not config:
+        return []
+
+    pairs = []
+    for lang, _ in settings.LANGUAGES:
+        for field in config['fields']:
+            pairs.append((
+                build_localized_fieldname(field, lang),
+                build_localized_fieldname(shadow_field_name(field), lang),
+                False,
+            ))
+        if config['excerpt']:
+            pairs.append((
+                build_localized_fieldname(config['excerpt'], lang),
+                build_localized_fieldname('excerpt', lang),
+                True,
+            ))
+    return pairs
+
+
+def update_plain_text(instance):
+    """
+    Перераховує тіньові колонки екземпляра з RichText джерел.
+    Повертає назви колонок, значення яких змінилось
+    """
+    changed = []
+    texts = {}
+    for source, target, is_excerpt in get_localized_pairs(type(instance)):
+        if source not in texts:
+            texts[source] = strip_html(getattr(instance, source, ''))
+        value = make_excerpt(texts[source]) if is_excerpt else texts[source]
+        if getattr(instance, target, None) != value:
+            setattr(instance, target, value)
+            changed.append(target)
+    return changed
@@ -1,6 +1,7 @@
 # backend/apps/api/serializers.py
 from rest_framework import serializers
 from django.conf import settings
+from django.db.models import Prefetch
 from django.utils import timezone
 from apps.content.models import HomePage, AboutPage, TeamMember, Certificate, ProductionPhoto
 from apps.services.models import Service, ServiceFeature
@@ -9,12 +10,15 @@ from apps.jobs.models import JobPosition, JobApplication, WorkplacePhoto
 from apps.partners.models import PartnershipInfo, WorkStage, PartnerInquiry
 from apps.contacts.models import Office, ContactInquiry
 
+from .featured_content import FeaturedContentLoader
+from .sparse_fields import SparseFieldsSerializerMixin
+
 
 # ============================================================================
 # TEAM AND ABOUT SERIALIZERS
 # ============================================================================
 
-class TeamMemberSerializer(serializers.ModelSerializer):
+class TeamMemberSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для учасників команди"""
     
     # Додаємо поле для показу зв'язку з головною сторінкою
@@ -48,7 +52,7 @@ class TeamMemberSerializer(serializers.ModelSerializer):
         return None
 
 
-class CertificateSerializer(serializers.ModelSerializer):
+class CertificateSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для сертифікатів"""
     
     # Додаємо поле для показу зв'язку з головною сторінкою
@@ -81,7 +85,7 @@ class CertificateSerializer(serializers.ModelSerializer):
         return None
 
 
-class ProductionPhotoSerializer(serializers.ModelSerializer):
+class ProductionPhotoSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для фото виробництва"""
     
     # Додаємо поле для показу зв'язку з головною сторінкою
@@ -116,7 +120,24 @@ class ProductionPhotoSerializer(serializers.ModelSerializer):
 # HOMEPAGE SERIALIZERS (З ПІДТРИМКОЮ HERO СЕКЦІЇ)
 # ============================================================================
 
-class HomePageSerializer(serializers.ModelSerializer):
+def get_featured_loader(context):
+    """Один завантажувач рекомендованого контенту на контекст серіалізації"""
+    loader = context.get('featured_loader')
+    if loader is None:
+        loader = context['featured_loader'] = FeaturedContentLoader()
+    return loader
+
+
+class HomePageListSerializer(serializers.ListSerializer):
+    """Список HomePage: рекомендований контент вантажиться раз на весь список"""
+    
+    def to_representation(self, data):
+        homepages = list(data.all() if hasattr(data, 'all') else data)
+        get_featured_loader(self.context).prime(homepages)
+        return super().to_representation(homepages)
+
+
+class HomePageSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Розширений серіалізатор для Homepage з підтримкою Hero секції"""
     
     # Додаткові поля для Hero секції
@@ -129,6 +150,7 @@ class HomePageSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = HomePage
+        list_serializer_class = HomePageListSerializer
         fields = [
             'id',
             # Основний контент
@@ -180,13 +202,20 @@ class HomePageSerializer(serializers.ModelSerializer):
             'support': '24/7'
         }
     
+    def _get_related(self, obj, to_attr, related_name, ordering):
+        """
+        Активні пов'язані об'єкти: з Prefetch(to_attr) від get_prefetches(),
+        інакше - окремий запит (серіалізатор поза HomePageViewSet)
+        """
+        items = getattr(obj, to_attr, None)
+        if items is None:
+            items = getattr(obj, related_name).filter(is_active=True).order_by(*ordering)
+        return items
+    
     def get_team_members(self, obj):
         """Повертає членів команди, пов'язаних з цією головною сторінкою"""
         try:
-            # Використовуємо новий зв'язок teammember_set
-            team_members = obj.teammember_set.filter(
-                is_active=True
-            ).order_by('order', 'name')
+            team_members = self._get_related(obj, 'active_team_members', 'teammember_set', ('order', 'name'))
             
             return TeamMemberSerializer(
                 team_members, 
@@ -199,10 +228,7 @@ class HomePageSerializer(serializers.ModelSerializer):
     def get_certificates(self, obj):
         """Повертає сертифікати, пов'язані з цією головною сторінкою"""
         try:
-            # Використовуємо новий зв'язок certificate_set
-            certificates = obj.certificate_set.filter(
-                is_active=True
-            ).order_by('-issued_date')
+            certificates = self._get_related(obj, 'active_certificates', 'certificate_set', ('-issued_date',))
             
             return CertificateSerializer(
                 certificates, 
@@ -215,10 +241,9 @@ class HomePageSerializer(serializers.ModelSerializer):
     def get_production_photos(self, obj):
         """Повертає фото виробництва, пов'язані з цією головною сторінкою"""
         try:
-            # Використовуємо новий зв'язок productionphoto_set
-            production_photos = obj.productionphoto_set.filter(
-                is_active=True
-            ).order_by('order')
+            production_photos = self._get_related(
+                obj, 'active_production_photos', 'productionphoto_set', ('order',)
+            )
             
             return ProductionPhotoSerializer(
                 production_photos, 
@@ -234,11 +259,7 @@ class HomePageSerializer(serializers.ModelSerializer):
             return []
         
         try:
-            from apps.services.models import Service
-            services = Service.objects.filter(
-                is_active=True, 
-                is_featured=True
-            ).order_by('order', 'name')[:obj.featured_services_count]
+            services = get_featured_loader(self.context).services(obj.featured_services_count)
             
             return ServiceListSerializer(
                 services, 
@@ -251,11 +272,7 @@ class HomePageSerializer(serializers.ModelSerializer):
     def get_featured_projects(self, obj):
         """Повертає рекомендовані проекти для Hero секції"""
         try:
-            from apps.projects.models import Project
-            projects = Project.objects.filter(
-                is_active=True, 
-                is_featured=True
-            ).order_by('-project_date', 'title')[:3]
+            projects = get_featured_loader(self.context).projects()
             
             return ProjectListSerializer(
                 projects, 
@@ -264,13 +281,38 @@ class HomePageSerializer(serializers.ModelSerializer):
             ).data
         except Exception as e:
             return []
+    
+    @staticmethod
+    def get_prefetches():
+        """
+        Prefetch-и для queryset HomePage: активні об'єкти вже
+        відфільтровані та впорядковані, а зворотний FK (obj.homepage)
+        заповнений, тож вкладені серіалізатори не роблять запитів
+        """
+        return [
+            Prefetch(
+                'teammember_set',
+                queryset=TeamMember.objects.filter(is_active=True).order_by('order', 'name'),
+                to_attr='active_team_members',
+            ),
+            Prefetch(
+                'certificate_set',
+                queryset=Certificate.objects.filter(is_active=True).order_by('-issued_date'),
+                to_attr='active_certificates',
+            ),
+            Prefetch(
+                'productionphoto_set',
+                queryset=ProductionPhoto.objects.filter(is_active=True).order_by('order'),
+                to_attr='active_production_photos',
+            ),
+        ]
 
 
-class AboutPageSerializer(serializers.ModelSerializer):
+class AboutPageSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для сторінки 'Про нас'"""
-    team_members = TeamMemberSerializer(many=True, read_only=True, source='teammember_set')
-    certificates = CertificateSerializer(many=True, read_only=True, source='certificate_set')
-    production_photos = ProductionPhotoSerializer(many=True, read_only=True, source='productionphoto_set')
+    team_members = serializers.SerializerMethodField()
+    certificates = serializers.SerializerMethodField()
+    production_photos = serializers.SerializerMethodField()
     
     class Meta:
         model = AboutPage
@@ -285,13 +327,25 @@ class AboutPageSerializer(serializers.ModelSerializer):
             'production_photos',
             'updated_at'
         ]
+    
+    def get_team_members(self, obj):
+        members = get_featured_loader(self.context).company_content()['team_members']
+        return TeamMemberSerializer(members, many=True, context=self.context).data
+    
+    def get_certificates(self, obj):
+        certificates = get_featured_loader(self.context).company_content()['certificates']
+        return CertificateSerializer(certificates, many=True, context=self.context).data
+    
+    def get_production_photos(self, obj):
+        photos = get_featured_loader(self.context).company_content()['production_photos']
+        return ProductionPhotoSerializer(photos, many=True, context=self.context).data
 
 
 # ============================================================================
 # SERVICE SERIALIZERS
 # ============================================================================
 
-class ServiceFeatureSerializer(serializers.ModelSerializer):
+class ServiceFeatureSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для особливостей послуг"""
     
     class Meta:
@@ -305,7 +359,7 @@ class ServiceFeatureSerializer(serializers.ModelSerializer):
         ]
 
 
-class ServiceListSerializer(serializers.ModelSerializer):
+class ServiceListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для списку послуг"""
     
     class Meta:
@@ -314,6 +368,7 @@ class ServiceListSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'short_description',
+            'excerpt',
             'slug',
             'icon',
             'main_image',
@@ -324,7 +379,7 @@ class ServiceListSerializer(serializers.ModelSerializer):
         ]
 
 
-class ServiceDetailSerializer(serializers.ModelSerializer):
+class ServiceDetailSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Детальний серіалізатор для послуг"""
     features = ServiceFeatureSerializer(many=True, read_only=True)
     
@@ -345,10 +400,7 @@ class ServiceDetailSerializer(serializers.ModelSerializer):
             'is_active',
             'order',
             'features',
-            'meta_title',
-            'meta_description',
-            'created_at',
-            'updated_at'
+            'created_at'
         ]
 
 
@@ -356,7 +408,7 @@ class ServiceDetailSerializer(serializers.ModelSerializer):
 # PROJECT SERIALIZERS
 # ============================================================================
 
-class ProjectCategorySerializer(serializers.ModelSerializer):
+class ProjectCategorySerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для категорій проектів"""
     
     class Meta:
@@ -372,7 +424,7 @@ class ProjectCategorySerializer(serializers.ModelSerializer):
         ]
 
 
-class ProjectImageSerializer(serializers.ModelSerializer):
+class ProjectImageSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для зображень проектів"""
     
     class Meta:
@@ -385,7 +437,7 @@ class ProjectImageSerializer(serializers.ModelSerializer):
         ]
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
+class ProjectListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для списку проектів"""
     category = ProjectCategorySerializer(read_only=True)
     
@@ -395,6 +447,7 @@ class ProjectListSerializer(serializers.ModelSerializer):
             'id',
             'title',
             'short_description',
+            'excerpt',
             'slug',
             'category',
             'client_name',
@@ -406,7 +459,7 @@ class ProjectListSerializer(serializers.ModelSerializer):
         ]
 
 
-class ProjectDetailSerializer(serializers.ModelSerializer):
+class ProjectDetailSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Детальний серіалізатор для проектів"""
     category = ProjectCategorySerializer(read_only=True)
     images = ProjectImageSerializer(many=True, read_only=True)
@@ -441,7 +494,7 @@ class ProjectDetailSerializer(serializers.ModelSerializer):
 # JOB SERIALIZERS
 # ============================================================================
 
-class JobPositionListSerializer(serializers.ModelSerializer):
+class JobPositionListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для списку вакансій"""
     
     class Meta:
@@ -450,6 +503,7 @@ class JobPositionListSerializer(serializers.ModelSerializer):
             'id',
             'title',
             'description',
+            'excerpt',
             'slug',
             'employment_type',
             'experience_required',
@@ -464,7 +518,7 @@ class JobPositionListSerializer(serializers.ModelSerializer):
         ]
 
 
-class JobPositionDetailSerializer(serializers.ModelSerializer):
+class JobPositionDetailSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Детальний серіалізатор для вакансій"""
     
     class Meta:
@@ -490,7 +544,7 @@ class JobPositionDetailSerializer(serializers.ModelSerializer):
         ]
 
 
-class JobApplicationSerializer(serializers.ModelSerializer):
+class JobApplicationSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для заявок на вакансії"""
     
     class Meta:
@@ -509,7 +563,7 @@ class JobApplicationSerializer(serializers.ModelSerializer):
         return JobApplication.objects.create(**validated_data)
 
 
-class WorkplacePhotoSerializer(serializers.ModelSerializer):
+class WorkplacePhotoSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для фото робочих місць"""
     
     class Meta:
@@ -528,7 +582,7 @@ class WorkplacePhotoSerializer(serializers.ModelSerializer):
 # OFFICE AND CONTACT SERIALIZERS
 # ============================================================================
 
-class OfficeSerializer(serializers.ModelSerializer):
+class OfficeSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для офісів"""
     
     class Meta:
@@ -537,6 +591,7 @@ class OfficeSerializer(serializers.ModelSerializer):
             'id',
             'name',
             'address',
+            'address_text',
             'city',
             'phone',
             'email',
@@ -548,7 +603,7 @@ class OfficeSerializer(serializers.ModelSerializer):
         ]
 
 
-class ContactInquirySerializer(serializers.ModelSerializer):
+class ContactInquirySerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для звернень клієнтів"""
     
     class Meta:
@@ -572,7 +627,7 @@ class ContactInquirySerializer(serializers.ModelSerializer):
 # PARTNER SERIALIZERS
 # ============================================================================
 
-class WorkStageSerializer(serializers.ModelSerializer):
+class WorkStageSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для етапів роботи"""
     
     class Meta:
@@ -586,9 +641,9 @@ class WorkStageSerializer(serializers.ModelSerializer):
             'order'
         ]
 
-class PartnershipInfoSerializer(serializers.ModelSerializer):
+class PartnershipInfoSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для інформації про партнерство"""
-    work_stages = WorkStageSerializer(many=True, read_only=True, source='workstage_set')
+    work_stages = serializers.SerializerMethodField()
     
     class Meta:
         model = PartnershipInfo
@@ -603,9 +658,13 @@ class PartnershipInfoSerializer(serializers.ModelSerializer):
             'work_stages',
             'updated_at'
         ]
+    
+    def get_work_stages(self, obj):
+        stages = get_featured_loader(self.context).work_stages()
+        return WorkStageSerializer(stages, many=True, context=self.context).data
 
 
-class PartnerInquirySerializer(serializers.ModelSerializer):
+class PartnerInquirySerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     """Серіалізатор для запитів партнерів"""
     
     class Meta:
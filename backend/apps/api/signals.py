@@ -1,5 +1,5 @@
 # backend/apps/api/signals.py
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_save, post_delete, post_migrate, pre_save
 from django.dispatch import receiver
 from django.core.cache import cache
 from django.conf import settings
@@ -10,10 +10,18 @@ logger = logging.getLogger(__name__)
 # Функція для очищення кешу (замість TranslationManager)
 def invalidate_translations_cache(locale=None):
     """Очищує кеш перекладів"""
+    from .utils.translations import TranslationUtils
+    
     try:
+        locales = [locale] if locale else [lang_code for lang_code, _ in settings.LANGUAGES]
+        for lang_code in locales:
+            # Нове покоління змінює ETag перекладів та скидає L1 воркера
+            TranslationUtils.bump_version(lang_code)
+        
         if locale:
             # Очищаємо кеш для конкретної локалі
             cache_keys = [
+                f"translations_{locale}",
                 f"static_translations_{locale}",
                 f"dynamic_translations_{locale}",
                 f"po_translations_{locale}",
@@ -26,6 +34,7 @@ def invalidate_translations_cache(locale=None):
             all_keys = []
             for lang_code, _ in settings.LANGUAGES:
                 all_keys.extend([
+                    f"translations_{lang_code}",
                     f"static_translations_{lang_code}",
                     f"dynamic_translations_{lang_code}",
                     f"po_translations_{lang_code}",
@@ -39,39 +48,139 @@ def invalidate_translations_cache(locale=None):
         logger.error(f"Помилка при очищенні кешу перекладів: {e}")
 
 # Сигнали для автоматичного очищення кешу при зміні контенту
-@receiver([post_save, post_delete])
-def invalidate_translations_cache_signal(sender, **kwargs):
-    """Очищає кеш перекладів при зміні моделей з перекладами"""
+# Моделі, зміна яких має призводити до очищення кешу перекладів
+TRANSLATABLE_MODELS = [
+    'Service', 'Project', 'ProjectCategory', 'JobPosition',
+    'HomePage', 'AboutPage', 'TeamMember', 'Contact',
+    'ContactMessage', 'Partner', 'Job', 'JobApplication'
+]
+
+def queue_translations_invalidation(sender, using=None, **kwargs):
+    """Ставить переклади в чергу інвалідації (виконається після commit)"""
+    from .invalidation import invalidation_queue
+    invalidation_queue.mark_translations(using=using)
+
+
+def bump_model_generation(sender, using=None, **kwargs):
+    """Інвалідує кеш відповідей, залежних від моделі (після commit)"""
+    from .invalidation import invalidation_queue
+    invalidation_queue.mark_model(sender, using=using)
+
+
+def watch_model_generation(model):
+    """Підписує модель на інвалідацію поколінь при збереженні/видаленні"""
+    dispatch_uid = f"model_generation_{model._meta.label_lower}"
+    post_save.connect(bump_model_generation, sender=model, dispatch_uid=dispatch_uid)
+    post_delete.connect(bump_model_generation, sender=model, dispatch_uid=dispatch_uid)
+
+
+# Моделі, зміна яких інвалідує переклади (заповнює connect_invalidation_signals)
+_translation_models = set()
+
+
+def handle_bulk_update(model, using=None):
+    """
+    Те, що зробили б сигнали, після queryset.update()/bulk_create, які
+    сигналів не надсилають (масові дії адмінки): покоління моделі (кеш
+    відповідей та ETag), переклади та лічильники статистики сайту
+    """
+    from .invalidation import invalidation_queue
+    from .site_stats import reconcile_model
+
+    invalidation_queue.mark_model(model, using=using)
+    if model in _translation_models:
+        invalidation_queue.mark_translations(using=using)
+    reconcile_model(model)
+
+
+def connect_invalidation_signals():
+    """
+    Підписує лише потрібні моделі замість глобальних post_save/post_delete
+    receiver-ів, що викликались для кожної моделі проєкту
+    """
+    from django.apps import apps
+    from .dynamic_translations import DynamicTranslationLoader
     
-    # Список моделей, зміна яких має призводити до очищення кешу
-    translatable_models = [
-        'Service', 'Project', 'ProjectCategory', 'JobPosition',
-        'HomePage', 'AboutPage', 'TeamMember', 'Contact',
-        'ContactMessage', 'Partner', 'Job', 'JobApplication'
-    ]
+    # Зріз динамічних перекладів моделі прив'язаний до її покоління
+    dynamic_models = set(DynamicTranslationLoader.get_models())
     
-    model_name = sender.__name__
+    for model in apps.get_models():
+        if model.__name__ in TRANSLATABLE_MODELS or model in dynamic_models:
+            _translation_models.add(model)
+            dispatch_uid = f"translations_invalidation_{model._meta.label_lower}"
+            post_save.connect(queue_translations_invalidation, sender=model, dispatch_uid=dispatch_uid)
+            post_delete.connect(queue_translations_invalidation, sender=model, dispatch_uid=dispatch_uid)
+        if model in dynamic_models:
+            watch_model_generation(model)
     
-    if model_name in translatable_models:
-        # Очищаємо кеш перекладів
-        invalidate_translations_cache()
-        
-        # Логуємо дію
-        action = "створення" if kwargs.get('created', False) else "оновлення"
-        if 'signal' in str(kwargs.get('signal', '')).lower() and 'delete' in str(kwargs.get('signal', '')).lower():
-            action = "видалення"
-            
-        logger.info(f"Очищено кеш перекладів через {action} {model_name}")
-        
-        # Опціонально: автоматично перезавантажуємо кеш
+    invalidation_settings = getattr(settings, 'CACHE_INVALIDATION_SETTINGS', {})
+    if invalidation_settings.get('ENABLE_AUTO_INVALIDATION'):
+        for label in invalidation_settings.get('MODELS_TO_WATCH', []):
+            try:
+                watch_model_generation(apps.get_model(label))
+            except (LookupError, ValueError):
+                logger.warning(f"Невідома модель у MODELS_TO_WATCH: {label}")
+
+
+def connect_response_cache_signals():
+    """
+    Підписує моделі, від яких залежать кешовані відповіді viewset-ів, на
+    інвалідацію поколінь. Виконується з ready(), тож і shell та management
+    команди, які не імпортують viewsets, бачать ті самі receiver-и
+    """
+    from . import viewsets  # noqa: F401 - реєструє підкласи міксина
+    from .mixins import BaseResponseCacheMixin
+    
+    pending = list(BaseResponseCacheMixin.__subclasses__())
+    while pending:
+        view_class = pending.pop()
+        pending.extend(view_class.__subclasses__())
+        if view_class.cache_response or view_class.conditional_response:
+            for model in view_class.get_response_cache_models():
+                watch_model_generation(model)
+
+
+def fill_plain_text(sender, instance, **kwargs):
+    """Оновлює тіньові текстові колонки RichText полів перед збереженням"""
+    from .plain_text import update_plain_text
+    update_plain_text(instance)
+
+
+def connect_plain_text_signals():
+    """Підписує моделі з тіньовими колонками (plain_text.PLAIN_TEXT_FIELDS)"""
+    from django.apps import apps
+    from .plain_text import PLAIN_TEXT_FIELDS
+    
+    for label in PLAIN_TEXT_FIELDS:
         try:
-            from .utils.translations import TranslationUtils
-            # Перезавантажуємо переклади для всіх мов
-            for lang_code, _ in settings.LANGUAGES:
-                TranslationUtils.load_translations(lang_code)
-            logger.info("Переклади перезавантажено в кеш")
-        except Exception as e:
-            logger.warning(f"Не вдалося перезавантажити переклади: {e}")
+            model = apps.get_model(label)
+        except LookupError:
+            continue
+        pre_save.connect(fill_plain_text, sender=model, dispatch_uid=f"plain_text_{label}")
+
+
+def connect_site_stats_signals():
+    """Підписує моделі з лічильниками статистики (site_stats.SITE_COUNTERS)"""
+    from django.apps import apps
+    from .site_stats import (
+        SITE_COUNTERS, remember_previous_state, update_counters_on_save, update_counters_on_delete
+    )
+    
+    for label in {spec['model'] for spec in SITE_COUNTERS.values()}:
+        try:
+            model = apps.get_model(label)
+        except LookupError:
+            continue
+        dispatch_uid = f"site_stats_{label}"
+        pre_save.connect(remember_previous_state, sender=model, dispatch_uid=dispatch_uid)
+        post_save.connect(update_counters_on_save, sender=model, dispatch_uid=dispatch_uid)
+        post_delete.connect(update_counters_on_delete, sender=model, dispatch_uid=dispatch_uid)
+
+
+connect_invalidation_signals()
+connect_response_cache_signals()
+connect_plain_text_signals()
+connect_site_stats_signals()
 
 # Додаткові утиліти для роботи з кешем
 def get_cache_stats():
@@ -118,14 +227,17 @@ def get_cache_stats():
 def warmup_translation_cache():
     """Попередньо завантажує переклади в кеш"""
     try:
+        from .cache_utils import CacheRegistry
         from .utils.translations import TranslationUtils
         
+        family = CacheRegistry.get('static_translations')
         warmed_up = 0
         for lang_code, _ in settings.LANGUAGES:
             try:
                 translations = TranslationUtils.load_translations(lang_code)
                 if translations:
-                    cache.set(f"static_translations_{lang_code}", translations, 60 * 30)
+                    version, _ = TranslationUtils.get_version(lang_code)
+                    cache.set(family.key(language=lang_code, version=version), translations, family.timeout)
                     warmed_up += 1
                     logger.info(f"Кеш прогрітий для {lang_code}: {len(translations)} перекладів")
             except Exception as e:
@@ -136,4 +248,22 @@ def warmup_translation_cache():
         
     except Exception as e:
         logger.error(f"Помилка прогріву кешу: {e}")
-        return 0
\ No newline at end of file
+        return 0
+
+
+@receiver(post_migrate)
+def warm_cache_after_migrate(sender, **kwargs):
+    """Хук після деплою: прогріває кеш після migrate, якщо увімкнено ON_MIGRATE"""
+    if sender.name != 'apps.api':
+        return
+    if not getattr(settings, 'CACHE_WARMUP_SETTINGS', {}).get('ON_MIGRATE'):
+        return
+    
+    try:
+        from .cache_warmup import CacheWarmer
+        
+        results = CacheWarmer().warm()
+        warmed = sum(1 for result in results if result['status'] == 200)
+        logger.info(f"Прогрів кешу після migrate: {warmed}/{len(results)} endpoints")
+    except Exception as e:
+        logger.error(f"Помилка прогріву кешу після migrate: {e}")
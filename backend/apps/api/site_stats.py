@@ -0,0 +1,244 @@
+# backend/apps/api/site_stats.py
+"""
+Статистика сайту без COUNT-ів на читанні: лічильники в SiteStatistics
+змінюються на ±1 у тій самій транзакції, що й контент (pre/post_save,
+post_delete), читання - один запит за первинним ключем. Масові операції
+(update, bulk_create) сигналів не надсилають: після них викликається
+reconcile_model() (дії адмінки), а решту розходжень виправляє reconcile()
+при читанні раз на SITE_STATS_SETTINGS['RECONCILE_INTERVAL'] або
+команда reconcile_site_stats
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, Count, F, Min, Q, Value, When
+from django.utils import timezone
+import logging
+
+from .models import SiteStatistics
+
+logger = logging.getLogger(__name__)
+
+# Лічильник (поле SiteStatistics) -> модель та умова рівності полів.
+# 'expires': поле дати, після якої запис перестає враховуватись -
+# найближча дата зберігається в '<лічильник>_next_expiry'
+SITE_COUNTERS = {
+    'total_services': {'model': 'services.service', 'filters': {'is_active': True}},
+    'featured_services': {'model': 'services.service', 'filters': {'is_active': True, 'is_featured': True}},
+    'total_projects': {'model': 'projects.project', 'filters': {'is_active': True}},
+    'featured_projects': {'model': 'projects.project', 'filters': {'is_active': True, 'is_featured': True}},
+    'active_jobs': {'model': 'jobs.jobposition', 'filters': {'is_active': True}, 'expires': 'expires_at'},
+    'offices': {'model': 'contacts.office', 'filters': {'is_active': True}},
+    'team_members': {'model': 'content.teammember', 'filters': {'is_active': True}},
+    'project_categories': {'model': 'projects.projectcategory', 'filters': {'is_active': True}},
+    'certificates': {'model': 'content.certificate', 'filters': {'is_active': True}},
+}
+
+
+def get_counters(model):
+    """Лічильники моделі: {лічильник: spec}"""
+    label = model._meta.label_lower
+    return {name: spec for name, spec in SITE_COUNTERS.items() if spec['model'] == label}
+
+
+def get_tracked_fields(counters):
+    fields = set()
+    for spec in counters.values():
+        fields.update(spec['filters'])
+        if spec.get('expires'):
+            fields.add(spec['expires'])
+    return sorted(fields)
+
+
+def matches(spec, values, now):
+    """Чи враховується запис із такими значеннями полів лічильником"""
+    if values is None:
+        return False
+    if any(values.get(field) != expected for field, expected in spec['filters'].items()):
+        return False
+    if spec.get('expires'):
+        expires = values.get(spec['expires'])
+        return expires is not None and expires >= now
+    return True
+
+
+def count_counters(counters, now):
+    """
+    Точні значення лічильників: умовна агрегація - один запит на модель;
+    для лічильників з 'expires' ще й найближча дата закінчення
+    """
+    by_model = defaultdict(dict)
+    for name, spec in counters.items():
+        by_model[spec['model']][name] = spec
+
+    values = {}
+    for label, model_counters in by_model.items():
+        model = apps.get_model(label)
+        aggregates = {}
+        for name, spec in model_counters.items():
+            condition = Q(**spec['filters'])
+            if spec.get('expires'):
+                condition &= Q(**{f"{spec['expires']}__gte": now})
+                aggregates[f'{name}_next_expiry'] = Min(spec['expires'], filter=condition)
+            aggregates[name] = Count('pk', filter=condition)
+        values.update(model._default_manager.aggregate(**aggregates))
+    return values
+
+
+def reconcile(counters=None, report_drift=True, reconciled_before=None):
+    """
+    Перераховує лічильники (за замовчуванням - всі) і виправляє
+    розходження. Рядок блокується до підрахунку: паралельні ±1 чекають
+    на commit і застосовуються вже поверх точного значення.
+    report_drift=False - перерахунок очікуваний (настав термін), не збій.
+    reconciled_before - перерахунок лише якщо рядок звірено раніше (інші
+    запити, що чекали на блокування, не повторюють уже зроблену звірку).
+    Повертає (SiteStatistics, {лічильник: (було, стало)})
+    """
+    counters = SITE_COUNTERS if counters is None else counters
+    now = timezone.now()
+    with transaction.atomic():
+        stats, created = SiteStatistics.objects.select_for_update().get_or_create(pk=SiteStatistics.SINGLETON_PK)
+        if (
+            reconciled_before is not None and not created
+            and stats.reconciled_at is not None and stats.reconciled_at >= reconciled_before
+        ):
+            return stats, {}
+        values = count_counters(counters, now)
+
+        drift = {
+            name: (getattr(stats, name), values[name])
+            for name in counters
+            if getattr(stats, name) != values[name]
+        }
+        for field, value in values.items():
+            setattr(stats, field, value)
+        stats.updated_at = now
+        if counters.keys() >= SITE_COUNTERS.keys():
+            # Час повної звірки - часткова не відкладає страховку за інтервалом
+            stats.reconciled_at = now
+        stats.save()
+
+    if drift and report_drift and not created:
+        logger.warning(f"Site statistics drift corrected: {drift}")
+    return stats, drift
+
+
+def reconcile_model(model):
+    """
+    Перерахунок лічильників моделі після update()/bulk_create, які не
+    надсилають сигналів (напр. масові дії адмінки). Без лічильників - нічого
+    """
+    counters = get_counters(model)
+    if counters:
+        reconcile(counters, report_drift=False)
+
+
+def get_site_statistics():
+    """
+    Поточна статистика: один SELECT за pk. Лічильники з датою закінчення
+    перераховуються, лише коли настав збережений найближчий термін; усі -
+    коли остання звірка старша за RECONCILE_INTERVAL
+    """
+    stats = SiteStatistics.objects.filter(pk=SiteStatistics.SINGLETON_PK).first()
+    if stats is None:
+        return reconcile()[0]
+
+    now = timezone.now()
+    interval = getattr(settings, 'SITE_STATS_SETTINGS', {}).get('RECONCILE_INTERVAL', 60 * 60)
+    if interval:
+        cutoff = now - timedelta(seconds=interval)
+        if stats.reconciled_at is None or stats.reconciled_at < cutoff:
+            return reconcile(reconciled_before=cutoff)[0]
+
+    expired = {
+        name: spec for name, spec in SITE_COUNTERS.items()
+        if spec.get('expires') and _is_expired(getattr(stats, f'{name}_next_expiry'), now)
+    }
+    if expired:
+        stats = reconcile(expired, report_drift=False)[0]
+    return stats
+
+
+def _is_expired(next_expiry, now):
+    return next_expiry is not None and next_expiry < now
+
+
+def apply_changes(deltas, expiries=None):
+    """
+    Застосовує зміни лічильників F()-виразами в поточній транзакції:
+    відкат збереження контенту відкочує і лічильники
+    """
+    deltas = {name: delta for name, delta in deltas.items() if delta}
+    expiries = expiries or {}
+    if not deltas and not expiries:
+        return
+
+    now = timezone.now()
+    with transaction.atomic():
+        # Лічильник із простроченим терміном уже не точний - ±1 поверх
+        # нього дав би розходження, тож перераховуємо його повністю
+        # (підрахунок бачить поточну зміну - вона в тій самій транзакції)
+        expiring = {name for name in {*deltas, *expiries} if SITE_COUNTERS[name].get('expires')}
+        if expiring:
+            stats = SiteStatistics.objects.filter(pk=SiteStatistics.SINGLETON_PK).first()
+            if stats is None:
+                # Рядка ще немає - повний підрахунок уже враховує цю зміну
+                reconcile()
+                return
+            if any(_is_expired(getattr(stats, f'{name}_next_expiry'), now) for name in expiring):
+                reconcile({name: SITE_COUNTERS[name] for name in expiring}, report_drift=False)
+                deltas = {name: delta for name, delta in deltas.items() if name not in expiring}
+                expiries = {}
+                if not deltas:
+                    return
+
+        updates = {name: F(name) + delta for name, delta in deltas.items()}
+        for name, expires in expiries.items():
+            column = f'{name}_next_expiry'
+            updates[column] = Case(
+                When(**{f'{column}__isnull': True}, then=Value(expires)),
+                When(**{f'{column}__gt': expires}, then=Value(expires)),
+                default=F(column),
+            )
+        updated = SiteStatistics.objects.filter(pk=SiteStatistics.SINGLETON_PK).update(updated_at=now, **updates)
+
+    if not updated:
+        # Рядка ще немає - повний підрахунок уже враховує цю зміну
+        reconcile()
+
+
+def remember_previous_state(sender, instance, raw=False, **kwargs):
+    """pre_save: значення відстежуваних полів до збереження (None - новий запис)"""
+    counters = get_counters(sender)
+    previous = None
+    if not instance._state.adding and instance.pk is not None:
+        previous = sender._base_manager.filter(pk=instance.pk).values(*get_tracked_fields(counters)).first()
+    instance._site_stats_previous = previous
+
+
+def update_counters_on_save(sender, instance, **kwargs):
+    counters = get_counters(sender)
+    previous = instance.__dict__.pop('_site_stats_previous', None)
+    current = {field: getattr(instance, field) for field in get_tracked_fields(counters)}
+    now = timezone.now()
+
+    deltas = {}
+    expiries = {}
+    for name, spec in counters.items():
+        was_counted = matches(spec, previous, now)
+        is_counted = matches(spec, current, now)
+        deltas[name] = int(is_counted) - int(was_counted)
+        if is_counted and spec.get('expires'):
+            expiries[name] = current[spec['expires']]
+    apply_changes(deltas, expiries)
+
+
+def update_counters_on_delete(sender, instance, **kwargs):
+    counters = get_counters(sender)
+    current = {field: getattr(instance, field) for field in get_tracked_fields(counters)}
+    now = timezone.now()
+    apply_changes({name: -int(matches(spec, current, now)) for name, spec in counters.items()})
@@ -0,0 +1,154 @@
+# backend/apps/api/sparse_fields.py
+"""
+Розріджені набори полів: ?fields=id,title,category.name обмежує відповідь
+вказаними полями, ?expand=category розгортає вкладений об'єкт, який
+інакше віддається як pk. Обрані поля визначають і queryset: .only() по
+потрібних колонках, select_related/prefetch_related лише для розгорнутих
+зв'язків. Без параметрів відповідь не змінюється
+"""
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+def parse_field_tree(value):
+    """'id,category.name,category.slug' -> {'id': {}, 'category': {'name': {}, 'slug': {}}}"""
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for part in path.strip().split('.'):
+            if not part:
+                break
+            node = node.setdefault(part, {})
+    return tree
+
+
+class FieldSelection:
+    """
+    Вибір полів одного рівня серіалізатора: fields - None (усі поля) або
+    {поле: вибір підполів}, expand - {поле: розгортання вкладених полів}
+    """
+
+    def __init__(self, fields=None, expand=None):
+        self.fields = fields
+        self.expand = expand or {}
+
+    @classmethod
+    def from_request(cls, request):
+        """None - клієнт не просив розрідженого набору"""
+        fields = request.query_params.get('fields')
+        expand = request.query_params.get('expand')
+        if not fields and not expand:
+            return None
+        return cls(parse_field_tree(fields) if fields else None, parse_field_tree(expand) if expand else None)
+
+    def includes(self, name):
+        return self.fields is None or name in self.fields
+
+    def is_expanded(self, name):
+        """Вкладений об'єкт розгортається, якщо всі поля за замовчуванням, або він у ?expand=, або обрані його підполя"""
+        return self.fields is None or name in self.expand or bool(self.fields.get(name))
+
+    def nested(self, name):
+        sub_fields = self.fields.get(name) if self.fields is not None else None
+        return FieldSelection(sub_fields or None, self.expand.get(name))
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Серіалізатор, що приймає field_selection (FieldSelection): зайві поля
+    відкидаються, нерозгорнуті вкладені серіалізатори стають pk
+    """
+
+    def __init__(self, *args, field_selection=None, **kwargs):
+        self.field_selection = field_selection
+        super().__init__(*args, **kwargs)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selection = self.field_selection
+        if selection is None:
+            return fields
+
+        selected = {}
+        for name, field in fields.items():
+            if not selection.includes(name):
+                continue
+            nested = field.child if isinstance(field, serializers.ListSerializer) else field
+            if isinstance(nested, serializers.BaseSerializer):
+                if not selection.is_expanded(name):
+                    field = serializers.PrimaryKeyRelatedField(
+                        read_only=True,
+                        many=nested is not field,
+                        source=field.source,
+                    )
+                elif isinstance(nested, SparseFieldsSerializerMixin):
+                    nested.field_selection = selection.nested(name)
+            selected[name] = field
+        return selected
+
+
+def get_queryset_plan(serializer):
+    """
+    Що потрібно серіалізатору від queryset: (колонки для .only(),
+    select_related, prefetch_related) або None, якщо джерело якогось поля
+    не можна визначити (метод-поля, source='*', властивості моделі) або
+    власний list_serializer_class читає модель поза полями
+    """
+    if getattr(serializer.Meta, 'list_serializer_class', None) is not None:
+        return None
+    model = serializer.Meta.model
+    columns = {model._meta.pk.name}
+    select_related = []
+    prefetch_related = []
+
+    for field in serializer.fields.values():
+        if isinstance(field, serializers.SerializerMethodField) or field.source == '*':
+            return None
+        if len(field.source_attrs) != 1:
+            return None
+        attr = field.source_attrs[0]
+        try:
+            model_field = model._meta.get_field(attr)
+        except FieldDoesNotExist:
+            return None
+
+        nested = field.child if isinstance(field, serializers.ListSerializer) else field
+        if model_field.one_to_many or model_field.many_to_many:
+            prefetch_related.append(attr)
+        elif model_field.is_relation and isinstance(nested, serializers.BaseSerializer):
+            related_plan = get_queryset_plan(nested)
+            select_related.append(attr)
+            columns.add(attr)
+            if related_plan is not None:
+                related_columns, related_select, _ = related_plan
+                columns.update(f'{attr}__{column}' for column in related_columns)
+                select_related.extend(f'{attr}__{name}' for name in related_select)
+        else:
+            columns.add(attr)
+    return sorted(columns), select_related, prefetch_related
+
+
+def optimize_queryset(queryset, serializer):
+    """
+    Звужує queryset під обрані поля: .only(), а select_related та
+    prefetch_related - лише для зв'язків, які серіалізатор справді читає
+    """
+    plan = get_queryset_plan(serializer)
+    if plan is None:
+        return queryset
+    columns, select_related, prefetch_related = plan
+
+    # Prefetch із ViewSet-а зберігається, лише якщо його зв'язок обрано
+    kept_prefetches = [
+        lookup for lookup in queryset._prefetch_related_lookups
+        if getattr(lookup, 'prefetch_through', lookup).split('__')[0] in prefetch_related
+    ]
+    prefetched = {getattr(lookup, 'prefetch_through', lookup).split('__')[0] for lookup in kept_prefetches}
+
+    queryset = queryset.select_related(None).prefetch_related(None).only(*columns)
+    if select_related:
+        queryset = queryset.select_related(*select_related)
+    return queryset.prefetch_related(
+        *kept_prefetches,
+        *[name for name in prefetch_related if name not in prefetched],
+    )
@@ -0,0 +1,3 @@
+# backend/apps/api/templatetags/translations.py
+"""{% load translations %}: теги translate/trans з apps.api.utils.translations"""
+from apps.api.utils.translations import register  # noqa: F401
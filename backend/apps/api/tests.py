@@ -1,3 +1,591 @@
-from django.test import TestCase
+# backend/apps/api/tests.py
+"""
+Бюджети SQL-запитів для всіх GET endpoints API.
 
-# Create your tests here.
+Кожен маршрут DRF роутера та додаткові views з apps/api/urls.py
+викликаються для кожної мови двічі: на початковому наборі даних і після
+його збільшення в GROWTH_FACTOR разів (нові об'єкти та нові дочірні
+записи в уже наявних). Тест падає, якщо endpoint перевищує бюджет з
+QUERY_BUDGETS, якщо кількість запитів росте разом з даними (N+1) або
+якщо маршрут не має задекларованого бюджету.
+
+Звіт по endpoint-ах (запити, дубльований SQL, час):
+QUERY_BUDGET_REPORT=1 - у stdout, QUERY_BUDGET_REPORT=<шлях> - у JSON.
+
+KeysetPaginationTests: ?cursor= віддає ті самі рядки, що й ?page=, з
+однаковою кількістю запитів на кожній сторінці.
+
+SparseFieldsTests: ?fields= / ?expand= звужують і відповідь, і SELECT.
+
+BulkUpdateInvalidationTests: масові update() (дії адмінки) змінюють ETag;
+receiver-и поколінь підписуються з ready(), а не імпортом viewsets.
+
+DynamicTranslationModelsTests: приватні моделі виключені з перекладів кодом.
+
+TranslationChangeLogTests: згортання журналу в дельту ?since= та захист
+голови журналу від запізнілих воркерів.
+"""
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from datetime import timedelta
+from decimal import Decimal
+import json
+import os
+import re
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection, models
+from django.db.models.signals import post_delete, post_save
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLPattern, reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.content.models import HomePage, AboutPage, TeamMember, Certificate, ProductionPhoto
+from apps.services.models import Service, ServiceFeature
+from apps.projects.models import Project, ProjectCategory, ProjectImage
+from apps.jobs.models import JobPosition, JobApplication, WorkplacePhoto
+from apps.partners.models import PartnershipInfo, WorkStage, PartnerInquiry
+from apps.contacts.models import Office, ContactInquiry
+
+from .dynamic_translations import DynamicTranslationLoader
+from .signals import connect_response_cache_signals, handle_bulk_update
+from .translation_bundles import TranslationBundle, TranslationChangeLog
+from .utils.translations import translation_l1
+
+# Розмір початкового набору: об'єктів кожного типу та дочірніх на батька
+SEED_SCALE = int(os.environ.get('QUERY_BUDGET_SCALE', 3))
+GROWTH_FACTOR = 3
+
+# Максимум запитів на один холодний (без кешу) запит до endpoint-а.
+# Ключ - ім'я URL; бюджет не залежить від розміру даних
+QUERY_BUDGETS = {
+    # Роутер
+    'homepage-list': 7,
+    'homepage-detail': 6,
+    'about-list': 5,
+    'about-detail': 4,
+    'teammember-list': 2,
+    'teammember-detail': 1,
+    'service-list': 2,
+    'service-detail': 2,
+    'service-features': 2,
+    'projectcategory-list': 2,
+    'projectcategory-detail': 1,
+    'projectcategory-projects': 3,
+    'project-list': 2,
+    'project-detail': 2,
+    'project-images': 2,
+    'jobposition-list': 2,
+    'jobposition-detail': 1,
+    'jobapplication-list': 2,
+    'jobapplication-detail': 1,
+    'workplacephoto-list': 2,
+    'workplacephoto-detail': 1,
+    'partnershipinfo-list': 3,
+    'partnershipinfo-detail': 2,
+    'workstage-list': 2,
+    'workstage-detail': 1,
+    'partnerinquiry-list': 2,
+    'partnerinquiry-detail': 1,
+    'office-list': 2,
+    'office-detail': 1,
+    'contactinquiry-list': 2,
+    'contactinquiry-detail': 1,
+    'unifiedcontent-stats': 1,
+    'unifiedcontent-featured': 3,
+    # Додаткові views
+    'api-root': 0,
+    # Холодна збірка бандла: запит на кожну перекладну модель (dynamic);
+    # versions/ збирає бандли всіх мов
+    'translations-versions': 30,
+    'translations': 15,
+    'translations-all': 15,
+    'translations-namespace': 15,
+    'translations-search': 15,
+    'api-health': 1,
+    'cache-management': 0,
+}
+
+# Значення URL-параметрів додаткових views (крім lang)
+EXTRA_KWARGS = {
+    'namespace': 'common',
+}
+
+# Query string для endpoint-ів, яким без нього нічого робити
+EXTRA_QUERY = {
+    'translations-search': {'q': 'про'},
+}
+
+_SQL_LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+
+def normalize_sql(sql):
+    """SQL без літералів - однакові запити з різними параметрами збігаються"""
+    return _SQL_LITERAL_RE.sub('?', sql)
+
+
+@dataclass
+class Measurement:
+    name: str
+    language: str
+    path: str
+    status: int
+    queries: int
+    duplicates: int
+    time_ms: float
+    duplicate_sql: list = field(default_factory=list)
+
+
+class DatasetFactory:
+    """
+    Набір даних для всіх моделей API. Обов'язкові поля, не задані явно,
+    заповнюються за типом поля, тож нове обов'язкове поле моделі не
+    ламає сидінг
+    """
+
+    def __init__(self):
+        self.counter = 0
+
+    def value_for(self, model, model_field):
+        self.counter += 1
+        n = self.counter
+        if model_field.choices:
+            return model_field.choices[0][0]
+        if isinstance(model_field, models.SlugField):
+            return f'{model._meta.model_name}-{n}'
+        if isinstance(model_field, models.EmailField):
+            return f'user{n}@example.com'
+        if isinstance(model_field, models.URLField):
+            return f'https://example.com/{n}/'
+        if isinstance(model_field, models.FileField):
+            return f'seed/{model._meta.model_name}-{n}.jpg'
+        if isinstance(model_field, (models.CharField, models.TextField)):
+            value = f'{model._meta.verbose_name} {model_field.name} {n}'
+            return value[:model_field.max_length] if model_field.max_length else value
+        if isinstance(model_field, models.DateTimeField):
+            return timezone.now() + timedelta(days=30)
+        if isinstance(model_field, models.DateField):
+            return timezone.now().date() - timedelta(days=n % 365)
+        if isinstance(model_field, models.DecimalField):
+            return Decimal('1')
+        if isinstance(model_field, (models.IntegerField, models.FloatField)):
+            return n
+        if isinstance(model_field, models.BooleanField):
+            return True
+        raise ValueError(f'No seed value for {model._meta.label}.{model_field.name}')
+
+    @staticmethod
+    def unique_field_names(model):
+        names = {name for fields in model._meta.unique_together for name in fields}
+        for constraint in model._meta.constraints:
+            names.update(getattr(constraint, 'fields', ()))
+        return names
+
+    def make(self, model, **values):
+        # Поля з унікальністю отримують значення навіть за наявності default
+        unique_names = self.unique_field_names(model)
+        for model_field in model._meta.concrete_fields:
+            if model_field.primary_key or model_field.name in values or model_field.attname in values:
+                continue
+            required = not (model_field.has_default() or model_field.null)
+            if not required and not (model_field.unique or model_field.name in unique_names):
+                continue
+            if getattr(model_field, 'auto_now', False) or getattr(model_field, 'auto_now_add', False):
+                continue
+            if model_field.blank and isinstance(model_field, (models.CharField, models.TextField)):
+                continue
+            if model_field.is_relation:
+                raise ValueError(f'{model._meta.label}.{model_field.name} must be passed explicitly')
+            values[model_field.name] = self.value_for(model, model_field)
+        return model.objects.create(**values)
+
+    def seed(self, scale):
+        """
+        Додає scale об'єктів кожного типу і по scale дочірніх записів
+        кожному батьку (новому й наявному) - росте і списки, і деталі
+        """
+        for _ in range(scale):
+            self.make(HomePage, featured_services_count=scale)
+            self.make(AboutPage)
+            category = self.make(ProjectCategory)
+            self.make(Service, is_featured=True)
+            self.make(Project, category=category, is_featured=True)
+            position = self.make(JobPosition, expires_at=timezone.now() + timedelta(days=30))
+            self.make(JobApplication, position=position)
+            self.make(WorkplacePhoto)
+            self.make(PartnershipInfo)
+            self.make(WorkStage)
+            self.make(PartnerInquiry)
+            self.make(Office)
+            self.make(ContactInquiry)
+            self.make(TeamMember)
+
+        for _ in range(scale):
+            for homepage in HomePage.objects.all():
+                self.make(TeamMember, homepage=homepage)
+                self.make(Certificate, homepage=homepage)
+                self.make(ProductionPhoto, homepage=homepage)
+            for service in Service.objects.all():
+                self.make(ServiceFeature, service=service)
+            for category in ProjectCategory.objects.all():
+                self.make(Project, category=category)
+            for project in Project.objects.all():
+                self.make(ProjectImage, project=project)
+            for position in JobPosition.objects.all():
+                self.make(JobApplication, position=position)
+
+
+def collect_endpoints():
+    """
+    GET endpoints API: [(ім'я URL, kwargs, query, is_language_route)].
+    Маршрути роутера беруться з router.urls, додаткові - з urlpatterns
+    """
+    from . import urls as api_urls
+
+    endpoints = []
+    for pattern in api_urls.router.urls:
+        callback = pattern.callback
+        actions = getattr(callback, 'actions', None)
+        if not actions or 'get' not in actions:
+            continue
+        groups = set(pattern.pattern.regex.groupindex)
+        if 'format' in groups:
+            continue
+
+        kwargs = {}
+        if groups:
+            viewset = callback.cls
+            lookup_field = viewset.lookup_field or 'pk'
+            lookup_kwarg = viewset.lookup_url_kwarg or lookup_field
+            obj = viewset.queryset.model._default_manager.order_by('pk').first()
+            kwargs[lookup_kwarg] = getattr(obj, lookup_field)
+        endpoints.append((pattern.name, kwargs, EXTRA_QUERY.get(pattern.name, {}), False))
+
+    for pattern in api_urls.urlpatterns:
+        if not isinstance(pattern, URLPattern) or not pattern.name:
+            continue
+        groups = set(pattern.pattern.regex.groupindex) or set(pattern.pattern.converters)
+        kwargs = {name: EXTRA_KWARGS[name] for name in groups if name != 'lang'}
+        endpoints.append((pattern.name, kwargs, EXTRA_QUERY.get(pattern.name, {}), 'lang' in groups))
+
+    return endpoints
+
+
+class QueryBudgetTests(TestCase):
+    """Кількість запитів кожного endpoint-а обмежена і не залежить від даних"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.factory = DatasetFactory()
+        cls.factory.seed(SEED_SCALE)
+        cls.staff = get_user_model().objects.create_user(
+            username='budget-admin', password='x', is_staff=True, is_superuser=True
+        )
+
+    def setUp(self):
+        # force_authenticate: адмінські endpoint-и теж викликаються, а
+        # сесія не додає запитів до бюджету
+        self.client = APIClient(raise_request_exception=False)
+        self.client.force_authenticate(user=self.staff)
+
+    def measure(self, name, kwargs, query, language, language_route):
+        if language_route:
+            kwargs = {**kwargs, 'lang': language}
+        path = reverse(name, kwargs=kwargs)
+
+        # Холодний шлях: без кешу відповідей і L1 перекладів
+        cache.clear()
+        translation_l1.clear()
+        with CaptureQueriesContext(connection) as context:
+            started = time.perf_counter()
+            response = self.client.get(path, query, HTTP_ACCEPT_LANGUAGE=language)
+            elapsed = (time.perf_counter() - started) * 1000
+
+        statements = Counter(normalize_sql(query['sql']) for query in context.captured_queries)
+        duplicate_sql = [sql for sql, count in statements.items() if count > 1]
+        return Measurement(
+            name=name,
+            language=language,
+            path=path,
+            status=response.status_code,
+            queries=len(context),
+            duplicates=sum(statements[sql] - 1 for sql in duplicate_sql),
+            time_ms=round(elapsed, 1),
+            duplicate_sql=duplicate_sql,
+        )
+
+    def measure_all(self):
+        languages = [code for code, _ in settings.LANGUAGES]
+        return {
+            (name, language): self.measure(name, kwargs, query, language, language_route)
+            for name, kwargs, query, language_route in collect_endpoints()
+            for language in languages
+        }
+
+    def write_report(self, small, large):
+        target = os.environ.get('QUERY_BUDGET_REPORT')
+        if not target:
+            return
+        rows = [
+            {
+                **asdict(large[key]),
+                'budget': QUERY_BUDGETS.get(key[0]),
+                'queries_small_dataset': small[key].queries,
+            }
+            for key in sorted(large)
+        ]
+        if target != '1':
+            with open(target, 'w', encoding='utf-8') as f:
+                json.dump(rows, f, ensure_ascii=False, indent=2)
+            return
+
+        print(f"\n{'endpoint':34} {'lang':4} {'status':>6} {'queries':>8} {'budget':>6} {'dups':>5} {'ms':>8}")
+        for row in rows:
+            print(
+                f"{row['name']:34} {row['language']:4} {row['status']:>6} "
+                f"{row['queries_small_dataset']:>3}->{row['queries']:<4} {str(row['budget']):>6} "
+                f"{row['duplicates']:>5} {row['time_ms']:>8}"
+            )
+
+    def test_query_budgets(self):
+        small = self.measure_all()
+        self.factory.seed(SEED_SCALE * (GROWTH_FACTOR - 1))
+        large = self.measure_all()
+        self.write_report(small, large)
+
+        for key, result in sorted(large.items()):
+            name, language = key
+            with self.subTest(endpoint=name, language=language):
+                self.assertIn(name, QUERY_BUDGETS, f'{name}: не задекларовано бюджет у QUERY_BUDGETS')
+                self.assertLess(result.status, 500, f'{result.path}: HTTP {result.status}')
+                self.assertLessEqual(
+                    result.queries, small[key].queries,
+                    f'{result.path}: кількість запитів росте з даними '
+                    f'({small[key].queries} -> {result.queries}), дублікати: {result.duplicate_sql}'
+                )
+                self.assertLessEqual(
+                    result.queries, QUERY_BUDGETS[name],
+                    f'{result.path}: {result.queries} запитів при бюджеті {QUERY_BUDGETS[name]}, '
+                    f'дублікати: {result.duplicate_sql}'
+                )
+
+
+class KeysetPaginationTests(TestCase):
+    """?cursor= віддає ті самі рядки, що й ?page=, і глибока сторінка коштує як перша"""
+
+    ENDPOINTS = (
+        'project-list', 'projectcategory-projects', 'jobposition-list', 'jobapplication-list',
+        'partnerinquiry-list', 'contactinquiry-list', 'workplacephoto-list',
+    )
+    PAGE_SIZE = 2
+
+    @classmethod
+    def setUpTestData(cls):
+        DatasetFactory().seed(SEED_SCALE)
+        cls.staff = get_user_model().objects.create_user(
+            username='keyset-admin', password='x', is_staff=True, is_superuser=True
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.staff)
+
+    def get(self, url):
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200, url)
+        return response.json(), context.captured_queries
+
+    def test_cursor_walk_matches_page_number_listing(self):
+        endpoints = {name: kwargs for name, kwargs, _, _ in collect_endpoints()}
+        for name in self.ENDPOINTS:
+            with self.subTest(endpoint=name):
+                path = reverse(name, kwargs=endpoints[name])
+                expected = self.get(path)[0]['results']
+
+                rows, costs, pages = [], set(), []
+                url = f'{path}?cursor=&page_size={self.PAGE_SIZE}'
+                while url:
+                    page, queries = self.get(url)
+                    self.assertFalse([q for q in queries if 'COUNT(' in q['sql']], url)
+                    costs.add(len(queries))
+                    pages.append(page)
+                    rows.extend(page['results'])
+                    url = page['next']
+
+                self.assertEqual(rows, expected)
+                self.assertGreater(len(pages), 1)
+                self.assertEqual(len(costs), 1, f'{path}: різна кількість запитів на сторінку {costs}')
+
+                backwards = list(pages[-1]['results'])
+                url = pages[-1]['previous']
+                while url:
+                    page = self.get(url)[0]
+                    backwards[:0] = page['results']
+                    url = page['previous']
+                self.assertEqual(backwards, expected)
+
+    def test_not_null_keys_use_plain_index_order(self):
+        """NOT NULL ключі - без NULLS LAST та IS NULL, інакше індекс (-created_at, id) не працює"""
+        first = self.get(f"{reverse('contactinquiry-list')}?cursor=&page_size={self.PAGE_SIZE}")[0]
+        sql = self.get(first['next'])[1][-1]['sql']
+        self.assertNotIn('NULLS', sql)
+        self.assertNotIn('IS NULL', sql)
+
+    def test_invalid_cursor(self):
+        self.assertEqual(self.client.get(reverse('project-list'), {'cursor': 'garbage'}).status_code, 404)
+
+
+class SparseFieldsTests(TestCase):
+    """?fields= віддає лише обрані поля, нерозгорнуті зв'язки - pk, а SELECT - лише потрібні колонки"""
+
+    @classmethod
+    def setUpTestData(cls):
+        DatasetFactory().seed(SEED_SCALE)
+
+    def setUp(self):
+        cache.clear()
+
+    def get(self, path, **params):
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(path, params)
+        self.assertEqual(response.status_code, 200, params)
+        return response.json(), [query['sql'] for query in context.captured_queries]
+
+    def test_without_params_response_is_unchanged(self):
+        full = self.get(reverse('project-list'))[0]['results']
+        self.assertEqual(self.get(reverse('project-list'), expand='category')[0]['results'], full)
+        self.assertIsInstance(full[0]['category'], dict)
+
+    def test_fields_limit_response_and_columns(self):
+        data, queries = self.get(reverse('project-list'), fields='id,title,slug')
+        self.assertTrue(data['results'])
+        for row in data['results']:
+            self.assertEqual(set(row), {'id', 'title', 'slug'})
+        select = queries[-1]
+        self.assertNotIn('short_description', select)
+        self.assertNotIn('projects_projectcategory', select)
+
+    def test_relation_is_pk_unless_expanded(self):
+        path = reverse('project-list')
+        projects = Project.objects.filter(is_active=True).select_related('category')
+        categories = {project.pk: project.category for project in projects}
+
+        rows = self.get(path, fields='id,category')[0]['results']
+        for row in rows:
+            self.assertEqual(row['category'], categories[row['id']].pk)
+
+        rows = self.get(path, fields='id,category.name')[0]['results']
+        for row in rows:
+            self.assertEqual(row['category'], {'name': categories[row['id']].name})
+
+        rows, queries = self.get(path, fields='id,category', expand='category')
+        self.assertEqual(len(queries), 2)
+        for row in rows['results']:
+            self.assertEqual(row['category']['slug'], categories[row['id']].slug)
+
+    def test_unknown_fields_are_ignored(self):
+        rows = self.get(reverse('office-list'), fields='id,unknown')[0]['results']
+        self.assertTrue(rows)
+        self.assertEqual({key for row in rows for key in row}, {'id'})
+
+
+class BulkUpdateInvalidationTests(TestCase):
+    """queryset.update() не надсилає сигналів - handle_bulk_update() замість них"""
+
+    def setUp(self):
+        cache.clear()
+        self.service = DatasetFactory().make(Service)
+
+    def test_bulk_deactivation_changes_etag(self):
+        path = reverse('service-list')
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+        self.assertIn(self.service.pk, [row['id'] for row in response.json()['results']])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Service.objects.filter(pk=self.service.pk).update(is_active=False)
+            handle_bulk_update(Service)
+
+        response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertNotIn(self.service.pk, [row['id'] for row in response.json()['results']])
+
+    def test_generation_watchers_registered_from_ready(self):
+        post_save.disconnect(sender=ProjectImage, dispatch_uid='model_generation_projects.projectimage')
+        self.assertFalse(post_save.has_listeners(ProjectImage))
+
+        connect_response_cache_signals()
+        self.assertTrue(post_save.has_listeners(ProjectImage))
+        self.assertTrue(post_delete.has_listeners(ProjectImage))
+
+
+class DynamicTranslationModelsTests(TestCase):
+    """Приватні моделі не потрапляють у переклади навіть без налаштувань"""
+
+    @override_settings(TRANSLATION_CACHE_SETTINGS={})
+    def test_private_models_excluded_by_default(self):
+        models = DynamicTranslationLoader.get_models()
+        self.assertIn(Office, models)
+        self.assertNotIn(ContactInquiry, models)
+
+
+class TranslationChangeLogTests(TestCase):
+    """Дельта від since до голови журналу; голова рухається лише вперед"""
+
+    LANGUAGE = 'uk'
+
+    def setUp(self):
+        cache.clear()
+
+    def bundle(self, static):
+        return TranslationBundle(self.LANGUAGE, {'static': static, 'dynamic': {}, 'po': {}})
+
+    def delta(self, since, head):
+        return TranslationChangeLog.get_delta(self.LANGUAGE, since.hash, head.hash)
+
+    def test_delta_folds_consecutive_entries(self):
+        first = self.bundle({'a': '1', 'b': '2'})
+        second = self.bundle({'b': '2', 'c': '3'})
+        third = self.bundle({'a': '4', 'b': '2'})
+        for version, bundle in enumerate((first, second, third), start=1):
+            TranslationChangeLog.record(bundle, f'{version}:0:0')
+
+        # removed -> added = changed, added -> removed = без змін
+        self.assertEqual(self.delta(first, third)['changes'], {
+            'translations': {'added': {}, 'changed': {'a': '4'}, 'removed': []},
+        })
+        self.assertEqual(self.delta(second, third)['changes'], {
+            'translations': {'added': {'a': '4'}, 'changed': {}, 'removed': ['c']},
+        })
+        self.assertEqual(self.delta(third, third), {'version': third.hash, 'changes': {}})
+
+    def test_stale_writer_does_not_move_head_back(self):
+        old = self.bundle({'a': '1'})
+        new = self.bundle({'a': '2'})
+        TranslationChangeLog.record(old, '1:0:0')
+        TranslationChangeLog.record(new, '2:0:0')
+        # Воркер дозбирав бандл попередньої версії вже після нового
+        TranslationChangeLog.record(old, '1:0:0')
+
+        self.assertEqual(TranslationChangeLog.get(self.LANGUAGE)['head'], new.hash)
+        self.assertEqual(self.delta(new, new)['changes'], {})
+        self.assertEqual(self.delta(old, new)['changes'], {
+            'translations': {'added': {}, 'changed': {'a': '2'}, 'removed': []},
+        })
+
+    def test_no_delta_when_head_is_not_current_bundle(self):
+        old = self.bundle({'a': '1'})
+        new = self.bundle({'a': '2'})
+        TranslationChangeLog.record(old, '1:0:0')
+        TranslationChangeLog.record(new, '2:0:0')
+        self.assertIsNone(self.delta(old, old))
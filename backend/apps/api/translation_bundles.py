@@ -0,0 +1,461 @@
+# backend/apps/api/translation_bundles.py
+"""
+Скомпільовані бандли перекладів: статичні + динамічні + PO в одному
+незмінному об'єкті з хешем вмісту, заздалегідь серіалізованому та стиснутому
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+import gzip
+import hashlib
+import json
+import logging
+
+from .cache_utils import CacheLock, CacheRegistry
+from .mo_catalog import MoCatalogs
+from .utils.translations import TranslationUtils, translation_l1
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+def load_po_catalog(lang):
+    """Повідомлення .mo каталогів проєкту (LOCALE_PATHS) для мови: {msgid: msgstr}"""
+    return MoCatalogs.load(lang)
+
+
+def namespace_of(key):
+    """Простір імен ключа - перший сегмент до крапки ('nav.home' -> 'nav')"""
+    return str(key).split('.', 1)[0]
+
+
+def split_namespaces(translations):
+    """Розбиває словник перекладів за просторами імен: {namespace: {key: value}}"""
+    namespaces = {}
+    for key, value in translations.items():
+        namespaces.setdefault(namespace_of(key), {})[key] = value
+    return namespaces
+
+
+def content_hash(value):
+    """Короткий sha256 канонічного JSON (однаковий у всіх воркерах)"""
+    canonical = json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def compile_sections(lang):
+    """Збирає всі джерела перекладів мови (build step бандла)"""
+    from .translations import DynamicTranslationsAPIView
+    from .views import TranslationsAPIView
+
+    return {
+        'static': TranslationsAPIView()._load_translations(lang),
+        'dynamic': DynamicTranslationsAPIView().load_dynamic_translations(lang),
+        'po': load_po_catalog(lang),
+    }
+
+
+class TranslationBundle:
+    """
+    Незмінний бандл перекладів мови.
+
+    Хеш рахується з канонічного JSON вмісту, тому однаковий вміст дає
+    однаковий ETag у всіх воркерах і після перезбирання. Тіла відповідей
+    (звичайне та розширене) серіалізуються та стискаються один раз.
+    """
+
+    ENCODINGS = ('br', 'gzip') if brotli else ('gzip',)
+
+    # Скільки комбінацій ?ns= тримати готовими в одному бандлі
+    MAX_NAMESPACE_COMBINATIONS = 64
+
+    def __init__(self, language, sections, built_at=None):
+        self.language = language
+        self.sections = sections
+        self.built_at = built_at or timezone.now().isoformat()
+
+        self.hash = content_hash(sections)
+        self.etag = f'"{self.hash}"'
+        self.total_keys = sum(
+            len(section) if isinstance(section, dict) else 1
+            for section in sections['static'].values()
+        )
+
+        self._bodies = {
+            'default': self._encode(self._build_payload(extended=False)),
+            'extended': self._encode(self._build_payload(extended=True)),
+        }
+
+        # Простори імен статичних і динамічних перекладів, кожен зі своїм
+        # хешем та готовими тілами; PO каталог не має просторів імен
+        static_namespaces = split_namespaces(sections['static'])
+        dynamic_namespaces = split_namespaces(sections['dynamic'])
+        self.namespaces = {}
+        for name in sorted(set(static_namespaces) | set(dynamic_namespaces)):
+            namespace_sections = {
+                'translations': static_namespaces.get(name, {}),
+                'dynamic': dynamic_namespaces.get(name, {}),
+            }
+            self.namespaces[name] = {
+                'sections': namespace_sections,
+                'hash': content_hash(namespace_sections),
+            }
+        self._namespace_bodies = {}
+        for name in self.namespaces:
+            self._get_namespace_bodies((name,))
+
+    @property
+    def translations(self):
+        return self.sections['static']
+
+    def _build_payload(self, extended):
+        from .views import UnifiedAPIResponse
+
+        available_languages = [code for code, _ in settings.LANGUAGES]
+        data = {
+            'language': self.language,
+            'translations': self.sections['static'],
+            'dynamic': self.sections['dynamic'],
+            'po': self.sections['po'],
+            'count': len(self.sections['static']),
+            'available_languages': available_languages,
+            'version': self.hash,
+        }
+        if not extended:
+            return UnifiedAPIResponse.success(
+                data=data,
+                message=f"Переклади для мови {self.language} отримано"
+            )
+
+        data['meta'] = {
+            'format': 'extended',
+            'generated_at': self.built_at,
+            'cache_ttl': CacheRegistry.get('translations').timeout,
+            'sections': list(self.sections['static'].keys()),
+            'total_keys': self.total_keys,
+            'dynamic_count': len(self.sections['dynamic']),
+            'po_count': len(self.sections['po']),
+            'version': self.hash,
+        }
+        return UnifiedAPIResponse.success(
+            data=data,
+            message=f"Всі переклади для мови {self.language} отримано"
+        )
+
+    @staticmethod
+    def _encode(payload):
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        encoded = {
+            'identity': body,
+            # mtime=0 - однакові байти в усіх воркерах
+            'gzip': gzip.compress(body, compresslevel=9, mtime=0),
+        }
+        if brotli:
+            encoded['br'] = brotli.compress(body)
+        return encoded
+
+    def get_body(self, accept_encoding='', extended=False):
+        """Найкраще тіло для Accept-Encoding клієнта: (bytes, content_encoding)"""
+        return self._choose_body(self._bodies['extended' if extended else 'default'], accept_encoding)
+
+    def get_namespace_etag(self, names):
+        """ETag набору просторів імен (змінюється лише з їхнім вмістом)"""
+        if len(names) == 1:
+            return f'"{self.namespaces[names[0]]["hash"]}"'
+        return f'"{content_hash([(name, self.namespaces[name]["hash"]) for name in names])}"'
+
+    def _get_namespace_bodies(self, names):
+        bodies = self._namespace_bodies.get(names)
+        if bodies is not None:
+            return bodies
+
+        from .views import UnifiedAPIResponse
+
+        translations = {}
+        dynamic = {}
+        for name in names:
+            translations.update(self.namespaces[name]['sections']['translations'])
+            dynamic.update(self.namespaces[name]['sections']['dynamic'])
+        payload = UnifiedAPIResponse.success(
+            data={
+                'language': self.language,
+                'namespaces': list(names),
+                'translations': translations,
+                'dynamic': dynamic,
+                'count': len(translations),
+                'version': self.get_namespace_etag(names).strip('"'),
+                'bundle_version': self.hash,
+            },
+            message=f"Переклади для мови {self.language} отримано"
+        )
+        bodies = self._encode(payload)
+
+        if len(self._namespace_bodies) >= len(self.namespaces) + self.MAX_NAMESPACE_COMBINATIONS:
+            # Забуваємо комбінації, одиночні простори імен лишаються
+            self._namespace_bodies = {
+                key: value for key, value in self._namespace_bodies.items() if len(key) == 1
+            }
+        self._namespace_bodies[names] = bodies
+        return bodies
+
+    def get_namespace_body(self, names, accept_encoding=''):
+        """Тіло для набору відомих просторів імен: (bytes, content_encoding)"""
+        bodies = self._get_namespace_bodies(tuple(sorted(names)))
+        return self._choose_body(bodies, accept_encoding)
+
+    def _choose_body(self, bodies, accept_encoding):
+        accepted = {
+            token.split(';', 1)[0].strip().lower()
+            for token in accept_encoding.split(',')
+        }
+        for encoding in self.ENCODINGS:
+            if encoding in accepted:
+                return bodies[encoding], encoding
+        return bodies['identity'], None
+
+    def as_dict(self):
+        return {
+            'version': self.hash,
+            'built_at': self.built_at,
+            'count': len(self.sections['static']),
+            'total_keys': self.total_keys,
+            'dynamic_count': len(self.sections['dynamic']),
+            'po_count': len(self.sections['po']),
+            'bytes': {
+                encoding: len(body) for encoding, body in self._bodies['default'].items()
+            },
+            'namespaces': {
+                name: namespace['hash'] for name, namespace in self.namespaces.items()
+            },
+        }
+
+
+class TranslationChangeLog:
+    """
+    Журнал змін ключів перекладів мови між версіями бандлів.
+
+    Запис додається, коли збирається бандл з новим хешем: різниця між
+    знімком попередньої голови журналу та новим бандлом по кожній секції
+    (translations, dynamic, po). Так журнал покриває всі джерела - файли,
+    моделі, PO з Rosetta. Зберігаються останні CHANGELOG_MAX_ENTRIES
+    записів; для старішої версії клієнт отримує повний бандл.
+    """
+
+    SECTIONS = (('static', 'translations'), ('dynamic', 'dynamic'), ('po', 'po'))
+
+    @staticmethod
+    def _family():
+        return CacheRegistry.get('translation_changelog')
+
+    @staticmethod
+    def _max_entries():
+        return getattr(settings, 'TRANSLATION_CACHE_SETTINGS', {}).get('CHANGELOG_MAX_ENTRIES', 50)
+
+    @classmethod
+    def get(cls, lang):
+        return cache.get(cls._family().key(language=lang))
+
+    @staticmethod
+    def version_key(version):
+        """
+        Порядок версій перекладів 'покоління:лічильник сховища:mtime' -
+        кожна частина лише зростає. None - версію не розібрати
+        """
+        try:
+            generation, store_version, mtime = str(version).split(':')
+            return int(generation), int(store_version), float(mtime)
+        except ValueError:
+            return None
+
+    @classmethod
+    def is_behind(cls, log, version):
+        """Чи version не новіша за голову журналу (бандл запізнілого воркера)"""
+        head_key = cls.version_key(log.get('head_version'))
+        version_key = cls.version_key(version)
+        return head_key is not None and version_key is not None and version_key <= head_key
+
+    @classmethod
+    def record(cls, bundle, version):
+        """
+        Додає запис для нового бандла версії version. Голова рухається лише
+        вперед: воркер, що дозбирав бандл старішої версії, не повертає її
+        """
+        family = cls._family()
+        key = family.key(language=bundle.language)
+        log = cache.get(key)
+        if log and (log['head'] == bundle.hash or cls.is_behind(log, version)):
+            return
+
+        lock_key = f"lock:{key}"
+        token = CacheLock.acquire(lock_key, 30)
+        if token is None:
+            # Той самий бандл записує інший воркер
+            return
+        try:
+            log = cache.get(key) or {'head': None, 'head_version': None, 'entries': [], 'snapshot': None}
+            if log['head'] == bundle.hash or cls.is_behind(log, version):
+                return
+
+            if log['snapshot'] is not None:
+                changes = cls.diff(log['snapshot'], bundle.sections)
+                log['entries'].append({
+                    'from': log['head'],
+                    'to': bundle.hash,
+                    'at': bundle.built_at,
+                    'changes': changes,
+                })
+                # Компактизація: найстаріші записи відкидаються
+                log['entries'] = log['entries'][-cls._max_entries():]
+
+            log['head'] = bundle.hash
+            log['head_version'] = version
+            log['snapshot'] = bundle.sections
+            cache.set(key, log, family.timeout)
+            logger.info(f"Translation changelog for {bundle.language} advanced to {bundle.hash}")
+        finally:
+            CacheLock.release(lock_key, token)
+
+    @classmethod
+    def diff(cls, old_sections, new_sections):
+        """Різниця двох наборів секцій: {section: {added, changed, removed}}"""
+        changes = {}
+        for section, name in cls.SECTIONS:
+            old = old_sections.get(section, {})
+            new = new_sections.get(section, {})
+            section_changes = {
+                'added': {k: v for k, v in new.items() if k not in old},
+                'changed': {k: v for k, v in new.items() if k in old and old[k] != v},
+                'removed': [k for k in old if k not in new],
+            }
+            if any(section_changes.values()):
+                changes[name] = section_changes
+        return changes
+
+    @classmethod
+    def get_versions(cls, lang):
+        """
+        (голова журналу, версії, від яких журнал може дати дельту: голова
+        та початки записів)
+        """
+        log = cls.get(lang)
+        if not log:
+            return None, frozenset()
+        return log['head'], frozenset(
+            version for version in [log['head'], *(entry['from'] for entry in log['entries'])]
+            if version is not None
+        )
+
+    @classmethod
+    def get_delta(cls, lang, since, head):
+        """
+        Зміни від версії since до голови журналу або None (потрібен повний
+        бандл), якщо since невідома (журнал компактизовано) або голова
+        журналу - не head, поточний бандл воркера
+        """
+        log = cls.get(lang)
+        if not log or log['head'] != head:
+            return None
+        if since == log['head']:
+            return {'version': log['head'], 'changes': {}}
+
+        entries = log['entries']
+        start = next((i for i, entry in enumerate(entries) if entry['from'] == since), None)
+        if start is None:
+            return None
+
+        # Згортаємо записи: стан ключа відносно версії since
+        folded = {}
+        for entry in entries[start:]:
+            for name, section_changes in entry['changes'].items():
+                state = folded.setdefault(name, {})
+                for k, v in section_changes['added'].items():
+                    previous = state.get(k, (None,))[0]
+                    state[k] = ('changed' if previous == 'removed' else 'added', v)
+                for k, v in section_changes['changed'].items():
+                    previous = state.get(k, (None,))[0]
+                    state[k] = ('added' if previous == 'added' else 'changed', v)
+                for k in section_changes['removed']:
+                    if state.get(k, (None,))[0] == 'added':
+                        del state[k]
+                    else:
+                        state[k] = ('removed', None)
+
+        changes = {}
+        for name, state in folded.items():
+            section_changes = {
+                'added': {k: v for k, (op, v) in state.items() if op == 'added'},
+                'changed': {k: v for k, (op, v) in state.items() if op == 'changed'},
+                'removed': [k for k, (op, _) in state.items() if op == 'removed'],
+            }
+            if any(section_changes.values()):
+                changes[name] = section_changes
+        return {'version': log['head'], 'changes': changes}
+
+
+class TranslationBundles:
+    """
+    Доступ до бандлів: L1 воркера -> секції в Redis -> компіляція.
+    Ключ містить версію перекладів (покоління + mtime джерел), тож
+    інвалідація перекладів автоматично веде до нового бандла
+    """
+
+    @staticmethod
+    def get(lang):
+        version, _ = TranslationUtils.get_version(lang)
+
+        def load():
+            # Секції спільні для воркерів, байти кожен воркер готує сам
+            sections = CacheRegistry.get('translations').get_or_set(
+                lambda: compile_sections(lang),
+                language=lang,
+                version=version,
+            )
+            bundle = TranslationBundle(lang, sections)
+            try:
+                TranslationChangeLog.record(bundle, version)
+            except Exception as e:
+                logger.warning(f"Could not record translation changelog for {lang}: {e}")
+            return bundle
+
+        return translation_l1.get_or_load(('bundle', lang, version), load)
+
+    @staticmethod
+    def get_delta(lang, since):
+        """Дельта від версії since до поточного бандла (None - потрібен повний бандл)"""
+        bundle = TranslationBundles.get(lang)
+        # since приходить від клієнта: невідома журналу версія не читає
+        # журнал і не займає місце в L1 (довільні ?since= не витісняють
+        # бандли), у L1 - лише набір відомих версій на хеш бандла.
+        # Набір кешується, лише коли голова журналу - саме цей бандл:
+        # інакше дельта вела б до іншої версії, ніж ETag і /versions/
+        versions_key = ('delta_versions', lang, bundle.hash)
+        known_versions = translation_l1.get(versions_key)
+        if known_versions is None:
+            head, known_versions = TranslationChangeLog.get_versions(lang)
+            if head != bundle.hash:
+                return None
+            translation_l1.set(versions_key, known_versions)
+        if since not in known_versions:
+            return None
+        return translation_l1.get_or_load(
+            ('delta', lang, since, bundle.hash),
+            lambda: TranslationChangeLog.get_delta(lang, since, bundle.hash),
+        )
+
+    @staticmethod
+    def get_versions():
+        """Поточні хеші бандлів усіх мов: {lang: hash}"""
+        return {
+            code: TranslationBundles.get(code).hash
+            for code, _ in settings.LANGUAGES
+        }
+
+    @staticmethod
+    def build_all(languages=None):
+        """Build step: збирає бандли мов заздалегідь (деплой, після інвалідації)"""
+        languages = languages or [code for code, _ in settings.LANGUAGES]
+        return {lang: TranslationBundles.get(lang) for lang in languages}
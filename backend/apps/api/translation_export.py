@@ -0,0 +1,376 @@
+# backend/apps/api/translation_export.py
+"""
+Експорт перекладів для фронтенду: мови паралельно, лише змінені,
+файли з хешем вмісту в імені (immutable для CDN), маніфест та
+попередньо стиснуті .gz/.br копії
+"""
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+from pathlib import Path
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+from .translation_bundles import TranslationBundles, brotli, content_hash, split_namespaces
+from .translation_search import flatten
+from .utils.translation_store import atomic_write_bytes, file_lock
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+METADATA_NAME = 'export-metadata.json'
+LOCK_NAME = '.export.lock'
+
+
+def convert_to_nested(flat_translations):
+    """Плоскі ключі через крапку -> вкладені об'єкти"""
+    nested = {}
+    for key, value in flat_translations.items():
+        parts = key.split('.')
+        current = nested
+        for part in parts[:-1]:
+            child = current.get(part)
+            if not isinstance(child, dict):
+                # Лист і секція з однаковим ім'ям: секція перемагає
+                child = current[part] = {}
+            current = child
+        if not isinstance(current.get(parts[-1]), dict):
+            current[parts[-1]] = value
+    return nested
+
+
+class TranslationExporter:
+    """
+    Експортує каталоги мов у output_dir.
+
+    Для кожної мови рахується хеш джерела (каталог + формат); якщо він
+    збігається з маніфестом і файл на місці - мова пропускається без
+    запису. Інакше JSON пишеться потоково пакетами по BATCH_SIZE ключів
+    одночасно у файл, gzip та brotli, а хеш вмісту дає ім'я
+    '<lang>.<hash>.json'. '<lang>.json' лишається стабільним псевдонімом
+    для старих клієнтів. Попередні хешовані версії зберігаються
+    (BACKUP_COUNT), щоб клієнти зі старим маніфестом не отримали 404.
+    """
+
+    def __init__(self, output_dir, languages=None, export_format='flat', minify=False,
+                 split=False, force=False):
+        export_settings = getattr(settings, 'TRANSLATION_EXPORT_SETTINGS', {})
+
+        self.output_dir = Path(output_dir)
+        self.languages = languages or [code for code, _ in settings.LANGUAGES]
+        self.export_format = export_format
+        self.minify = minify
+        self.split = split
+        self.force = force
+
+        self.include_dynamic = export_settings.get('INCLUDE_DYNAMIC', True)
+        self.include_po = export_settings.get('INCLUDE_PO', True)
+        self.batch_size = max(1, export_settings.get('BATCH_SIZE', 1000))
+        self.max_export_size = export_settings.get('MAX_EXPORT_SIZE', 50000)
+        self.compression_level = export_settings.get('COMPRESSION_LEVEL', 6)
+        self.keep_versions = (
+            export_settings.get('BACKUP_COUNT', 5) if export_settings.get('AUTO_BACKUP', True) else 0
+        )
+        self.generate_metadata = export_settings.get('GENERATE_METADATA', True)
+
+    def get_catalog(self, lang, include_po=None):
+        """Плоский каталог мови з бандла: статичні, динамічні, .po"""
+        bundle = TranslationBundles.get(lang)
+        catalog = flatten(bundle.sections['static'])
+        if self.include_dynamic:
+            catalog.update(bundle.sections['dynamic'])
+        if self.include_po if include_po is None else include_po:
+            # .po лише доповнює - ключі фронтенду мають пріоритет
+            for key, value in bundle.sections['po'].items():
+                catalog.setdefault(key, value)
+        return dict(sorted(catalog.items()))
+
+    def read_manifest(self):
+        try:
+            with open(self.output_dir / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            manifest = {}
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Ignoring unreadable export manifest: {e}")
+            manifest = {}
+        manifest.setdefault('languages', {})
+        return manifest
+
+    def export(self):
+        """
+        Експортує всі мови паралельно. Повертає результати по мовах:
+        status - 'exported', 'unchanged', 'empty' або 'error'
+        """
+        started = time.perf_counter()
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Один експорт у директорію одночасно (команда, webhook, інший воркер)
+        with file_lock(self.output_dir / LOCK_NAME):
+            manifest = self.read_manifest()
+            previous = manifest['languages']
+
+            with ThreadPoolExecutor(
+                max_workers=max(1, len(self.languages)), thread_name_prefix='translation-export'
+            ) as executor:
+                results = list(executor.map(
+                    lambda lang: self._export_language(lang, previous.get(lang)), self.languages
+                ))
+
+            exported = [result for result in results if result['status'] == 'exported']
+            if exported:
+                for result in exported:
+                    previous[result['language']] = result['entry']
+                manifest.update({
+                    'version': 1,
+                    'generated_at': timezone.now().isoformat(),
+                    'format': self.export_format,
+                    'minified': self.minify,
+                })
+                self._write_json(self.output_dir / MANIFEST_NAME, manifest)
+                if self.generate_metadata:
+                    self._write_metadata(manifest)
+
+        logger.info(
+            f"Translation export to {self.output_dir}: "
+            f"{len(exported)}/{len(results)} languages written "
+            f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+        return results
+
+    def _export_language(self, lang, previous):
+        started = time.perf_counter()
+        result = {'language': lang, 'status': 'unchanged', 'entry': previous}
+        try:
+            catalog = self.get_catalog(lang)
+            if not catalog:
+                result['status'] = 'empty'
+                return result
+            if len(catalog) > self.max_export_size:
+                raise ValueError(
+                    f"{len(catalog)} keys exceed MAX_EXPORT_SIZE ({self.max_export_size})"
+                )
+
+            data = convert_to_nested(catalog) if self.export_format == 'nested' else catalog
+            source_hash = content_hash({'data': data, 'minify': self.minify, 'split': self.split})
+            if (
+                not self.force
+                and previous
+                and previous.get('source_hash') == source_hash
+                and (self.output_dir / previous['file']).exists()
+            ):
+                return result
+
+            entry = self._write_language(lang, data)
+            entry.update({
+                'source_hash': source_hash,
+                'count': len(catalog),
+                'updated_at': timezone.now().isoformat(),
+            })
+            if self.split:
+                # Ключі .po - це вихідні рядки, а не простори імен
+                entry['namespaces'] = self._write_namespaces(lang, self.get_catalog(lang, include_po=False))
+            self._prune(lang, entry['file'])
+
+            result.update(status='exported', entry=entry)
+            return result
+        except Exception as e:
+            logger.error(f"Translation export failed for {lang}: {e}")
+            result.update(status='error', error=str(e))
+            return result
+        finally:
+            result['duration_ms'] = round((time.perf_counter() - started) * 1000, 1)
+            # Потік пулу міг відкрити з'єднання для динамічних перекладів
+            connections.close_all()
+
+    def _encode_items(self, items):
+        if self.minify:
+            return ','.join(
+                f'{json.dumps(key, ensure_ascii=False)}:'
+                f'{json.dumps(value, ensure_ascii=False, separators=(",", ":"))}'
+                for key, value in items
+            )
+        return ',\n'.join(
+            f'  {json.dumps(key, ensure_ascii=False)}: '
+            + json.dumps(value, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+            for key, value in items
+        )
+
+    def _write_language(self, lang, data):
+        """Потоковий запис файлу та стиснутих копій, потім атомарне перейменування"""
+        items = list(data.items())
+        separator, opening, closing = (',', '{', '}') if self.minify else (',\n', '{\n', '\n}\n')
+        if not items:
+            opening, closing = '{', '}\n'
+
+        paths = {}
+        files = {}
+        try:
+            for encoding in ('identity', 'gzip', 'br'):
+                if encoding == 'br' and not brotli:
+                    continue
+                fd, paths[encoding] = tempfile.mkstemp(
+                    dir=self.output_dir, prefix=f'.{lang}.{encoding}.', suffix='.tmp'
+                )
+                files[encoding] = os.fdopen(fd, 'wb')
+
+            hasher = hashlib.sha256()
+            gzip_stream = gzip.GzipFile(
+                filename='', mode='wb', fileobj=files['gzip'],
+                compresslevel=self.compression_level, mtime=0
+            )
+            compressor = brotli.Compressor(quality=11) if 'br' in files else None
+
+            def emit(text):
+                chunk = text.encode('utf-8')
+                hasher.update(chunk)
+                files['identity'].write(chunk)
+                gzip_stream.write(chunk)
+                if compressor:
+                    files['br'].write(compressor.process(chunk))
+
+            emit(opening)
+            for start in range(0, len(items), self.batch_size):
+                chunk = self._encode_items(items[start:start + self.batch_size])
+                emit(separator + chunk if start else chunk)
+            emit(closing)
+
+            gzip_stream.close()
+            if compressor:
+                files['br'].write(compressor.finish())
+            for f in files.values():
+                f.flush()
+                os.fsync(f.fileno())
+                f.close()
+
+            digest = hasher.hexdigest()[:12]
+            filename = f'{lang}.{digest}.json'
+            sizes = {}
+            for encoding, tmp_path in paths.items():
+                suffix = {'identity': '', 'gzip': '.gz', 'br': '.br'}[encoding]
+                sizes[encoding] = os.path.getsize(tmp_path)
+                os.replace(tmp_path, self.output_dir / f'{filename}{suffix}')
+            paths.clear()
+        finally:
+            for f in files.values():
+                f.close()
+            for tmp_path in paths.values():
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
+        # Стабільний псевдонім для клієнтів без маніфесту
+        with open(self.output_dir / filename, 'rb') as f:
+            atomic_write_bytes(self.output_dir / f'{lang}.json', f.read())
+
+        return {'file': filename, 'hash': digest, 'bytes': sizes}
+
+    def _write_namespaces(self, lang, catalog):
+        namespace_dir = self.output_dir / lang
+        namespace_dir.mkdir(exist_ok=True)
+        files = {}
+        for namespace, translations in sorted(split_namespaces(catalog).items()):
+            if not namespace or namespace.startswith('.') or '/' in namespace or os.sep in namespace:
+                continue
+            if self.export_format == 'nested':
+                translations = convert_to_nested(translations)
+            self._write_json(namespace_dir / f'{namespace}.json', translations, pretty=not self.minify)
+            files[namespace] = f'{lang}/{namespace}.json'
+        return files
+
+    def _prune(self, lang, current):
+        """Видаляє старі хешовані версії мови, крім keep_versions останніх"""
+        versions = sorted(
+            (path for path in self.output_dir.glob(f'{lang}.*.json') if path.name != current),
+            key=lambda path: path.stat().st_mtime,
+            reverse=True,
+        )
+        for path in versions[self.keep_versions:]:
+            for suffix in ('', '.gz', '.br'):
+                try:
+                    os.unlink(f'{path}{suffix}')
+                except OSError:
+                    pass
+
+    def _write_metadata(self, manifest):
+        entries = manifest['languages']
+        metadata = {
+            'export_date': manifest['generated_at'],
+            'format': self.export_format,
+            'minified': self.minify,
+            'files': [
+                {
+                    'language': lang,
+                    'filename': entry['file'],
+                    'size_bytes': entry['bytes']['identity'],
+                    'compressed_bytes': {
+                        encoding: size for encoding, size in entry['bytes'].items() if encoding != 'identity'
+                    },
+                    'translation_count': entry['count'],
+                    'namespaces': entry.get('namespaces', {}),
+                }
+                for lang, entry in sorted(entries.items())
+            ],
+            'total_files': len(entries),
+            'total_translations': sum(entry['count'] for entry in entries.values()),
+            'languages': dict(settings.LANGUAGES),
+        }
+        self._write_json(self.output_dir / METADATA_NAME, metadata)
+
+    @staticmethod
+    def _write_json(path, data, pretty=True):
+        if pretty:
+            content = json.dumps(data, ensure_ascii=False, indent=2)
+        else:
+            content = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        atomic_write_bytes(path, content.encode('utf-8'))
+
+
+class BackgroundExport:
+    """
+    Фоновий експорт (webhook не чекає на запис файлів). Запити, що
+    прийшли до старту вже запланованого експорту, зливаються з ним
+    """
+
+    _executor = None
+    _executor_lock = threading.Lock()
+    _scheduled = set()
+
+    @classmethod
+    def _get_executor(cls):
+        if cls._executor is None:
+            with cls._executor_lock:
+                if cls._executor is None:
+                    cls._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='translation-export')
+        return cls._executor
+
+    @classmethod
+    def submit(cls, output_dir, **options):
+        """Планує експорт у output_dir; False - такий експорт уже в черзі"""
+        key = str(output_dir)
+        with cls._executor_lock:
+            if key in cls._scheduled:
+                return False
+            cls._scheduled.add(key)
+
+        def run():
+            # Зміни під час експорту запланують наступний
+            with cls._executor_lock:
+                cls._scheduled.discard(key)
+            try:
+                TranslationExporter(output_dir, **options).export()
+            except Exception as e:
+                logger.error(f"Background translation export failed: {e}")
+            finally:
+                connections.close_all()
+
+        cls._get_executor().submit(run)
+        return True
@@ -0,0 +1,188 @@
+# backend/apps/api/translation_search.py
+"""
+Індекс пошуку перекладів у пам'яті воркера: триграми для підрядків,
+відсортований словник токенів для коротких (префіксних) запитів
+"""
+from bisect import bisect_left
+from collections import defaultdict
+from django.conf import settings
+import heapq
+import re
+import unicodedata
+
+from .utils.translations import translation_l1
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def normalize(text):
+    """Нормалізований текст для порівняння: NFKC + casefold"""
+    return unicodedata.normalize('NFKC', str(text)).casefold()
+
+
+def flatten(translations, prefix=''):
+    """Вкладені секції JSON -> плоскі ключі через крапку"""
+    flat = {}
+    for key, value in translations.items():
+        full_key = f'{prefix}{key}'
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{full_key}.'))
+        else:
+            flat[full_key] = '' if value is None else str(value)
+    return flat
+
+
+class TranslationSearchIndex:
+    """
+    Незмінний індекс каталогу однієї версії бандла.
+
+    Запит від NGRAM символів: перетин списків триграм дає кандидатів,
+    які перевіряються на входження підрядка. Коротший запит шукається
+    як префікс токена ключа або значення. Результати ранжуються:
+    точний ключ > префікс ключа > токен ключа > значення.
+    """
+
+    NGRAM = 3
+
+    # Ваги збігів (більше - вище в результатах)
+    SCORE_KEY_EXACT = 100
+    SCORE_KEY_PREFIX = 80
+    SCORE_KEY_TOKEN = 60
+    SCORE_VALUE_EXACT = 50
+    SCORE_VALUE_TOKEN = 40
+    SCORE_KEY_CONTAINS = 30
+    SCORE_VALUE_CONTAINS = 20
+
+    def __init__(self, translations, version=None):
+        self.version = version
+        translations = flatten(translations)
+        self._keys = list(translations)
+        self._values = [translations[key] for key in self._keys]
+        self._norm_keys = [normalize(key) for key in self._keys]
+        self._norm_values = [normalize(value) for value in self._values]
+
+        ngrams = defaultdict(set)
+        tokens = defaultdict(set)
+        for doc_id, (key, value) in enumerate(zip(self._norm_keys, self._norm_values)):
+            for text in (key, value):
+                for gram in {text[i:i + self.NGRAM] for i in range(len(text) - self.NGRAM + 1)}:
+                    ngrams[gram].add(doc_id)
+                for token in set(_TOKEN_RE.findall(text)):
+                    tokens[token].add(doc_id)
+
+        self._ngrams = dict(ngrams)
+        self._tokens = sorted(tokens)
+        self._token_docs = [tokens[token] for token in self._tokens]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _candidates(self, query):
+        if len(query) >= self.NGRAM:
+            grams = {query[i:i + self.NGRAM] for i in range(len(query) - self.NGRAM + 1)}
+            postings = sorted((self._ngrams.get(gram, set()) for gram in grams), key=len)
+            return set.intersection(*postings) if postings[0] else set()
+
+        candidates = set()
+        start = bisect_left(self._tokens, query)
+        for token, docs in zip(self._tokens[start:], self._token_docs[start:]):
+            if not token.startswith(query):
+                break
+            candidates |= docs
+        return candidates
+
+    def _score(self, doc_id, query, word_start):
+        key = self._norm_keys[doc_id]
+        value = self._norm_values[doc_id]
+        if key == query:
+            return self.SCORE_KEY_EXACT
+        if key.startswith(query):
+            return self.SCORE_KEY_PREFIX
+        if word_start.search(key):
+            return self.SCORE_KEY_TOKEN
+        if value == query:
+            return self.SCORE_VALUE_EXACT
+        if word_start.search(value):
+            return self.SCORE_VALUE_TOKEN
+        if len(query) < self.NGRAM:
+            return 0
+        if query in key:
+            return self.SCORE_KEY_CONTAINS
+        if query in value:
+            return self.SCORE_VALUE_CONTAINS
+        return 0
+
+    def search(self, query, limit=None, offset=0):
+        """
+        Ранжований пошук: (total, [(key, value, score), ...]).
+        limit/offset - сторінка результатів (limit=None - всі)
+        """
+        query = normalize(query).strip()
+        if not query:
+            return 0, []
+
+        # Початок токена: перед запитом немає символу слова
+        word_start = re.compile(r'(?<!\w)' + re.escape(query))
+        matches = []
+        for doc_id in self._candidates(query):
+            score = self._score(doc_id, query, word_start)
+            if score:
+                matches.append((-score, self._keys[doc_id], doc_id))
+
+        if limit is None:
+            ranked = sorted(matches)[offset:]
+        else:
+            ranked = heapq.nsmallest(offset + limit, matches)[offset:]
+
+        return len(matches), [
+            (key, self._values[doc_id], -negative_score)
+            for negative_score, key, doc_id in ranked
+        ]
+
+
+class TranslationSearch:
+    """Індекси пошуку за мовою; перебудовуються лише при зміні хешу бандла"""
+
+    @staticmethod
+    def get_settings():
+        translation_settings = getattr(settings, 'TRANSLATION_CACHE_SETTINGS', {})
+        return {
+            'page_size': translation_settings.get('SEARCH_PAGE_SIZE', 20),
+            'max_page_size': translation_settings.get('SEARCH_MAX_PAGE_SIZE', 100),
+        }
+
+    @staticmethod
+    def get_index(lang):
+        from .translation_bundles import TranslationBundles
+
+        bundle = TranslationBundles.get(lang)
+
+        def build():
+            # Динамічні переклади перекривають статичні, як у /all/
+            catalog = {**flatten(bundle.sections['static']), **bundle.sections['dynamic']}
+            return TranslationSearchIndex(catalog, version=bundle.hash)
+
+        return translation_l1.get_or_load(('search', lang, bundle.hash), build)
+
+    @classmethod
+    def search(cls, lang, query, page=1, page_size=None):
+        """Сторінка результатів пошуку з метаданими пагінації"""
+        search_settings = cls.get_settings()
+        page_size = max(1, min(page_size or search_settings['page_size'], search_settings['max_page_size']))
+        page = max(page, 1)
+
+        index = cls.get_index(lang)
+        total, results = index.search(query, limit=page_size, offset=(page - 1) * page_size)
+        return {
+            'query': query,
+            'language': lang,
+            'version': index.version,
+            'results': [
+                {'key': key, 'value': value, 'score': score}
+                for key, value, score in results
+            ],
+            'count': total,
+            'page': page,
+            'page_size': page_size,
+            'has_next': page * page_size < total,
+        }
@@ -0,0 +1,280 @@
+# backend/apps/api/translation_validation.py
+"""
+Інкрементальна валідація статичних перекладів: кожна мова читається
+один раз, результати перевірок ключа кешуються за хешем значення,
+мови перевіряються паралельно в окремих процесах
+"""
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+
+from .utils.translation_store import TranslationStore, atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+# Змінюється разом із логікою перевірок - старий кеш стає недійсним
+CHECKS_VERSION = 1
+
+# Значення коротші за це не вважаються дублікатами ("Так", "Ні")
+MIN_DUPLICATE_LENGTH = 4
+
+# {{name}}, {name}, %(name)s, %name% - одним проходом
+_PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}|\{(\w+)\}|%\((\w+)\)s|%(\w+)%')
+
+
+def value_hash(value):
+    return hashlib.blake2b(value.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def extract_placeholders(text):
+    """Відсортовані імена плейсхолдерів у тексті"""
+    if '{' not in text and '%' not in text:
+        return []
+    return sorted({
+        next(group for group in match.groups() if group)
+        for match in _PLACEHOLDER_RE.finditer(text)
+    })
+
+
+class _ValidationParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.errors = []
+
+    def error(self, message):
+        self.errors.append(message)
+
+
+def is_valid_html_snippet(text):
+    """Перевіряє чи є HTML фрагмент валідним"""
+    try:
+        parser = _ValidationParser()
+        parser.feed(f'<div>{text}</div>')
+        return not parser.errors
+    except Exception:
+        return False
+
+
+def check_value(key, value):
+    """
+    Перевірки, що залежать лише від ключа та значення:
+    (проблеми форматування, порожнє, плейсхолдери)
+    """
+    issues = []
+    if '<' in value and '>' in value and not is_valid_html_snippet(value):
+        issues.append('invalid_html')
+    if key.endswith(('.title', '.heading')) and value.endswith('.'):
+        issues.append('title_with_period')
+    if value.strip() != value:
+        issues.append('whitespace_padding')
+    return issues, not value.strip(), extract_placeholders(value)
+
+
+def are_related_keys(keys):
+    """Ключі пов'язані, якщо хоча б два з них мають спільну частину"""
+    if len(keys) < 2:
+        return True
+    seen = set()
+    for key in keys:
+        parts = set(key.split('.'))
+        if not parts.isdisjoint(seen):
+            return True
+        seen |= parts
+    return False
+
+
+def find_duplicates(translations, hashes):
+    """
+    Дублікати значень: ключі групуються за хешем значення (O(n)),
+    а не попарним порівнянням; {значення: [ключі]}
+    """
+    buckets = defaultdict(list)
+    for key, value in translations.items():
+        if len(value) >= MIN_DUPLICATE_LENGTH:
+            buckets[hashes[key]].append(key)
+
+    duplicates = {}
+    for keys in buckets.values():
+        if len(keys) < 2:
+            continue
+        # Колізія хешу не дає хибного дубліката
+        by_value = defaultdict(list)
+        for key in keys:
+            by_value[translations[key]].append(key)
+        for value, same_keys in by_value.items():
+            if len(same_keys) > 1 and not are_related_keys(same_keys):
+                duplicates[value] = sorted(same_keys)
+    return duplicates
+
+
+def _read_cache(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cached.get('checks_version') != CHECKS_VERSION:
+        return {}
+    return cached
+
+
+def validate_language(language, directory, cache_dir=None):
+    """
+    Перевіряє одну мову (виконується у процесі пулу). Кеш:
+    {cache_dir}/{language}.json з результатами по ключах; якщо версія
+    сховища та файл не змінились - хеші не перераховуються взагалі,
+    інакше перевіряються лише ключі зі зміненим значенням
+    """
+    started = time.perf_counter()
+    store = TranslationStore(language, Path(directory))
+    version = store.get_version()
+    try:
+        stat = os.stat(store.path)
+        fingerprint = [version, stat.st_mtime_ns, stat.st_size]
+    except OSError:
+        fingerprint = [version, 0, 0]
+    translations = {
+        key: '' if value is None else str(value)
+        for key, value in store.read().items()
+    }
+
+    cache_path = Path(cache_dir) / f'{language}.json' if cache_dir else None
+    cached = _read_cache(cache_path) if cache_path else {}
+    cached_entries = cached.get('entries', {})
+    unchanged_source = cached.get('fingerprint') == fingerprint
+
+    entries = {}
+    checked = 0
+    for key, value in translations.items():
+        entry = cached_entries.get(key)
+        if entry is not None and unchanged_source:
+            entries[key] = entry
+            continue
+        digest = value_hash(value)
+        if entry is None or entry[0] != digest:
+            entry = [digest, *check_value(key, value)]
+            checked += 1
+        entries[key] = entry
+
+    # Дублікати залежать від усього каталогу - перераховуються лише при змінах
+    if unchanged_source and 'duplicates' in cached:
+        duplicates = cached['duplicates']
+    else:
+        duplicates = find_duplicates(translations, {key: entry[0] for key, entry in entries.items()})
+
+    if cache_path and not (unchanged_source and 'duplicates' in cached):
+        try:
+            os.makedirs(cache_path.parent, exist_ok=True)
+            atomic_write_bytes(cache_path, json.dumps({
+                'checks_version': CHECKS_VERSION,
+                'fingerprint': fingerprint,
+                'entries': entries,
+                'duplicates': duplicates,
+            }, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Failed to write validation cache {cache_path}: {e}")
+
+    formatting = []
+    empty = []
+    placeholders = {}
+    for key, (_, issues, is_empty, key_placeholders) in entries.items():
+        for issue in issues:
+            formatting.append({'key': key, 'issue': issue, 'value': translations[key]})
+        if is_empty:
+            empty.append(key)
+        if key_placeholders:
+            placeholders[key] = key_placeholders
+
+    return {
+        'language': language,
+        'version': version,
+        'keys': list(translations),
+        'formatting': formatting,
+        'empty': empty,
+        'placeholders': placeholders,
+        'duplicates': duplicates,
+        'stats': {
+            'total': len(translations),
+            'checked': checked,
+            'cached': len(translations) - checked,
+            'duration_ms': round((time.perf_counter() - started) * 1000, 1),
+        },
+    }
+
+
+class TranslationValidator:
+    """
+    Валідація всіх мов: перевірки мов паралельно (ProcessPoolExecutor),
+    міжмовні перевірки (відсутні ключі, плейсхолдери) - у батьківському
+    процесі за вже зібраними результатами
+    """
+
+    def __init__(self, languages=None, directory=None, cache_dir=None, workers=None, use_cache=True):
+        from django.conf import settings
+
+        self.languages = languages or [code for code, _ in settings.LANGUAGES]
+        self.directory = Path(directory or TranslationStore(self.languages[0]).directory)
+        self.cache_dir = (cache_dir or self.directory / '.validation') if use_cache else None
+        self.workers = min(workers or os.cpu_count() or 1, len(self.languages))
+
+    def _validate_languages(self):
+        args = [(lang, str(self.directory), self.cache_dir and str(self.cache_dir)) for lang in self.languages]
+        if self.workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                    return list(executor.map(validate_language, *zip(*args)))
+            except (OSError, NotImplementedError) as e:
+                # Немає підтримки процесів (обмежене середовище) - послідовно
+                logger.warning(f"Process pool unavailable, validating sequentially: {e}")
+        return [validate_language(*arguments) for arguments in args]
+
+    def run(self):
+        """Звіт валідації у форматі команди validate_translations + timings"""
+        started = time.perf_counter()
+        results = {result['language']: result for result in self._validate_languages()}
+        languages_done = time.perf_counter()
+
+        key_sets = {lang: set(result['keys']) for lang, result in results.items()}
+        all_keys = set().union(*key_sets.values())
+        missing = {
+            lang: sorted(all_keys - keys)
+            for lang, keys in key_sets.items()
+            if len(keys) < len(all_keys)
+        }
+
+        placeholder_issues = {}
+        placeholder_keys = set().union(*(result['placeholders'] for result in results.values()))
+        for key in sorted(placeholder_keys):
+            lang_placeholders = {
+                lang: result['placeholders'][key]
+                for lang, result in results.items()
+                if key in result['placeholders']
+            }
+            if len({tuple(placeholders) for placeholders in lang_placeholders.values()}) > 1:
+                placeholder_issues[key] = lang_placeholders
+
+        finished = time.perf_counter()
+        return {
+            'missing_translations': missing,
+            'inconsistent_keys': [],
+            'formatting_issues': {lang: r['formatting'] for lang, r in results.items() if r['formatting']},
+            'duplicate_values': {lang: r['duplicates'] for lang, r in results.items() if r['duplicates']},
+            'empty_translations': {lang: r['empty'] for lang, r in results.items() if r['empty']},
+            'placeholder_issues': placeholder_issues,
+            'timings': {
+                'total_ms': round((finished - started) * 1000, 1),
+                'languages_ms': round((languages_done - started) * 1000, 1),
+                'cross_language_ms': round((finished - languages_done) * 1000, 1),
+                'workers': self.workers,
+                'languages': {
+                    lang: {'version': r['version'], **r['stats']} for lang, r in results.items()
+                },
+            },
+        }
@@ -10,6 +10,12 @@ from django.utils.decorators import method_decorator
 from django.utils import translation
 import logging
 
+from .cache_utils import CacheRegistry
+from .dynamic_translations import DynamicTranslationLoader
+from .plain_text import strip_html
+from .translation_search import TranslationSearch
+from .utils.translations import TranslationUtils
+
 logger = logging.getLogger(__name__)
 
 class TranslationsAPIView(View):
@@ -22,19 +28,13 @@ class TranslationsAPIView(View):
             if lang not in available_languages:
                 lang = settings.LANGUAGE_CODE
             
-            # Спробуємо отримати з кешу
-            cache_key = f'static_translations_{lang}'
-            translations = cache.get(cache_key)
-            
-            if translations is None:
-                # Завантажуємо з файлу
-                translations = self.load_static_translations(lang)
-                
-                # Зберігаємо в кеш на 30 хвилин (тільки дані, не JsonResponse)
-                cache.set(cache_key, translations, 60 * 30)
-                logger.info(f"Loaded translations for {lang} from file")
-            else:
-                logger.info(f"Loaded translations for {lang} from cache")
+            # З кешу або з файлу (тільки дані, не JsonResponse)
+            version, _ = TranslationUtils.get_version(lang)
+            translations = CacheRegistry.get('static_translations').get_or_set(
+                lambda: self.load_static_translations(lang),
+                language=lang,
+                version=version,
+            )
             
             return JsonResponse({
                 'language': lang,
@@ -119,19 +119,11 @@ class DynamicTranslationsAPIView(View):
     
     def get(self, request, lang='uk'):
         try:
-            # Спробуємо отримати з кешу
-            cache_key = f'dynamic_translations_{lang}'
-            translations = cache.get(cache_key)
-            
-            if translations is None:
-                # Завантажуємо з моделей
-                translations = self.load_dynamic_translations(lang)
-                
-                # Зберігаємо в кеш на 15 хвилин
-                cache.set(cache_key, translations, 60 * 15)
-                logger.info(f"Loaded dynamic translations for {lang} from models")
-            else:
-                logger.info(f"Loaded dynamic translations for {lang} from cache")
+            # З кешу або з моделей
+            translations = CacheRegistry.get('dynamic_translations').get_or_set(
+                lambda: self.load_dynamic_translations(lang),
+                language=lang,
+            )
             
             return JsonResponse({
                 'language': lang,
@@ -150,92 +142,16 @@ class DynamicTranslationsAPIView(View):
             }, status=500)
     
     def load_dynamic_translations(self, lang):
-        """Завантажує переклади з Django моделей"""
-        dynamic_translations = {}
-        
+        """Завантажує переклади з полів моделей (реєстр modeltranslation)"""
         try:
-            # Переклади послуг
-            try:
-                from apps.services.models import Service
-                services = Service.objects.filter(is_active=True)
-                
-                for service in services:
-                    if hasattr(service, f'title_{lang}'):
-                        title = getattr(service, f'title_{lang}', None)
-                        if title:
-                            dynamic_translations[f'service.{service.id}.title'] = title
-                    
-                    if hasattr(service, f'description_{lang}'):
-                        desc = getattr(service, f'description_{lang}', None)
-                        if desc:
-                            dynamic_translations[f'service.{service.id}.description'] = desc
-                            
-            except ImportError:
-                logger.warning("Services app not found")
-            except Exception as e:
-                logger.warning(f"Error loading services translations: {e}")
-            
-            # Переклади проектів
-            try:
-                from apps.projects.models import Project
-                projects = Project.objects.filter(is_active=True)
-                
-                for project in projects:
-                    if hasattr(project, f'title_{lang}'):
-                        title = getattr(project, f'title_{lang}', None)
-                        if title:
-                            dynamic_translations[f'project.{project.id}.title'] = title
-                            
-            except ImportError:
-                logger.warning("Projects app not found")
-            except Exception as e:
-                logger.warning(f"Error loading projects translations: {e}")
-            
-            # Переклади контенту
-            try:
-                from apps.content.models import HomePage, AboutPage
-                
-                # Головна сторінка
-                homepage = HomePage.objects.filter(is_active=True).first()
-                if homepage:
-                    if hasattr(homepage, f'company_description_{lang}'):
-                        desc = getattr(homepage, f'company_description_{lang}', None)
-                        if desc:
-                            # Очищаємо HTML теги для JSON
-                            clean_desc = self.clean_html(desc)
-                            dynamic_translations['homepage.company_description'] = clean_desc
-                
-                # Сторінка про нас
-                aboutpage = AboutPage.objects.filter(is_active=True).first()
-                if aboutpage:
-                    if hasattr(aboutpage, f'history_text_{lang}'):
-                        history = getattr(aboutpage, f'history_text_{lang}', None)
-                        if history:
-                            clean_history = self.clean_html(history)
-                            dynamic_translations['aboutpage.history_text'] = clean_history
-                            
-            except ImportError:
-                logger.warning("Content app not found")
-            except Exception as e:
-                logger.warning(f"Error loading content translations: {e}")
-                
+            return DynamicTranslationLoader.load(lang)
         except Exception as e:
             logger.error(f"Error getting model translations for {lang}: {e}")
-        
-        return dynamic_translations
+            return {}
     
     def clean_html(self, text):
         """Очищає HTML теги з тексту"""
-        if not text:
-            return ""
-        
-        try:
-            import re
-            # Простий спосіб очистки HTML
-            clean = re.compile('<.*?>')
-            return re.sub(clean, '', text).strip()
-        except:
-            return str(text)
+        return strip_html(text)
 
 class AllTranslationsAPIView(View):
     """API для всіх перекладів (статичні + динамічні)"""
@@ -284,7 +200,7 @@ class AllTranslationsAPIView(View):
             }, status=500)
 
 class TranslationSearchView(View):
-    """Пошук перекладів"""
+    """Пошук перекладів (індекс мови, ранжування, пагінація)"""
     
     def get(self, request, lang='uk'):
         try:
@@ -295,31 +211,19 @@ class TranslationSearchView(View):
                     'error': 'Query parameter "q" is required'
                 }, status=400)
             
-            # Отримуємо всі переклади
-            all_view = AllTranslationsAPIView()
-            all_response = all_view.get(request, lang)
-            
-            if all_response.status_code != 200:
-                return all_response
-            
-            all_data = json.loads(all_response.content)
-            translations = all_data.get('translations', {})
-            
-            # Пошук
-            results = {}
-            query_lower = query.lower()
+            available_languages = [code for code, name in settings.LANGUAGES]
+            if lang not in available_languages:
+                lang = settings.LANGUAGE_CODE
             
-            for key, value in translations.items():
-                if (query_lower in key.lower() or 
-                    query_lower in str(value).lower()):
-                    results[key] = value
+            try:
+                page = int(request.GET.get('page', 1))
+                page_size = int(request.GET['page_size']) if 'page_size' in request.GET else None
+            except ValueError:
+                return JsonResponse({
+                    'error': 'Parameters "page" and "page_size" must be integers'
+                }, status=400)
             
-            return JsonResponse({
-                'query': query,
-                'language': lang,
-                'results': results,
-                'count': len(results)
-            })
+            return JsonResponse(TranslationSearch.search(lang, query, page=page, page_size=page_size))
             
         except Exception as e:
             logger.error(f"Error searching translations: {str(e)}")
@@ -44,8 +44,11 @@ from .views import (
     APIHealthCheckView,
     CacheManagementView,
     TranslationsAPIView,
-    AllTranslationsAPIView
+    AllTranslationsAPIView,
+    TranslationVersionsAPIView,
+    TranslationNamespaceAPIView
 )
+from .translations import TranslationSearchView
 
 # ============================= РОУТЕР =============================
 
@@ -130,6 +133,11 @@ def api_root(request):
             'cache_management': f'{base_url}cache/',
             'translations': f'{base_url}translations/{{lang}}/',
             'all_translations': f'{base_url}translations/{{lang}}/all/',
+            'translation_versions': f'{base_url}translations/versions/',
+            'translation_delta': f'{base_url}translations/{{lang}}/?since={{version}}',
+            'translation_namespaces': f'{base_url}translations/{{lang}}/?ns={{namespace}},{{namespace}}',
+            'translation_namespace': f'{base_url}translations/{{lang}}/ns/{{namespace}}/',
+            'translation_search': f'{base_url}translations/{{lang}}/search/?q=',
         }
     }
     
@@ -171,9 +179,12 @@ urlpatterns = [
     # =============== ДОДАТКОВІ API VIEWS ===============
     # Тільки унікальні endpoints без дублювання
     
-    # Переклади
+    # Переклади (versions/ - до <lang>/, інакше збігся б як мова)
+    path('translations/versions/', TranslationVersionsAPIView.as_view(), name='translations-versions'),
     path('translations/<str:lang>/', TranslationsAPIView.as_view(), name='translations'),
     path('translations/<str:lang>/all/', AllTranslationsAPIView.as_view(), name='translations-all'),
+    path('translations/<str:lang>/ns/<str:namespace>/', TranslationNamespaceAPIView.as_view(), name='translations-namespace'),
+    path('translations/<str:lang>/search/', TranslationSearchView.as_view(), name='translations-search'),
     
     # Утилітарні endpoints
     path('health/', APIHealthCheckView.as_view(), name='api-health'),
@@ -237,6 +248,11 @@ if settings.DEBUG:
 - DELETE /api/v1/cache/                       # Очищення кешу
 - GET    /api/v1/translations/{lang}/         # Переклади для мови
 - GET    /api/v1/translations/{lang}/all/     # Всі переклади для мови
+- GET    /api/v1/translations/versions/       # Хеші бандлів перекладів усіх мов
+- GET    /api/v1/translations/{lang}/?since=  # Зміни перекладів після версії
+- GET    /api/v1/translations/{lang}/?ns=     # Лише вказані простори імен (nav,forms)
+- GET    /api/v1/translations/{lang}/ns/{ns}/ # Один простір імен перекладів
+- GET    /api/v1/translations/{lang}/search/  # Пошук перекладів (?q=, page, page_size)
 
 🔧 ОПТИМІЗАЦІЇ:
 ✅ Видалено дублюючі endpoints:
@@ -0,0 +1,220 @@
+# backend/apps/api/utils/translation_store.py
+"""
+Файлове сховище статичних перекладів ({lang}.json): атомарний запис,
+міжпроцесне блокування та пакетні зміни з одним записом на пакет
+"""
+from contextlib import contextmanager
+from django.conf import settings
+import json
+import logging
+import os
+import tempfile
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def file_lock(path):
+    """Ексклюзивний advisory-лок на файлі path (між процесами та потоками)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'a+b') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def atomic_write_bytes(path, content):
+    """Записує файл атомарно: тимчасовий файл у тій самій директорії + os.replace"""
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class TranslationBatch:
+    """
+    Накопичені зміни мови (write-ahead): застосовуються одним записом
+    при виході з with-блоку. Після commit: removed - фактично видалені ключі
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.updates = {}
+        self.deletes = set()
+        self.removed = set()
+        self.committed = False
+
+    def set(self, key, value):
+        self.deletes.discard(key)
+        self.updates[key] = value
+
+    def update(self, translations):
+        self.deletes.difference_update(translations)
+        self.updates.update(translations)
+
+    def delete(self, key):
+        self.updates.pop(key, None)
+        self.deletes.add(key)
+
+    def __len__(self):
+        return len(self.updates) + len(self.deletes)
+
+    def apply(self, translations):
+        """Застосовує зміни до поточного вмісту, True - якщо вміст змінився"""
+        changed = False
+        for key, value in self.updates.items():
+            if translations.get(key, object()) != value:
+                translations[key] = value
+                changed = True
+        for key in self.deletes:
+            if key in translations:
+                del translations[key]
+                self.removed.add(key)
+                changed = True
+        return changed
+
+
+class TranslationStore:
+    """
+    Сховище перекладів однієї мови.
+
+    Запис іде у тимчасовий файл у тій самій директорії і замінює
+    {lang}.json через os.replace, тож читачі бачать або старий, або
+    новий файл цілком. Зміни виконуються під файловим локом
+    ({lang}.json.lock): пакет перечитує файл під локом, тому паралельні
+    записи з адмінки та webhook-ів не губляться. Кожен запис збільшує
+    лічильник версії ({lang}.version), що входить у версію перекладів.
+    """
+
+    _local = threading.local()
+
+    def __init__(self, language, directory=None):
+        self.language = language
+        self.directory = directory or getattr(
+            settings, 'STATIC_TRANSLATIONS_DIR', settings.BASE_DIR / 'static_translations'
+        )
+        self.path = self.directory / f'{language}.json'
+        self.lock_path = self.directory / f'{language}.json.lock'
+        self.version_path = self.directory / f'{language}.version'
+
+    def read(self, strict=False):
+        """
+        Поточні переклади ({} - файлу немає). Пошкоджений файл дає {},
+        а з strict=True - виняток, щоб запис не затер його вміст
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, IOError) as e:
+            logger.error(f"Error loading translations from {self.path}: {e}")
+            if strict:
+                raise
+            return {}
+
+    def get_version(self):
+        """Лічильник записів мови (0 - записів ще не було)"""
+        try:
+            with open(self.version_path, 'r', encoding='utf-8') as f:
+                return int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def lock(self):
+        """Ексклюзивний файловий лок мови (між процесами та потоками)"""
+        return file_lock(self.lock_path)
+
+    def _atomic_write(self, path, content):
+        atomic_write_bytes(path, content.encode('utf-8'))
+
+    def _write_locked(self, translations):
+        content = json.dumps(translations, ensure_ascii=False, indent=2, sort_keys=True)
+        self._atomic_write(self.path, content)
+        version = self.get_version() + 1
+        self._atomic_write(self.version_path, str(version))
+        return version
+
+    def _notify(self):
+        from .translations import TranslationUtils
+        TranslationUtils.mark_changed(self.language)
+
+    def write(self, translations):
+        """Повністю замінює переклади мови одним атомарним записом"""
+        try:
+            with self.lock():
+                version = self._write_locked(translations)
+        except IOError as e:
+            logger.error(f"Error saving translations to {self.path}: {e}")
+            raise
+        self._notify()
+        return version
+
+    def commit(self, batch):
+        """Застосовує пакет змін: перечитати під локом, змінити, записати раз"""
+        if not len(batch):
+            return False
+        with self.lock():
+            translations = self.read(strict=True)
+            changed = batch.apply(translations)
+            batch.committed = True
+            if not changed:
+                return False
+            version = self._write_locked(translations)
+        logger.info(
+            f"Committed translation batch for {self.language}: "
+            f"{len(batch.updates)} set, {len(batch.removed)} removed (version {version})"
+        )
+        self._notify()
+        return True
+
+    @contextmanager
+    def batch(self):
+        """
+        Пакет змін мови. Вкладені пакети тієї ж мови в потоці
+        приєднуються до зовнішнього - запис один, при виході зовнішнього
+        """
+        active = getattr(self._local, 'batches', None)
+        if active is None:
+            active = self._local.batches = {}
+        key = str(self.path)
+
+        if key in active:
+            yield active[key]
+            return
+
+        batch = active[key] = TranslationBatch(self)
+        try:
+            yield batch
+        except BaseException:
+            del active[key]
+            raise
+        del active[key]
+        self.commit(batch)
@@ -1,14 +1,26 @@
 # backend/apps/api/utils/translations.py
-import json
+from collections.abc import Mapping
 import os
+from pathlib import Path
 from django.conf import settings
-from django.core.cache import cache
 from django.utils import translation
 from django import template
 import logging
 
+from apps.api.cache_utils import CacheGenerations, CacheRegistry, LocalCache
+from .translation_store import TranslationStore
+
 logger = logging.getLogger(__name__)
 
+_l1_settings = getattr(settings, 'TRANSLATION_CACHE_SETTINGS', {})
+
+# L1 воркера для декодованих бандлів перекладів (ключ містить версію)
+translation_l1 = LocalCache(
+    max_entries=_l1_settings.get('L1_MAX_ENTRIES', 32),
+    poll_interval=_l1_settings.get('L1_VERSION_POLL_MS', 1000) / 1000.0,
+    family='translations_l1',
+)
+
 class TranslationUtils:
     """Утиліти для роботи з перекладами"""
     
@@ -18,89 +30,132 @@ class TranslationUtils:
         if lang is None:
             lang = translation.get_language() or settings.LANGUAGE_CODE
         
-        # Спробуємо з кешу
-        cache_key = f'static_translations_{lang}'
-        translations = cache.get(cache_key)
+        translations = TranslationUtils.get_bundle(lang)
+        return translations.get(key, default or key)
+    
+    @staticmethod
+    def get_bundle(lang):
+        """
+        Декодований словник статичних перекладів мови з L1 воркера.
+        Redis/файл читаються лише при зміні версії. Не змінюйте результат
+        """
+        version, _ = TranslationUtils.get_version(lang)
         
-        if translations is None:
-            # Завантажуємо з файлу
-            translations = TranslationUtils.load_translations(lang)
-            cache.set(cache_key, translations, 60 * 30)
+        def load():
+            # З Redis або з файлу (сімейство 'static_translations'). Версія
+            # в ключі: після зміни файлу поза додатком (деплой, ручне
+            # редагування) старий словник з Redis не потрапить у L1
+            return CacheRegistry.get('static_translations').get_or_set(
+                lambda: TranslationUtils.load_translations(lang),
+                language=lang,
+                version=version,
+            )
         
-        return translations.get(key, default or key)
+        return translation_l1.get_or_load(('static', lang, version), load)
+    
+    @staticmethod
+    def get_version(lang):
+        """
+        Дешева версія перекладів мови без читання файлу: покоління кешу +
+        mtime файлу, опитується не частіше L1_VERSION_POLL_MS.
+        Повертає (version, last_modified)
+        """
+        return translation_l1.poll(
+            f'translations:{lang}',
+            lambda: TranslationUtils._resolve_version(lang)
+        )
+    
+    @staticmethod
+    def _resolve_version(lang):
+        generation, changed_at = CacheGenerations.get_many_with_timestamps(
+            [f'translations:{lang}']
+        )[f'translations:{lang}']
+        mtime = max(
+            (TranslationUtils._mtime(path) for path in TranslationUtils.get_source_files(lang)),
+            default=0
+        )
+        # Лічильник сховища змінюється з кожним записом навіть у межах
+        # однієї одиниці mtime і без спільного кешу між процесами
+        store_version = TranslationStore(lang).get_version()
+        return f"{generation}:{store_version}:{mtime}", max(changed_at, mtime)
+    
+    @staticmethod
+    def get_source_files(lang):
+        """Файли, з яких збираються переклади мови (JSON та .mo каталоги)"""
+        static_dir = getattr(settings, 'STATIC_TRANSLATIONS_DIR', settings.BASE_DIR / 'static_translations')
+        files = [static_dir / f'{lang}.json']
+        for locale_path in getattr(settings, 'LOCALE_PATHS', []):
+            files.append(Path(locale_path) / lang / 'LC_MESSAGES' / 'django.mo')
+        return files
+    
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return 0
+    
+    @staticmethod
+    def mark_changed(lang):
+        """
+        Переклади мови змінено: інвалідація кешів та перезбирання бандла
+        (з записом у журнал змін) через чергу інвалідації
+        """
+        from apps.api.invalidation import invalidation_queue
+        invalidation_queue.mark_translations([lang])
+    
+    @staticmethod
+    def bump_version(lang):
+        """Позначає переклади мови зміненими (для ETag та кешів)"""
+        CacheGenerations.bump(f'translations:{lang}')
+        translation_l1.forget_version(f'translations:{lang}')
     
     @staticmethod
     def load_translations(lang):
         """Завантажує переклади з файлу"""
-        static_dir = getattr(settings, 'STATIC_TRANSLATIONS_DIR', settings.BASE_DIR / 'static_translations')
-        file_path = static_dir / f'{lang}.json'
-        
-        if file_path.exists():
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Error loading translations from {file_path}: {e}")
-                return {}
-        
-        return {}
+        return TranslationStore(lang).read()
+    
+    @staticmethod
+    def batch(lang):
+        """
+        Пакет змін перекладів мови: всі add/remove всередині with-блоку
+        записуються у файл один раз при виході
+        """
+        return TranslationStore(lang).batch()
     
     @staticmethod
     def add_translation(key, value, lang='uk'):
         """Додає новий переклад"""
-        translations = TranslationUtils.load_translations(lang)
-        translations[key] = value
-        
-        # Зберігаємо у файл
-        TranslationUtils.save_translations(translations, lang)
-        
-        # Очищаємо кеш
-        cache.delete(f'static_translations_{lang}')
+        with TranslationStore(lang).batch() as batch:
+            batch.set(key, value)
         
         logger.info(f"Added translation: {key} = {value} for {lang}")
     
     @staticmethod
     def bulk_add_translations(translations_dict, lang='uk'):
-        """Додає кілька перекладів одразу"""
-        existing = TranslationUtils.load_translations(lang)
-        existing.update(translations_dict)
-        
-        # Зберігаємо у файл
-        TranslationUtils.save_translations(existing, lang)
-        
-        # Очищаємо кеш
-        cache.delete(f'static_translations_{lang}')
+        """Додає кілька перекладів одразу (один запис файлу)"""
+        with TranslationStore(lang).batch() as batch:
+            batch.update(translations_dict)
         
         logger.info(f"Added {len(translations_dict)} translations for {lang}")
     
     @staticmethod
     def save_translations(translations, lang):
-        """Зберігає переклади у файл"""
-        static_dir = getattr(settings, 'STATIC_TRANSLATIONS_DIR', settings.BASE_DIR / 'static_translations')
-        os.makedirs(static_dir, exist_ok=True)
-        
-        file_path = static_dir / f'{lang}.json'
-        
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(translations, f, ensure_ascii=False, indent=2, sort_keys=True)
-        except IOError as e:
-            logger.error(f"Error saving translations to {file_path}: {e}")
-            raise
+        """Зберігає переклади у файл (атомарно, з інвалідацією кешу)"""
+        TranslationStore(lang).write(translations)
     
     @staticmethod
     def remove_translation(key, lang='uk'):
         """Видаляє переклад"""
-        translations = TranslationUtils.load_translations(lang)
+        store = TranslationStore(lang)
+        with store.batch() as batch:
+            batch.delete(key)
         
-        if key in translations:
-            del translations[key]
-            TranslationUtils.save_translations(translations, lang)
-            cache.delete(f'static_translations_{lang}')
+        # Усередині зовнішнього пакета видалення ще не записане
+        removed = key in batch.removed if batch.committed else key in store.read()
+        if removed:
             logger.info(f"Removed translation: {key} for {lang}")
-            return True
-        
-        return False
+        return removed
     
     @staticmethod
     def get_all_keys(lang='uk'):
@@ -109,18 +164,12 @@ class TranslationUtils:
         return list(translations.keys())
     
     @staticmethod
-    def search_translations(query, lang='uk'):
-        """Пошук перекладів за ключем або значенням"""
-        translations = TranslationUtils.load_translations(lang)
-        results = {}
+    def search_translations(query, lang='uk', limit=None):
+        """Пошук перекладів за ключем або значенням (ранжовано, через індекс мови)"""
+        from apps.api.translation_search import TranslationSearch
         
-        query = query.lower()
-        
-        for key, value in translations.items():
-            if query in key.lower() or query in value.lower():
-                results[key] = value
-        
-        return results
+        _, results = TranslationSearch.get_index(lang).search(query, limit=limit)
+        return {key: value for key, value, _ in results}
     
     @staticmethod
     def validate_translations():
@@ -153,26 +202,79 @@ class TranslationUtils:
         
         for lang, missing_keys in missing.items():
             if missing_keys:
-                translations = TranslationUtils.load_translations(lang)
-                
-                for key in missing_keys:
-                    # Використовуємо ключ як fallback значення
-                    translations[key] = f"[{lang.upper()}: {key}]"
-                    synced_count += 1
-                
-                TranslationUtils.save_translations(translations, lang)
-                cache.delete(f'static_translations_{lang}')
+                with TranslationStore(lang).batch() as batch:
+                    for key in missing_keys:
+                        # Використовуємо ключ як fallback значення
+                        batch.set(key, f"[{lang.upper()}: {key}]")
+                        synced_count += 1
         
         logger.info(f"Synced {synced_count} missing translation keys")
         return synced_count
 
+class RequestTranslations(Mapping):
+    """
+    Переклади мови для одного запиту/рендера: бандл з L1 береться один
+    раз при першому зверненні і далі кожен рядок - лише пошук у словнику.
+    Всі рядки рендера бачать одну версію перекладів
+    """
+    
+    def __init__(self, lang):
+        self.language = lang
+        self._catalog = None
+    
+    @property
+    def catalog(self):
+        if self._catalog is None:
+            self._catalog = TranslationUtils.get_bundle(self.language)
+        return self._catalog
+    
+    def __getitem__(self, key):
+        return self.catalog[key]
+    
+    def __iter__(self):
+        return iter(self.catalog)
+    
+    def __len__(self):
+        return len(self.catalog)
+    
+    def translate(self, key, default=None):
+        return self.catalog.get(key, default or key)
+
+
+def get_request_translations(request=None, lang=None, scope=None):
+    """
+    Переклади мови, закешовані на request (або на scope - наприклад,
+    render_context шаблону без запиту). Без обох - новий об'єкт
+    """
+    if lang is None:
+        lang = translation.get_language() or settings.LANGUAGE_CODE
+    
+    if request is not None:
+        accessors = getattr(request, '_translations', None)
+        if accessors is None:
+            accessors = request._translations = {}
+    elif scope is not None:
+        accessors = scope.get('_translations')
+        if accessors is None:
+            accessors = scope['_translations'] = {}
+    else:
+        return RequestTranslations(lang)
+    
+    if lang not in accessors:
+        accessors[lang] = RequestTranslations(lang)
+    return accessors[lang]
+
+
 # Template tags для використання в Django шаблонах
+# ({% load translations %}, див. apps/api/templatetags/translations.py)
 register = template.Library()
 
-@register.simple_tag
-def translate(key, lang=None):
-    """Template tag для перекладів"""
-    return TranslationUtils.get_translation(key, lang)
+@register.simple_tag(takes_context=True)
+def translate(context, key, lang=None):
+    """Template tag для перекладів (бандл резолвиться раз на запит/рендер)"""
+    return get_request_translations(
+        context.get('request'), lang, scope=context.render_context
+    ).translate(key)
 
 @register.filter
 def trans(key, lang=None):
@@ -191,11 +293,14 @@ def get_current_language():
 
 # Контекстний процесор для шаблонів
 def translations_context(request):
-    """Додає переклади в контекст всіх шаблонів"""
+    """
+    Додає переклади в контекст всіх шаблонів. 'translations' лінивий:
+    шаблон, що не звертається до нього, не читає нічого
+    """
     current_lang = translation.get_language() or settings.LANGUAGE_CODE
     
     return {
         'CURRENT_LANGUAGE': current_lang,
         'AVAILABLE_LANGUAGES': settings.LANGUAGES,
-        'translations': TranslationUtils.load_translations(current_lang),
-    }
\ No newline at end of file
+        'translations': get_request_translations(request, current_lang),
+    }
@@ -6,12 +6,19 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAdminUser
 from django.core.cache import cache
+from django.http import HttpResponse
 from django.conf import settings
 from django.utils import timezone
+from django.utils.cache import patch_vary_headers
 import json
 import logging
 from pathlib import Path
 
+from .cache_utils import CacheManager, CacheMetrics, CacheRegistry, get_redis_client
+from .mixins import make_etag, not_modified_response, add_validator_headers
+from .translation_bundles import TranslationBundles
+from .utils.translations import TranslationUtils, translation_l1
+
 logger = logging.getLogger(__name__)
 
 # ================== ДОПОМІЖНІ КЛАСИ ==================
@@ -45,8 +52,87 @@ class UnifiedAPIResponse:
 # ================== TRANSLATIONS ENDPOINTS ==================
 # Ці endpoints краще залишити як API Views для гнучкості
 
+def translation_bundle_response(request, lang, extended=False):
+    """
+    Готові байти бандла перекладів з ETag = хеш вмісту (або 304).
+    З ?ns=nav,forms - лише вказані простори імен,
+    з ?since=<version> - лише змінені ключі, якщо версія ще є в журналі
+    """
+    namespaces = request.GET.get('ns')
+    if namespaces and not extended:
+        names = [name.strip() for name in namespaces.split(',') if name.strip()]
+        return translation_namespace_response(request, lang, names)
+    
+    since = request.GET.get('since')
+    if since:
+        delta = TranslationBundles.get_delta(lang, since)
+        if delta is not None:
+            return translation_delta_response(request, lang, since, delta)
+    
+    bundle = TranslationBundles.get(lang)
+    _, last_modified = TranslationUtils.get_version(lang)
+    etag = f'"{bundle.hash}-extended"' if extended else bundle.etag
+    
+    not_modified = not_modified_response(request, etag, last_modified)
+    if not_modified is not None:
+        return not_modified
+    
+    body, encoding = bundle.get_body(request.META.get('HTTP_ACCEPT_ENCODING', ''), extended=extended)
+    response = HttpResponse(body, content_type='application/json')
+    if encoding:
+        response['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return add_validator_headers(response, etag, last_modified)
+
+
+def translation_namespace_response(request, lang, names):
+    """Простори імен бандла: кожен набір має власний ETag та готові тіла"""
+    bundle = TranslationBundles.get(lang)
+    known = sorted({name for name in names if name in bundle.namespaces})
+    if not known:
+        return Response(
+            UnifiedAPIResponse.error(
+                message="Простори імен перекладів не знайдено",
+                details={'namespaces': names, 'available': list(bundle.namespaces)}
+            ),
+            status=status.HTTP_404_NOT_FOUND
+        )
+    
+    etag = bundle.get_namespace_etag(known)
+    not_modified = not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    body, encoding = bundle.get_namespace_body(known, request.META.get('HTTP_ACCEPT_ENCODING', ''))
+    response = HttpResponse(body, content_type='application/json')
+    if encoding:
+        response['Content-Encoding'] = encoding
+    patch_vary_headers(response, ('Accept-Encoding',))
+    return add_validator_headers(response, etag)
+
+
+def translation_delta_response(request, lang, since, delta):
+    """Відповідь з ключами, доданими/зміненими/видаленими після версії since"""
+    etag = make_etag('translations-delta', lang, since, delta['version'])
+    not_modified = not_modified_response(request, etag)
+    if not_modified is not None:
+        return not_modified
+    
+    response = Response(UnifiedAPIResponse.success(
+        data={
+            'language': lang,
+            'delta': True,
+            'since': since,
+            'version': delta['version'],
+            'changes': delta['changes'],
+        },
+        message=f"Зміни перекладів для мови {lang} отримано"
+    ))
+    return add_validator_headers(response, etag)
+
+
 class TranslationsAPIView(APIView):
-    """API для отримання перекладів конкретної мови"""
+    """API для отримання перекладів конкретної мови (скомпільований бандл)"""
     permission_classes = []  # Public access for translations
     
     def get(self, request, lang='uk'):
@@ -56,25 +142,7 @@ class TranslationsAPIView(APIView):
             if lang not in available_languages:
                 lang = settings.LANGUAGE_CODE
             
-            cache_key = f'translations_{lang}'
-            translations = cache.get(cache_key)
-            
-            if not translations:
-                # Базові переклади
-                translations = self._load_translations(lang)
-                
-                # Кешуємо на 6 годин
-                cache.set(cache_key, translations, 21600)
-            
-            return Response(UnifiedAPIResponse.success(
-                data={
-                    'language': lang,
-                    'translations': translations,
-                    'count': len(translations),
-                    'available_languages': available_languages
-                },
-                message=f"Переклади для мови {lang} отримано"
-            ))
+            return translation_bundle_response(request, lang)
             
         except Exception as e:
             logger.error(f"Error in TranslationsAPIView: {str(e)}")
@@ -86,6 +154,10 @@ class TranslationsAPIView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    def get_translations(self, lang):
+        """Статичні переклади мови з поточного бандла"""
+        return TranslationBundles.get(lang).translations
+    
     def _load_translations(self, lang):
         """Завантажує переклади для мови"""
         
@@ -196,40 +268,41 @@ class TranslationsAPIView(APIView):
         return {}
 
 
+class TranslationNamespaceAPIView(APIView):
+    """Один простір імен перекладів за окремим URL (кешується CDN/браузером)"""
+    permission_classes = []
+    
+    def get(self, request, lang='uk', namespace=None):
+        try:
+            available_languages = [code for code, name in settings.LANGUAGES]
+            if lang not in available_languages:
+                lang = settings.LANGUAGE_CODE
+            
+            return translation_namespace_response(request, lang, [namespace])
+            
+        except Exception as e:
+            logger.error(f"Error in TranslationNamespaceAPIView: {str(e)}")
+            return Response(
+                UnifiedAPIResponse.error(
+                    message="Помилка при отриманні перекладів",
+                    details=str(e)
+                ),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class AllTranslationsAPIView(APIView):
     """API для отримання всіх перекладів мови (розширений формат)"""
     permission_classes = []  # Public access for translations
     
     def get(self, request, lang='uk'):
         try:
-            # Отримуємо базові переклади
-            base_view = TranslationsAPIView()
-            base_response = base_view.get(request, lang)
+            available_languages = [code for code, name in settings.LANGUAGES]
+            if lang not in available_languages:
+                lang = settings.LANGUAGE_CODE
             
-            if base_response.status_code == 200:
-                base_data = base_response.data['data']
-                base_translations = base_data['translations']
-                
-                # Додаємо метадані та статистику
-                extended_data = {
-                    **base_data,
-                    'meta': {
-                        'format': 'extended',
-                        'generated_at': timezone.now().isoformat(),
-                        'cache_ttl': 21600,  # 6 годин
-                        'sections': list(base_translations.keys()),
-                        'total_keys': sum(len(section) if isinstance(section, dict) else 1 
-                                        for section in base_translations.values()),
-                        'version': '1.0'
-                    }
-                }
-                
-                return Response(UnifiedAPIResponse.success(
-                    data=extended_data,
-                    message=f"Всі переклади для мови {lang} отримано"
-                ))
-            else:
-                return base_response
+            # Метадані та статистика рахуються один раз при збиранні бандла
+            return translation_bundle_response(request, lang, extended=True)
                 
         except Exception as e:
             logger.error(f"Error in AllTranslationsAPIView: {str(e)}")
@@ -242,6 +315,35 @@ class AllTranslationsAPIView(APIView):
             )
 
 
+class TranslationVersionsAPIView(APIView):
+    """Поточні хеші бандлів перекладів: клієнт завантажує бандл лише при зміні"""
+    permission_classes = []  # Public access for translations
+    
+    def get(self, request):
+        try:
+            versions = TranslationBundles.get_versions()
+            etag = make_etag('translation-versions', *sorted(versions.items()))
+            not_modified = not_modified_response(request, etag)
+            if not_modified is not None:
+                return not_modified
+            
+            response = Response(UnifiedAPIResponse.success(
+                data={'versions': versions},
+                message="Версії перекладів отримано"
+            ))
+            return add_validator_headers(response, etag)
+            
+        except Exception as e:
+            logger.error(f"Error in TranslationVersionsAPIView: {str(e)}")
+            return Response(
+                UnifiedAPIResponse.error(
+                    message="Помилка при отриманні версій перекладів",
+                    details=str(e)
+                ),
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 # ================== UTILITY ENDPOINTS ==================
 
 class APIHealthCheckView(APIView):
@@ -389,36 +491,32 @@ class APIHealthCheckView(APIView):
 
 
 class CacheManagementView(APIView):
-    """Управління кешем системи"""
+    """Управління кешем системи: сімейства з CacheRegistry та їх метрики"""
     permission_classes = [IsAdminUser]  # Only admin access for cache management
     
+    # Сімейства, які не очищуються без явного ?family=
+    PROTECTED_FAMILIES = ('generations', 'locks')
+    
     def get(self, request):
-        """Статистика кешу"""
+        """Статистика кешу по сімействах: ключі, hits/misses, час заповнення, розмір"""
         try:
-            # Ключі які зазвичай кешуються
-            known_cache_keys = [
-                'homepage_stats_1',
-                'api_general_stats',
-                'translations_uk',
-                'translations_en',
-                'featured_services',
-                'featured_projects'
-            ]
-            
-            cache_info = {}
-            active_keys = []
+            cache_stats = CacheManager.get_cache_stats()
+            metrics = CacheMetrics.snapshot()
             
-            for key in known_cache_keys:
-                if cache.get(key) is not None:
-                    active_keys.append(key)
-                    cache_info[key] = 'active'
-                else:
-                    cache_info[key] = 'empty'
+            families = {}
+            for family in CacheRegistry.all():
+                info = family.as_dict()
+                info['active_keys'] = cache_stats['prefixes'].get(family.name)
+                info['metrics'] = metrics.get(family.name, {})
+                families[family.name] = info
+            if metrics.get('other'):
+                families['other'] = {'metrics': metrics['other']}
             
             stats = {
                 'cache_backend': cache.__class__.__name__,
-                'known_keys': cache_info,
-                'active_keys_count': len(active_keys),
+                'memory_usage': cache_stats['memory_usage'],
+                'active_keys_count': cache_stats['active_keys'],
+                'families': families,
                 'last_cleared': cache.get('cache_last_cleared', 'never'),
                 'status': 'operational'
             }
@@ -439,30 +537,53 @@ class CacheManagementView(APIView):
             )
     
     def delete(self, request):
-        """Очищення кешу"""
+        """
+        Очищення кешу. ?family=translations&family=response - лише вказані
+        сімейства; ?reset_metrics=1 - також обнулити метрики
+        """
         try:
-            # Ключі для очищення
-            cache_keys_to_clear = [
-                'homepage_stats_1',
-                'api_general_stats',
-                'translations_uk', 
-                'translations_en',
-                'featured_services',
-                'featured_projects'
+            requested = [
+                name for value in request.query_params.getlist('family')
+                for name in value.split(',') if name
             ]
+            unknown = [name for name in requested if name not in CacheRegistry.names()]
+            if unknown:
+                return Response(
+                    UnifiedAPIResponse.error(message=f"Невідомі сімейства кешу: {', '.join(unknown)}"),
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            if requested:
+                families = [family for family in CacheRegistry.all() if family.name in requested]
+            else:
+                families = [
+                    family for family in CacheRegistry.all()
+                    if family.name not in self.PROTECTED_FAMILIES
+                ]
+            
+            cleared = {}
+            if get_redis_client() is not None:
+                for family in families:
+                    if family.pattern is not None:
+                        cleared[family.name] = CacheManager.clear_cache_by_pattern(family.pattern)
+            elif not requested:
+                # Без Redis очищення за шаблоном недоступне
+                cache.clear()
+            
+            if any('translations' in family.name for family in families):
+                translation_l1.clear()
             
-            cleared_count = 0
-            for key in cache_keys_to_clear:
-                if cache.delete(key):
-                    cleared_count += 1
+            if request.query_params.get('reset_metrics'):
+                CacheMetrics.reset([family.name for family in families])
             
             # Зберігаємо час очищення
             cache.set('cache_last_cleared', timezone.now().isoformat(), 86400)
+            cleared_count = sum(cleared.values())
             
             return Response(UnifiedAPIResponse.success(
                 data={
                     'cleared_keys': cleared_count,
-                    'total_attempted': len(cache_keys_to_clear),
+                    'families': cleared,
                     'cleared_at': timezone.now().isoformat()
                 },
                 message=f"Кеш очищено. Видалено {cleared_count} ключів"
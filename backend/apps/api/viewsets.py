@@ -8,12 +8,12 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
 from django_filters import rest_framework as django_filters
 from django_ratelimit.decorators import ratelimit
-from django.core.cache import cache
 from django.utils import timezone
 from django.utils.decorators import method_decorator
 from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiParameter
 from drf_spectacular.types import OpenApiTypes
 import logging
+import time
 
 # Імпорт моделей
 from apps.content.models import HomePage, AboutPage, TeamMember, Certificate, ProductionPhoto
@@ -41,6 +41,9 @@ from .serializers import (
     # Contact serializers
     OfficeSerializer, ContactInquirySerializer
 )
+from .site_stats import get_site_statistics
+from .mixins import BaseResponseCacheMixin, ResponseCacheMixin, SparseFieldsMixin
+from .pagination import KeysetPagination
 
 logger = logging.getLogger(__name__)
 
@@ -48,45 +51,49 @@ logger = logging.getLogger(__name__)
 # CONTENT VIEWSETS
 # ============================================================================
 
-class HomePageViewSet(viewsets.ReadOnlyModelViewSet):
+class HomePageViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для головної сторінки"""
     
     queryset = HomePage.objects.all()
     serializer_class = HomePageSerializer
     permission_classes = [AllowAny]
+    cache_response = True
+    response_cache_models = (TeamMember, Certificate, ProductionPhoto, Service, Project, ProjectCategory)
     
     def get_queryset(self):
-        """Оптимізований queryset з prefetch_related"""
-        return HomePage.objects.prefetch_related(
-            'teammember_set',
-            'certificate_set', 
-            'productionphoto_set'
-        ).all()
+        """
+        Оптимізований queryset: відфільтровані Prefetch(to_attr) для команди,
+        сертифікатів і фото - кількість запитів не залежить від їх кількості
+        """
+        return HomePage.objects.prefetch_related(*HomePageSerializer.get_prefetches())
 
 
-class AboutPageViewSet(viewsets.ReadOnlyModelViewSet):
+class AboutPageViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для сторінки 'Про нас'"""
     
     queryset = AboutPage.objects.filter(is_active=True)
     serializer_class = AboutPageSerializer
     permission_classes = [AllowAny]
+    cache_response = True
+    response_cache_models = (TeamMember, Certificate, ProductionPhoto)
     ordering = ['-updated_at', 'id']
     
     def get_queryset(self):
         """Оптимізований queryset з упорядкуванням"""
-        return AboutPage.objects.filter(is_active=True).prefetch_related(
-            'teammember_set',
-            'certificate_set',
-            'productionphoto_set'
-        ).order_by('-updated_at', 'id')
+        # Команда, сертифікати та фото - спільні для компанії, їх вантажить
+        # FeaturedContentLoader у серіалізаторі (AboutPage не має зв'язків)
+        return AboutPage.objects.filter(is_active=True).order_by('-updated_at', 'id')
 
 
-class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
+class TeamMemberViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для членів команди"""
     
-    queryset = TeamMember.objects.filter(is_active=True)
+    # homepage_title серіалізатора читає homepage - JOIN замість запиту на рядок
+    queryset = TeamMember.objects.filter(is_active=True).select_related('homepage')
     serializer_class = TeamMemberSerializer
     permission_classes = [AllowAny]
+    cache_response = True
+    response_cache_models = (HomePage,)
     filter_backends = [django_filters.DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['is_management', 'homepage']
     ordering_fields = ['order', 'name']
@@ -126,7 +133,7 @@ class TeamMemberViewSet(viewsets.ReadOnlyModelViewSet):
         tags=['Services']
     )
 )
-class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
+class ServiceViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """
     ViewSet для управління послугами компанії.
     
@@ -139,10 +146,13 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
     
     queryset = Service.objects.filter(is_active=True)
     permission_classes = [AllowAny]
+    cache_response = True
+    response_cache_models = (ServiceFeature,)
     throttle_classes = [AnonRateThrottle, UserRateThrottle]
     filter_backends = [django_filters.DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['is_featured', 'is_active']
-    search_fields = ['name', 'short_description', 'detailed_description']
+    # Пошук по тіньових текстових колонках, а не по HTML
+    search_fields = ['name', 'short_description_text', 'detailed_description_text']
     ordering_fields = ['order', 'name', 'created_at']
     ordering = ['order', 'name']
     
@@ -153,8 +163,11 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
         return ServiceListSerializer
     
     def get_queryset(self):
-        """Оптимізований queryset з prefetch для features"""
-        return Service.objects.filter(is_active=True).prefetch_related('features')
+        """Оптимізований queryset з prefetch для features (лише там, де вони серіалізуються)"""
+        queryset = Service.objects.filter(is_active=True)
+        if self.action in ('retrieve', 'features'):
+            queryset = queryset.prefetch_related('features')
+        return queryset
     
     @extend_schema(
         summary="Особливості послуги",
@@ -165,14 +178,18 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=True, methods=['get'])
     def features(self, request, pk=None):
         """Особливості конкретної послуги"""
+        return self.cached_response(self._features, request, pk=pk)
+    
+    def _features(self, request, pk=None):
         service = self.get_object()
-        features = service.features.all().order_by('order')
+        # Prefetch уже впорядкований за Meta.ordering - без повторного запиту
+        features = list(service.features.all())
         
         serializer = ServiceFeatureSerializer(features, many=True, context={'request': request})
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': features.count(),
+            'count': len(features),
             'message': f'Особливості послуги "{service.name}" отримано'
         })
 
@@ -181,47 +198,57 @@ class ServiceViewSet(viewsets.ReadOnlyModelViewSet):
 # PROJECT VIEWSETS
 # ============================================================================
 
-class ProjectCategoryViewSet(viewsets.ReadOnlyModelViewSet):
+class ProjectCategoryViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для категорій проєктів"""
     
     queryset = ProjectCategory.objects.filter(is_active=True)
     serializer_class = ProjectCategorySerializer
     permission_classes = [AllowAny]
+    cache_response = True
+    response_cache_models = (Project,)
+    pagination_class = KeysetPagination
     ordering = ['order', 'name']
     
     @action(detail=True, methods=['get'])
     def projects(self, request, pk=None):
         """Проєкти в категорії"""
+        return self.cached_response(self._projects, request, pk=pk)
+    
+    def _projects(self, request, pk=None):
         category = self.get_object()
         projects = Project.objects.filter(
             category=category, 
             is_active=True
-        ).order_by('-project_date')
+        ).select_related('category').order_by('-project_date')
         
         page = self.paginate_queryset(projects)
         if page is not None:
             serializer = ProjectListSerializer(page, many=True, context={'request': request})
             return self.get_paginated_response(serializer.data)
         
+        projects = list(projects)
         serializer = ProjectListSerializer(projects, many=True, context={'request': request})
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': projects.count(),
+            'count': len(projects),
             'message': f'Проєкти категорії "{category.name}" отримано'
         })
 
 
-class ProjectViewSet(viewsets.ReadOnlyModelViewSet):
+class ProjectViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для проєктів"""
     
     queryset = Project.objects.filter(is_active=True)
     permission_classes = [AllowAny]
+    cache_response = True
+    response_cache_models = (ProjectCategory, ProjectImage)
     filter_backends = [django_filters.DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['category', 'is_featured', 'is_active']
-    search_fields = ['title', 'short_description', 'client_name']
+    search_fields = ['title', 'short_description_text', 'client_name']
     ordering_fields = ['project_date', 'title', 'created_at']
     ordering = ['-project_date', 'title']
+    pagination_class = KeysetPagination
     lookup_field = 'slug'
     
     def get_serializer_class(self):
@@ -230,21 +257,25 @@ class ProjectViewSet(viewsets.ReadOnlyModelViewSet):
         return ProjectListSerializer
     
     def get_queryset(self):
-        return Project.objects.filter(is_active=True).select_related(
-            'category'
-        ).prefetch_related('images')
+        queryset = Project.objects.filter(is_active=True).select_related('category')
+        if self.action in ('retrieve', 'images'):
+            queryset = queryset.prefetch_related('images')
+        return queryset
     
     @action(detail=True, methods=['get'])
     def images(self, request, slug=None):
         """Зображення проєкту"""
+        return self.cached_response(self._images, request, slug=slug)
+    
+    def _images(self, request, slug=None):
         project = self.get_object()
-        images = project.images.all().order_by('order')
+        images = list(project.images.all())
         
         serializer = ProjectImageSerializer(images, many=True, context={'request': request})
         return Response({
             'success': True,
             'data': serializer.data,
-            'count': images.count(),
+            'count': len(images),
             'message': f'Зображення проєкту "{project.title}" отримано'
         })
 
@@ -253,16 +284,20 @@ class ProjectViewSet(viewsets.ReadOnlyModelViewSet):
 # JOB VIEWSETS
 # ============================================================================
 
-class JobPositionViewSet(viewsets.ReadOnlyModelViewSet):
+class JobPositionViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для вакансій"""
     
     queryset = JobPosition.objects.filter(is_active=True)
     permission_classes = [AllowAny]
+    cache_response = True
+    # Вакансії фільтруються за expires_at, тому TTL коротший
+    response_cache_timeout = 60 * 5
     filter_backends = [django_filters.DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     filterset_fields = ['employment_type', 'experience_required', 'is_urgent', 'location']
-    search_fields = ['title', 'description', 'requirements']
+    search_fields = ['title', 'description_text', 'requirements_text']
     ordering_fields = ['created_at', 'expires_at', 'title']
-    ordering = ['-is_urgent', '-created_at']
+    ordering = ['-is_urgent', '-created_at', 'id']
+    pagination_class = KeysetPagination
     lookup_field = 'slug'
     
     def get_serializer_class(self):
@@ -270,6 +305,14 @@ class JobPositionViewSet(viewsets.ReadOnlyModelViewSet):
             return JobPositionDetailSerializer
         return JobPositionListSerializer
     
+    def get_response_version_extra(self):
+        """Вакансії зникають за часом, тому версія змінюється кожні 5 хвилин"""
+        return str(int(time.time() // self.response_cache_timeout))
+    
+    def get_response_changed_at(self):
+        """Last-Modified не раніше початку поточного 5-хвилинного інтервалу"""
+        return int(time.time() // self.response_cache_timeout) * self.response_cache_timeout
+    
     def get_queryset(self):
         """Фільтрує активні вакансії, що не прострочили"""
         return JobPosition.objects.filter(
@@ -278,7 +321,7 @@ class JobPositionViewSet(viewsets.ReadOnlyModelViewSet):
         )
 
 
-class JobApplicationViewSet(viewsets.ModelViewSet):
+class JobApplicationViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """ViewSet для заявок на вакансії"""
     
     queryset = JobApplication.objects.all()
@@ -286,6 +329,8 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     http_method_names = ['post', 'get']
     ordering = ['-created_at', 'id']
+    # Таблиця росте необмежено - адмінка гортає курсором (?cursor=)
+    pagination_class = KeysetPagination
     
     def get_permissions(self):
         """Дозволи залежно від дії"""
@@ -316,44 +361,48 @@ class JobApplicationViewSet(viewsets.ModelViewSet):
         }, status=status.HTTP_400_BAD_REQUEST)
 
 
-class WorkplacePhotoViewSet(viewsets.ReadOnlyModelViewSet):
+class WorkplacePhotoViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для фотографій робочого місця"""
     
     queryset = WorkplacePhoto.objects.filter(is_active=True)
     serializer_class = WorkplacePhotoSerializer
     permission_classes = [AllowAny]
+    cache_response = True
     ordering = ['order', 'id']
+    pagination_class = KeysetPagination
 
 
 # ============================================================================
 # PARTNER VIEWSETS
 # ============================================================================
 
-class PartnershipInfoViewSet(viewsets.ReadOnlyModelViewSet):
+class PartnershipInfoViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для інформації про партнерство"""
     
     queryset = PartnershipInfo.objects.filter(is_active=True)
     serializer_class = PartnershipInfoSerializer
     permission_classes = [AllowAny]
+    cache_response = True
+    response_cache_models = (WorkStage,)
     ordering = ['-updated_at', 'id']
     
     def get_queryset(self):
         """Оптимізований queryset з упорядкуванням"""
-        return PartnershipInfo.objects.filter(is_active=True).prefetch_related(
-            'workstage_set'
-        ).order_by('-updated_at', 'id')
+        # Етапи роботи спільні для всіх записів - їх вантажить FeaturedContentLoader
+        return PartnershipInfo.objects.filter(is_active=True).order_by('-updated_at', 'id')
 
 
-class WorkStageViewSet(viewsets.ReadOnlyModelViewSet):
+class WorkStageViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для етапів роботи"""
     
     queryset = WorkStage.objects.all()
     serializer_class = WorkStageSerializer
     permission_classes = [AllowAny]
+    cache_response = True
     ordering = ['order', 'id']
 
 
-class PartnerInquiryViewSet(viewsets.ModelViewSet):
+class PartnerInquiryViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """ViewSet для запитів партнерів"""
     
     queryset = PartnerInquiry.objects.all()
@@ -361,6 +410,7 @@ class PartnerInquiryViewSet(viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     http_method_names = ['post', 'get']
     ordering = ['-created_at', 'id']
+    pagination_class = KeysetPagination
     
     def get_permissions(self):
         if self.action == 'create':
@@ -394,18 +444,19 @@ class PartnerInquiryViewSet(viewsets.ModelViewSet):
 # CONTACT VIEWSETS
 # ============================================================================
 
-class OfficeViewSet(viewsets.ReadOnlyModelViewSet):
+class OfficeViewSet(ResponseCacheMixin, SparseFieldsMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet для офісів"""
     
     queryset = Office.objects.filter(is_active=True)
     serializer_class = OfficeSerializer
     permission_classes = [AllowAny]
+    cache_response = True
     filter_backends = [django_filters.DjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['office_type', 'is_main']  # Виправлено: прибрано 'city'
     ordering = ['order', 'name']  # Виправлено: прибрано 'city'
 
 
-class ContactInquiryViewSet(viewsets.ModelViewSet):
+class ContactInquiryViewSet(SparseFieldsMixin, viewsets.ModelViewSet):
     """ViewSet для звернень клієнтів"""
     
     queryset = ContactInquiry.objects.all()
@@ -413,6 +464,7 @@ class ContactInquiryViewSet(viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     http_method_names = ['post', 'get']
     ordering = ['-created_at', 'id']
+    pagination_class = KeysetPagination
     
     def get_permissions(self):
         if self.action == 'create':
@@ -446,44 +498,42 @@ class ContactInquiryViewSet(viewsets.ModelViewSet):
 # ЦЕНТРАЛІЗОВАНИЙ VIEWSET ДЛЯ СТАТИСТИКИ ТА FEATURED CONTENT
 # ============================================================================
 
-class UnifiedContentViewSet(viewsets.ViewSet):
+class UnifiedContentViewSet(BaseResponseCacheMixin, viewsets.ViewSet):
     """Централізований ViewSet для статистики та featured контенту"""
     
     permission_classes = [AllowAny]
+    cache_response = True
+    response_cache_timeout = 1800  # 30 хвилин
+    response_cache_family = 'featured'
+    response_cache_models = (Service, Project, ProjectCategory, TeamMember, HomePage)
     
     @action(detail=False, methods=['get'])
     def stats(self, request):
         """Загальна статистика сайту"""
         try:
-            cache_key = 'unified_site_stats'
-            stats = cache.get(cache_key)
+            # Лічильники підтримуються при збереженні контенту (site_stats):
+            # один запит за pk, завжди актуально, без TTL кешу
+            stats = get_site_statistics()
             
-            if not stats:
-                stats = {
+            return Response({
+                'success': True,
+                'data': {
                     'general': {
-                        'total_services': Service.objects.filter(is_active=True).count(),
-                        'featured_services': Service.objects.filter(is_active=True, is_featured=True).count(),
-                        'total_projects': Project.objects.filter(is_active=True).count(),
-                        'featured_projects': Project.objects.filter(is_active=True, is_featured=True).count(),
-                        'active_jobs': JobPosition.objects.filter(
-                            is_active=True, 
-                            expires_at__gte=timezone.now()
-                        ).count(),
-                        'offices': Office.objects.filter(is_active=True).count(),
-                        'team_members': TeamMember.objects.filter(is_active=True).count(),
-                        'project_categories': ProjectCategory.objects.filter(is_active=True).count(),
+                        'total_services': stats.total_services,
+                        'featured_services': stats.featured_services,
+                        'total_projects': stats.total_projects,
+                        'featured_projects': stats.featured_projects,
+                        'active_jobs': stats.active_jobs,
+                        'offices': stats.offices,
+                        'team_members': stats.team_members,
+                        'project_categories': stats.project_categories,
                     },
                     'homepage_specific': {
                         'satisfied_clients': 95,
                         'years_experience': 10,
-                        'certificates_count': Certificate.objects.filter(is_active=True).count(),
+                        'certificates_count': stats.certificates,
                     }
-                }
-                cache.set(cache_key, stats, 3600)  # 1 година
-            
-            return Response({
-                'success': True,
-                'data': stats,
+                },
                 'message': 'Статистика отримана успішно'
             })
             
@@ -498,29 +548,27 @@ class UnifiedContentViewSet(viewsets.ViewSet):
     @action(detail=False, methods=['get'])
     def featured(self, request):
         """Весь featured контент в одному endpoint"""
+        return self.cached_response(self._featured, request)
+    
+    def _featured(self, request):
         try:
-            cache_key = 'unified_featured_content'
-            data = cache.get(cache_key)
-            
-            if not data:
-                data = {
-                    'services': ServiceListSerializer(
-                        Service.objects.filter(is_active=True, is_featured=True)[:6],
-                        many=True,
-                        context={'request': request}
-                    ).data,
-                    'projects': ProjectListSerializer(
-                        Project.objects.filter(is_active=True, is_featured=True)[:6],
-                        many=True,
-                        context={'request': request}
-                    ).data,
-                    'team_members': TeamMemberSerializer(
-                        TeamMember.objects.filter(is_active=True, is_management=True)[:4],
-                        many=True,
-                        context={'request': request}
-                    ).data
-                }
-                cache.set(cache_key, data, 1800)  # 30 хвилин
+            data = {
+                'services': ServiceListSerializer(
+                    Service.objects.filter(is_active=True, is_featured=True)[:6],
+                    many=True,
+                    context={'request': request}
+                ).data,
+                'projects': ProjectListSerializer(
+                    Project.objects.filter(is_active=True, is_featured=True).select_related('category')[:6],
+                    many=True,
+                    context={'request': request}
+                ).data,
+                'team_members': TeamMemberSerializer(
+                    TeamMember.objects.filter(is_active=True, is_management=True).select_related('homepage')[:4],
+                    many=True,
+                    context={'request': request}
+                ).data
+            }
             
             return Response({
                 'success': True,
@@ -6,7 +6,8 @@ from django.utils.decorators import method_decorator
 from django.views.decorators.http import require_http_methods
 from rest_framework.permissions import IsAdminUser
 from rest_framework.decorators import permission_classes
-from .utils import TranslationManager
+from .signals import invalidate_translations_cache
+from .translation_export import BackgroundExport
 import json
 import hashlib
 import hmac
@@ -82,7 +83,7 @@ class TranslationWebhookView(View):
             logger.info(f"Translation webhook triggered by user {request.user} from IP {self._get_client_ip(request)}")
             
             # Очищаємо кеш
-            TranslationManager.invalidate_translations_cache()
+            invalidate_translations_cache()
             
             # Експортуємо нові переклади з безпечним шляхом
             frontend_dir = getattr(settings, 'FRONTEND_TRANSLATIONS_DIR', None)
@@ -92,14 +93,16 @@ class TranslationWebhookView(View):
                     'message': 'Frontend translations directory not configured'
                 }, status=500)
                 
-            TranslationManager.export_to_frontend(str(frontend_dir))
+            # Експорт - у фоні: відповідь не чекає на запис файлів
+            scheduled = BackgroundExport.submit(frontend_dir)
             
-            logger.info("Translation webhook completed successfully")
+            logger.info(f"Translation webhook completed, export scheduled={scheduled}")
             return JsonResponse({
-                'status': 'success', 
-                'message': 'Переклади оновлено',
+                'status': 'accepted', 
+                'message': 'Переклади оновлено, експорт запущено',
+                'export_scheduled': scheduled,
                 'timestamp': str(request.user)
-            })
+            }, status=202)
             
         except Exception as e:
             logger.error(f"Translation webhook error: {str(e)}")
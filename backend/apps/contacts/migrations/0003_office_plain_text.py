@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0002_alter_office_options_office_city_office_city_en_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='office',
+            name='address_text',
+            field=models.TextField(blank=True, editable=False, verbose_name='Адреса (текст)'),
+        ),
+        migrations.AddField(
+            model_name='office',
+            name='address_text_en',
+            field=models.TextField(blank=True, editable=False, null=True, verbose_name='Адреса (текст)'),
+        ),
+        migrations.AddField(
+            model_name='office',
+            name='address_text_uk',
+            field=models.TextField(blank=True, editable=False, null=True, verbose_name='Адреса (текст)'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contacts', '0003_office_plain_text'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contactinquiry',
+            index=models.Index(fields=['-created_at', 'id'], name='contacts_co_created_02fecd_idx'),
+        ),
+    ]
@@ -8,6 +8,8 @@ class Office(models.Model):
     address = RichTextUploadingField(verbose_name=_("Адреса"))
     city = models.CharField(max_length=100, verbose_name=_("Місто"))  # Додано поле city
     description = RichTextUploadingField(blank=True, verbose_name=_("Опис"))
+    # Чистий текст адреси - рахується при збереженні (apps.api.plain_text)
+    address_text = models.TextField(blank=True, editable=False, verbose_name=_("Адреса (текст)"))
     
     office_type = models.CharField(
         max_length=50,
@@ -66,3 +68,6 @@ class ContactInquiry(models.Model):
         ordering = ['-created_at']
         verbose_name = _("Звернення")
         verbose_name_plural = _("Звернення")
+        indexes = [
+            models.Index(fields=['-created_at', 'id']),
+        ]
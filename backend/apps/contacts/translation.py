@@ -2,7 +2,7 @@ from modeltranslation.translator import translator, TranslationOptions
 from .models import Office, ContactInquiry
 
 class OfficeTranslationOptions(TranslationOptions):
-    fields = ('name', 'address', 'city', 'description')  # Додано city
+    fields = ('name', 'address', 'city', 'description', 'address_text')  # Додано city
 
 class ContactInquiryTranslationOptions(TranslationOptions):
     fields = ('name', 'subject', 'message', 'response')
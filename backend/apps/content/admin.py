@@ -7,6 +7,7 @@ from unfold.contrib.filters.admin import (
 )
 from unfold.decorators import display
 from apps.common.admin import UnfoldTabbedTranslationAdmin  
+from apps.api.signals import handle_bulk_update
 from .models import HomePage, AboutPage, TeamMember, Certificate, ProductionPhoto
 
 
@@ -213,16 +214,19 @@ class TeamMemberAdmin(UnfoldTabbedTranslationAdmin):
     @admin.action(description=_("Позначити як активних"))
     def make_active(self, request, queryset):
         count = queryset.update(is_active=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} членів команди позначено як активні.")
     
     @admin.action(description=_("Позначити як неактивних"))
     def make_inactive(self, request, queryset):
         count = queryset.update(is_active=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} членів команди позначено як неактивні.")
     
     @admin.action(description=_("Позначити як керівництво"))
     def mark_as_management(self, request, queryset):
         count = queryset.update(is_management=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} членів команди позначено як керівництво.")
     
     @admin.action(description=_("Додати на головну сторінку"))
@@ -233,6 +237,7 @@ class TeamMemberAdmin(UnfoldTabbedTranslationAdmin):
             active_homepage = HomePage.objects.filter(is_active=True).first()
             if active_homepage:
                 count = queryset.update(homepage=active_homepage)
+                handle_bulk_update(queryset.model)
                 self.message_user(request, f"{count} членів команди додано на головну сторінку.")
             else:
                 self.message_user(request, "Не знайдено активної головної сторінки.", level='ERROR')
@@ -323,6 +328,7 @@ class CertificateAdmin(UnfoldTabbedTranslationAdmin):
             active_homepage = HomePage.objects.filter(is_active=True).first()
             if active_homepage:
                 count = queryset.update(homepage=active_homepage)
+                handle_bulk_update(queryset.model)
                 self.message_user(request, f"{count} сертифікатів додано на головну сторінку.")
             else:
                 self.message_user(request, "Не знайдено активної головної сторінки.", level='ERROR')
@@ -333,6 +339,7 @@ class CertificateAdmin(UnfoldTabbedTranslationAdmin):
     def remove_from_homepage(self, request, queryset):
         """Прибирає вибрані сертифікати з головної сторінки"""
         count = queryset.update(homepage=None)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} сертифікатів прибрано з головної сторінки.")
 
 
@@ -421,21 +428,25 @@ class ProductionPhotoAdmin(UnfoldTabbedTranslationAdmin):
     @admin.action(description=_("Позначити як рекомендовані"))
     def make_featured(self, request, queryset):
         count = queryset.update(is_featured=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} фото позначено як рекомендовані.")
     
     @admin.action(description=_("Прибрати з рекомендованих"))
     def remove_featured(self, request, queryset):
         count = queryset.update(is_featured=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} фото прибрано з рекомендованих.")
     
     @admin.action(description=_("Позначити як активні"))
     def make_active(self, request, queryset):
         count = queryset.update(is_active=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} фото позначено як активні.")
     
     @admin.action(description=_("Позначити як неактивні"))
     def make_inactive(self, request, queryset):
         count = queryset.update(is_active=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} фото позначено як неактивні.")
     
     @admin.action(description=_("Додати на головну сторінку"))
@@ -445,6 +456,7 @@ class ProductionPhotoAdmin(UnfoldTabbedTranslationAdmin):
             active_homepage = HomePage.objects.filter(is_active=True).first()
             if active_homepage:
                 count = queryset.update(homepage=active_homepage)
+                handle_bulk_update(queryset.model)
                 self.message_user(request, f"{count} фото додано на головну сторінку.")
             else:
                 self.message_user(request, "Не знайдено активної головної сторінки.", level='ERROR')
@@ -455,4 +467,5 @@ class ProductionPhotoAdmin(UnfoldTabbedTranslationAdmin):
     def remove_from_homepage(self, request, queryset):
         """Прибирає вибрані фото з головної сторінки"""
         count = queryset.update(homepage=None)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} фото прибрано з головної сторінки.")
\ No newline at end of file
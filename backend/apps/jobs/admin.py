@@ -10,6 +10,7 @@ from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from unfold.decorators import display
 from apps.common.admin import UnfoldTabbedTranslationAdmin  
+from apps.api.signals import handle_bulk_update
 
 
 
@@ -128,21 +129,25 @@ class JobPositionAdmin(UnfoldTabbedTranslationAdmin):
     @admin.action(description=_("Позначити як активні"))
     def make_active(self, request, queryset):
         count = queryset.update(is_active=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} вакансій позначено як активні.")
     
     @admin.action(description=_("Позначити як неактивні"))
     def make_inactive(self, request, queryset):
         count = queryset.update(is_active=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} вакансій позначено як неактивні.")
     
     @admin.action(description=_("Позначити як термінові"))
     def mark_as_urgent(self, request, queryset):
         count = queryset.update(is_urgent=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} вакансій позначено як термінові.")
     
     @admin.action(description=_("Зняти позначку 'Терміново'"))
     def unmark_as_urgent(self, request, queryset):
         count = queryset.update(is_urgent=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"З {count} вакансій знято позначку 'Терміново'.")
 
     def get_queryset(self, request):
@@ -231,11 +236,13 @@ class JobApplicationAdmin(ModelAdmin):
     @admin.action(description=_("Позначити як переглянуті"))
     def mark_reviewed(self, request, queryset):
         count = queryset.update(is_reviewed=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} заявок позначено як переглянуті.")
     
     @admin.action(description=_("Позначити як непереглянуті"))
     def mark_unreviewed(self, request, queryset):
         count = queryset.update(is_reviewed=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} заявок позначено як непереглянуті.")
 
 
@@ -298,9 +305,11 @@ class WorkplacePhotoAdmin(UnfoldTabbedTranslationAdmin):
     @admin.action(description=_("Позначити як активні"))
     def make_active(self, request, queryset):
         count = queryset.update(is_active=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} фото позначено як активні.")
     
     @admin.action(description=_("Позначити як неактивні"))
     def make_inactive(self, request, queryset):
         count = queryset.update(is_active=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} фото позначено як неактивні.")
\ No newline at end of file
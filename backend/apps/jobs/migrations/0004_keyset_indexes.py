@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_jobposition_plain_text'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobapplication',
+            index=models.Index(fields=['-created_at', 'id'], name='jobs_jobapp_created_7d223b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobposition',
+            index=models.Index(fields=['-is_urgent', '-created_at', 'id'], name='jobs_jobpos_is_urge_f743f5_idx'),
+        ),
+    ]
@@ -10,6 +10,10 @@ class JobPosition(models.Model):
     requirements = RichTextUploadingField(verbose_name=_("Вимоги"))
     responsibilities = RichTextUploadingField(verbose_name=_("Обов'язки"))
     benefits = RichTextUploadingField(blank=True, verbose_name=_("Переваги"))
+    # Чистий текст і анонс - рахуються при збереженні (apps.api.plain_text)
+    description_text = models.TextField(blank=True, editable=False, verbose_name=_("Опис (текст)"))
+    requirements_text = models.TextField(blank=True, editable=False, verbose_name=_("Вимоги (текст)"))
+    excerpt = models.CharField(max_length=300, blank=True, editable=False, verbose_name=_("Анонс"))
         
     slug = models.SlugField(unique=True, db_index=True, verbose_name=_("URL"))
     
@@ -38,6 +42,8 @@ class JobPosition(models.Model):
             models.Index(fields=['is_active', '-created_at']),
             models.Index(fields=['is_urgent', '-created_at']),
             models.Index(fields=['employment_type', 'is_active']),
+            # Keyset пагінація за ordering ViewSet-а
+            models.Index(fields=['-is_urgent', '-created_at', 'id']),
         ]
     
     def __str__(self):
@@ -78,6 +84,7 @@ class JobApplication(models.Model):
         indexes = [
             models.Index(fields=['position', '-created_at']),
             models.Index(fields=['is_reviewed', '-created_at']),
+            models.Index(fields=['-created_at', 'id']),
         ]
     
     def __str__(self):
@@ -2,7 +2,8 @@ from modeltranslation.translator import translator, TranslationOptions
 from .models import JobPosition, JobApplication, WorkplacePhoto
 
 class JobPositionTranslationOptions(TranslationOptions):
-    fields = ('title', 'description', 'requirements', 'responsibilities', 'benefits', 'experience_required', 'location')
+    fields = ('title', 'description', 'requirements', 'responsibilities', 'benefits', 'experience_required', 'location',
+              'description_text', 'requirements_text', 'excerpt')
 
 class WorkplacePhotoTranslationOptions(TranslationOptions):
     fields = ('title', 'description')
@@ -14,6 +14,7 @@ from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from unfold.decorators import display
 from apps.common.admin import UnfoldTabbedTranslationAdmin  
+from apps.api.signals import handle_bulk_update
 
 
 @admin.register(PartnershipInfo)
@@ -193,9 +194,11 @@ class PartnerInquiryAdmin(ModelAdmin):
     @admin.action(description=_("Позначити як оброблені"))
     def mark_processed(self, request, queryset):
         count = queryset.update(is_processed=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} запитів позначено як оброблені.")
     
     @admin.action(description=_("Позначити як необроблені"))
     def mark_unprocessed(self, request, queryset):
         count = queryset.update(is_processed=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} запитів позначено як необроблені.")
\ No newline at end of file
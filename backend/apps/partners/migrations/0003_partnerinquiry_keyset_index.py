@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partners', '0002_alter_partnerinquiry_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='partnerinquiry',
+            index=models.Index(fields=['-created_at', 'id'], name='partners_pa_created_0cf040_idx'),
+        ),
+    ]
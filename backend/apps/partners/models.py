@@ -66,4 +66,7 @@ class PartnerInquiry(models.Model):
     class Meta:
         ordering = ['-created_at', 'id']  # Покращено упорядкування
         verbose_name = _("Запит партнера")
-        verbose_name_plural = _("Запити партнерів")
\ No newline at end of file
+        verbose_name_plural = _("Запити партнерів")
+        indexes = [
+            models.Index(fields=['-created_at', 'id']),
+        ]
\ No newline at end of file
@@ -10,6 +10,7 @@ from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from unfold.decorators import display
 from apps.common.admin import UnfoldTabbedTranslationAdmin  
+from apps.api.signals import handle_bulk_update
 
 class ProjectImageInline(TabularInline):
     model = ProjectImage
@@ -92,11 +93,13 @@ class ProjectCategoryAdmin(UnfoldTabbedTranslationAdmin):
     @admin.action(description=_("Позначити як активні"))
     def make_active(self, request, queryset):
         count = queryset.update(is_active=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} категорій позначено як активні.")
     
     @admin.action(description=_("Позначити як неактивні"))
     def make_inactive(self, request, queryset):
         count = queryset.update(is_active=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} категорій позначено як неактивні.")
 
     def get_queryset(self, request):
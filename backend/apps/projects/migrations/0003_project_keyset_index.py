@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-18 06:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0002_project_plain_text'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['is_active', '-project_date', 'id'], name='projects_pr_is_acti_e6ae9e_idx'),
+        ),
+    ]
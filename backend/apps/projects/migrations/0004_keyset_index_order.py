@@ -0,0 +1,37 @@
+# Generated by Django 5.2.4 on 2026-10-18 07:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_project_keyset_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='project',
+            name='projects_pr_is_acti_e6ae9e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(models.F('is_active'), models.OrderBy(models.F('project_date'), descending=True), models.OrderBy(models.F('title_uk')), models.F('id'), name='project_keyset_uk'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(models.F('is_active'), models.OrderBy(models.F('project_date'), descending=True), models.OrderBy(models.F('title_en')), models.F('id'), name='project_keyset_en'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['category', 'is_active', '-project_date', 'id'], name='projects_pr_categor_6a308e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectcategory',
+            index=models.Index(models.F('is_active'), models.F('order'), models.OrderBy(models.F('name_uk')), models.F('id'), name='projectcategory_keyset_uk'),
+        ),
+        migrations.AddIndex(
+            model_name='projectcategory',
+            index=models.Index(models.F('is_active'), models.F('order'), models.OrderBy(models.F('name_en')), models.F('id'), name='projectcategory_keyset_en'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F
 from django.utils.translation import gettext_lazy as _
 from ckeditor_uploader.fields import RichTextUploadingField
 
@@ -16,6 +17,14 @@ class ProjectCategory(models.Model):
         ordering = ['order']
         verbose_name = _("Категорія проєктів")
         verbose_name_plural = _("Категорії проєктів")
+        indexes = [
+            # Keyset пагінація за ordering ViewSet-а (order, name, id) для
+            # кожної мови. Перекладна назва nullable: ASC у PostgreSQL - це
+            # NULLS LAST, тобто саме той порядок, що й у запиті пагінації.
+            # Вирази, бо поля перекладів modeltranslation додає пізніше
+            models.Index(F('is_active'), F('order'), F('name_uk').asc(), F('id'), name='projectcategory_keyset_uk'),
+            models.Index(F('is_active'), F('order'), F('name_en').asc(), F('id'), name='projectcategory_keyset_en'),
+        ]
 
 
 class Project(models.Model):
@@ -26,6 +35,10 @@ class Project(models.Model):
     challenge=RichTextUploadingField(blank=True, verbose_name=_("Завдання"))
     solution=RichTextUploadingField(blank=True, verbose_name=_("Рішення"))
     result=RichTextUploadingField(blank=True, verbose_name=_("Результат"))
+    # Чистий текст і анонс - рахуються при збереженні (apps.api.plain_text)
+    short_description_text = models.TextField(blank=True, editable=False, verbose_name=_("Короткий опис (текст)"))
+    detailed_description_text = models.TextField(blank=True, editable=False, verbose_name=_("Детальний опис (текст)"))
+    excerpt = models.CharField(max_length=300, blank=True, editable=False, verbose_name=_("Анонс"))
     
     category = models.ForeignKey(ProjectCategory, on_delete=models.CASCADE, related_name='projects', verbose_name=_("Категорія"))
     slug = models.SlugField(unique=True, verbose_name=_("Слаг"))
@@ -44,6 +57,22 @@ class Project(models.Model):
         ordering = ['-project_date']
         verbose_name = _("Проєкт")
         verbose_name_plural = _("Проєкти")
+        indexes = [
+            # Keyset пагінація за ordering ViewSet-а (-project_date, title, id)
+            # для кожної мови. Перекладна назва nullable: ASC у PostgreSQL -
+            # це NULLS LAST, тобто саме той порядок, що й у запиті пагінації.
+            # Вирази, бо поля перекладів modeltranslation додає пізніше
+            models.Index(
+                F('is_active'), F('project_date').desc(), F('title_uk').asc(), F('id'),
+                name='project_keyset_uk',
+            ),
+            models.Index(
+                F('is_active'), F('project_date').desc(), F('title_en').asc(), F('id'),
+                name='project_keyset_en',
+            ),
+            # Дія projects категорії: (-project_date, id) у межах категорії
+            models.Index(fields=['category', 'is_active', '-project_date', 'id']),
+        ]
 
 
 class ProjectImage(models.Model):
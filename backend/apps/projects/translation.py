@@ -5,7 +5,8 @@ class ProjectCategoryTranslationOptions(TranslationOptions):
     fields = ('name', 'description')
 
 class ProjectTranslationOptions(TranslationOptions):
-    fields = ('title', 'short_description', 'detailed_description', 'challenge', 'solution', 'result')
+    fields = ('title', 'short_description', 'detailed_description', 'challenge', 'solution', 'result',
+              'short_description_text', 'detailed_description_text', 'excerpt')
 
 
 translator.register(ProjectCategory, ProjectCategoryTranslationOptions)
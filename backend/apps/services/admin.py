@@ -10,6 +10,7 @@ from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 from unfold.decorators import display
 from apps.common.admin import UnfoldTabbedTranslationAdmin  
+from apps.api.signals import handle_bulk_update
 
 
 class ServiceFeatureInline(TabularInline):
@@ -114,21 +115,25 @@ class ServiceAdmin(UnfoldTabbedTranslationAdmin):
     @admin.action(description=_("Позначити як активні"))
     def make_active(self, request, queryset):
         count = queryset.update(is_active=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} послуг позначено як активні.")
     
     @admin.action(description=_("Позначити як неактивні"))
     def make_inactive(self, request, queryset):
         count = queryset.update(is_active=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} послуг позначено як неактивні.")
     
     @admin.action(description=_("Позначити як рекомендовані"))
     def mark_as_featured(self, request, queryset):
         count = queryset.update(is_featured=True)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"{count} послуг позначено як рекомендовані.")
     
     @admin.action(description=_("Зняти рекомендацію"))
     def unmark_as_featured(self, request, queryset):
         count = queryset.update(is_featured=False)
+        handle_bulk_update(queryset.model)
         self.message_user(request, f"З {count} послуг знято рекомендацію.")
 
     def get_queryset(self, request):
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.4 on 2026-10-18 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0002_alter_service_options_alter_servicefeature_options_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='short_description_text',
+            field=models.TextField(blank=True, editable=False, verbose_name='Короткий опис (текст)'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='short_description_text_en',
+            field=models.TextField(blank=True, editable=False, null=True, verbose_name='Короткий опис (текст)'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='short_description_text_uk',
+            field=models.TextField(blank=True, editable=False, null=True, verbose_name='Короткий опис (текст)'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='detailed_description_text',
+            field=models.TextField(blank=True, editable=False, verbose_name='Детальний опис (текст)'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='detailed_description_text_en',
+            field=models.TextField(blank=True, editable=False, null=True, verbose_name='Детальний опис (текст)'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='detailed_description_text_uk',
+            field=models.TextField(blank=True, editable=False, null=True, verbose_name='Детальний опис (текст)'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=300, verbose_name='Анонс'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='excerpt_en',
+            field=models.CharField(blank=True, editable=False, max_length=300, null=True, verbose_name='Анонс'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='excerpt_uk',
+            field=models.CharField(blank=True, editable=False, max_length=300, null=True, verbose_name='Анонс'),
+        ),
+    ]
@@ -9,6 +9,10 @@ class Service(models.Model):
     short_description = RichTextUploadingField(verbose_name=_("Короткий опис"))
     detailed_description = RichTextUploadingField(verbose_name=_("Детальний опис"))
     benefits = RichTextUploadingField(blank=True, verbose_name=_("Переваги"))
+    # Чистий текст і анонс - рахуються при збереженні (apps.api.plain_text)
+    short_description_text = models.TextField(blank=True, editable=False, verbose_name=_("Короткий опис (текст)"))
+    detailed_description_text = models.TextField(blank=True, editable=False, verbose_name=_("Детальний опис (текст)"))
+    excerpt = models.CharField(max_length=300, blank=True, editable=False, verbose_name=_("Анонс"))
     
     slug = models.SlugField(unique=True, db_index=True, verbose_name=_("Слаг"))
     icon = models.ImageField(
@@ -2,7 +2,8 @@ from modeltranslation.translator import translator, TranslationOptions
 from .models import Service, ServiceFeature
 
 class ServiceTranslationOptions(TranslationOptions):
-    fields = ('name', 'short_description', 'detailed_description', 'benefits')
+    fields = ('name', 'short_description', 'detailed_description', 'benefits',
+              'short_description_text', 'detailed_description_text', 'excerpt')
 
 class ServiceFeatureTranslationOptions(TranslationOptions):
     fields = ('title', 'description')
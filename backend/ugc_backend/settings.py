@@ -98,6 +98,7 @@ TEMPLATES = [
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
                 'django.template.context_processors.i18n',  # Для i18n
+                'apps.api.utils.translations.translations_context',  # Лінивий доступ до перекладів
             ],
         },
     },
@@ -268,6 +269,52 @@ TRANSLATION_CACHE_SETTINGS = {
     'MAX_CACHE_SIZE': 10000,            # Максимальний розмір кешу
     'ENABLE_COMPRESSION': True,         # Стиснення великих перекладів
     'VERSION_TIMEOUT': 60 * 60 * 24,    # 24 години для версій
+    'L1_MAX_ENTRIES': 32,               # Декодовані бандли в пам'яті воркера
+    'L1_VERSION_POLL_MS': 1000,         # Як часто воркер перевіряє версію в Redis
+    'CHANGELOG_MAX_ENTRIES': 50,        # Записів журналу змін для ?since= (старіші - повний бандл)
+    'CHANGELOG_TIMEOUT': 60 * 60 * 24 * 7,
+    # Додаткові моделі, поля яких не віддаються як переклади
+    # (приватні моделі виключає dynamic_translations.PRIVATE_MODELS)
+    'DYNAMIC_EXCLUDE_MODELS': [],
+    'SEARCH_PAGE_SIZE': 20,             # Результатів пошуку перекладів на сторінку
+    'SEARCH_MAX_PAGE_SIZE': 100,
+}
+
+# Кеш відрендерених відповідей API (ResponseCacheMixin)
+RESPONSE_CACHE_SETTINGS = {
+    'ENABLED': True,
+    'TIMEOUT': 60 * 15,                 # 15 хвилин, інвалідація - через покоління моделей
+}
+
+# Інвалідація кешу після commit (apps/api/invalidation.py)
+CACHE_INVALIDATION_SETTINGS = {
+    'ENABLE_AUTO_INVALIDATION': False,  # Інвалідувати покоління моделей з MODELS_TO_WATCH
+    'MODELS_TO_WATCH': [],              # 'app_label.model_name'
+    'ASYNC_REBUILD': True,              # Перебудова перекладів у фоновому потоці
+    'REBUILD_DELAY': 2.0,               # Дебаунс перебудови, секунди
+}
+
+# Метрики кешу по сімействах CacheRegistry (/api/v1/cache/, /metrics/)
+CACHE_METRICS_SETTINGS = {
+    'ENABLED': True,
+    'FLUSH_INTERVAL': 10,               # Як часто воркер зливає лічильники в Redis, секунди
+}
+
+# Прогрів кешу (manage.py warm_cache)
+CACHE_WARMUP_SETTINGS = {
+    'ON_MIGRATE': config('CACHE_WARMUP_ON_MIGRATE', default=False, cast=bool),  # Прогрів після migrate (деплой)
+    'HOST': config('CACHE_WARMUP_HOST', default=''),  # Host клієнтів API, входить у ключ кешу
+    'SECURE': config('CACHE_WARMUP_SECURE', default=False, cast=bool),
+    'MAX_WORKERS': 4,
+    'MAX_DETAILS': 100,                 # Детальних сторінок на ViewSet
+    'MAX_PAGES': 1,                     # Сторінок пагінації на список
+}
+
+# Лічильники статистики сайту (apps/api/site_stats.py)
+SITE_STATS_SETTINGS = {
+    # Страховка від масових змін без сигналів: статистика, звірена давніше
+    # за інтервал, перераховується при читанні (секунди, 0 - вимкнено)
+    'RECONCILE_INTERVAL': 60 * 60,
 }
 
 # ========== НАЛАШТУВАННЯ СТАТИЧНИХ ПЕРЕКЛАДІВ ==========
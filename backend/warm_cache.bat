@@ -0,0 +1,2 @@
+python manage.py warm_cache
+pause
\ No newline at end of file